@@ -88,6 +88,8 @@ def verify_imports() -> bool:
         ("PIL", "Pillow"),
         ("ebooklib", "ebooklib"),
         ("bs4", "beautifulsoup4"),
+        ("lxml", "lxml"),
+        ("soupsieve", "soupsieve"),
         ("cloudscraper", "cloudscraper"),
         ("pikepdf", "pikepdf"),
         ("yaml", "pyyaml"),
@@ -115,9 +115,9 @@ def install_dependencies() -> bool:
 def verify_imports() -> bool:
     print("\n=== Verifying imports ===")
     modules = [
-        "img2pdf", "PIL", "ebooklib", "bs4", "cloudscraper", "pikepdf",
-        "yaml", "PySide6", "certifi", "requests", "rich", "playwright",
-        "playwright_stealth",
+        "img2pdf", "PIL", "ebooklib", "bs4", "lxml", "soupsieve",
+        "cloudscraper", "pikepdf", "yaml", "PySide6", "certifi", "requests",
+        "rich", "playwright", "playwright_stealth",
     ]
     missing = []
     for mod in modules:
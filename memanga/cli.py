@@ -30,6 +30,7 @@ from .cron import build_cron_line
 from .state import State
 from .downloader import check_for_updates, download_chapter, get_supported_sources, DownloaderError, ChapterWithSource, restart_browsers, _find_chapter_on_backup, _get_sources_from_manga
 from .scrapers import get_scraper
+from .scrapers.base import enable_html_disk_cache
 from .search import compute_search_sources, probe_chapter_counts, sweep
 from .emailer import send_to_kindle, EmailError
 
@@ -1904,6 +1905,9 @@ Examples:
     
     args = parser.parse_args()
 
+    # Keep chapter-list validators across runs so update checks get 304s
+    enable_html_disk_cache(config.config_dir / "http-cache")
+
     if args.gui:
         if _cli_only:
             sys.stderr.write(
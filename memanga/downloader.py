@@ -18,6 +18,7 @@ import time
 import atexit
 import subprocess
 import tempfile
+import threading
 import shutil
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -65,6 +66,42 @@ DEFAULT_FALLBACK_DELAY_DAYS = 2
 # How long a post-processing command may run before it's killed (seconds).
 POST_PROCESSING_TIMEOUT = 600
 
+# Concurrent page fetches per chapter, for both the first pass and the
+# retry pass in download_chapter. Scrapers can override it through their
+# ``page_workers`` attribute.
+_PAGE_WORKERS = 4
+
+# Image fetches in flight per host, shared by every chapter being
+# downloaded. The GUI runs several chapters at once, and each one's pool
+# alone would otherwise multiply the fan-out at a single CDN.
+_host_slots: Dict[str, Tuple[threading.Semaphore, int]] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_slot(url: str, limit: int) -> threading.Semaphore:
+    """Return the semaphore capping concurrent fetches to ``url``'s host.
+
+    There is one cap per host, however many scrapers share it. It holds
+    the widest ``limit`` (a scraper's ``page_workers``) seen for the host
+    so far, so a narrow scraper reaching a CDN first never throttles a
+    wider one, and mixing widths never adds up past the widest.
+    """
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        slot, ceiling = _host_slots.get(host, (None, 0))
+        if slot is None:
+            slot = threading.Semaphore(limit)
+        elif limit > ceiling:
+            slot.release(limit - ceiling)
+        _host_slots[host] = (slot, max(limit, ceiling))
+    return slot
+
+
+def _fetch_page(scraper, url: str, path: Path, limit: int) -> bool:
+    """``scraper.download_image`` under the per-host concurrency cap."""
+    with _host_slot(url, limit):
+        return scraper.download_image(url, path)
+
 
 class DownloaderError(Exception):
     """Base exception for downloader errors.
@@ -243,28 +280,39 @@ def check_for_updates(
     # chapter as Read or Download without re-scraping.
     primary_all: List[ChapterWithSource] = []
 
+    # Every source is checked, so their chapter lists are fetched at once;
+    # a manga with backups waits for its slowest source, not their sum.
+    def _fetch_chapters(src):
+        try:
+            return get_scraper(src["source"]).get_chapters(src["url"]), None
+        except Exception as e:
+            return None, e
+
+    if len(sources) > 1:
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            fetched = list(pool.map(_fetch_chapters, sources))
+    else:
+        fetched = [_fetch_chapters(sources[0])]
+
     # Check each source
     source_errors = []
     sources_checked = 0
-    for i, src in enumerate(sources):
+    for i, (src, (all_chapters, error)) in enumerate(zip(sources, fetched)):
         source = src["source"]
         url = src["url"]
         is_primary = (i == 0)
 
-        try:
-            scraper = get_scraper(source)
-            all_chapters = scraper.get_chapters(url)
-            sources_checked += 1
-        except ValueError as e:
+        if isinstance(error, ValueError):
             # Unsupported source - skip but warn
-            source_errors.append(f"{source}: {e}")
-            print(f"  [Warning] Unsupported source '{source}': {e}")
+            source_errors.append(f"{source}: {error}")
+            print(f"  [Warning] Unsupported source '{source}': {error}")
             continue
-        except Exception as e:
+        if error is not None:
             # Failed to fetch - skip but warn
-            source_errors.append(f"{source}: {e}")
-            print(f"  [Warning] Failed to fetch from {source}: {e}")
+            source_errors.append(f"{source}: {error}")
+            print(f"  [Warning] Failed to fetch from {source}: {error}")
             continue
+        sources_checked += 1
 
         # Capture the full chapter list from the primary source for the
         # Detail-page cache. Backup sources are intentionally skipped here —
@@ -578,36 +626,37 @@ def download_chapter(
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Get page URLs
-        try:
-            page_urls = scraper.get_pages(chapter.url)
-        except Exception as e:
-            raise DownloaderError(f"Failed to get pages: {e}")
-
-        _check_cancel()
-
-        if not page_urls:
-            raise DownloaderError("No pages found for chapter")
-
-        # Download images concurrently
-        download_tasks = []
-        for i, url in enumerate(page_urls):
-            ext = _get_extension(url)
-            img_path = temp_path / f"page_{i:03d}{ext}"
-            download_tasks.append((i, url, img_path))
+        # Scrapers that discover pages incrementally expose iter_pages();
+        # each page is queued for download as soon as it is found instead
+        # of after the whole list is in. Plain get_pages() otherwise.
+        iter_pages = getattr(scraper, "iter_pages", None)
 
         results: Dict[int, Path] = {}
-        total_pages = len(download_tasks)
+        download_tasks = []
         completed_count = 0
+        page_workers = getattr(scraper, "page_workers", None) or _PAGE_WORKERS
         # Manually manage the pool so we can `cancel_futures=True` and bail
         # without waiting for in-flight image fetches when the user cancels.
-        executor = ThreadPoolExecutor(max_workers=4)
+        executor = ThreadPoolExecutor(max_workers=page_workers)
         cancelled = False
         try:
-            futures = {
-                executor.submit(scraper.download_image, url, img_path): (idx, url, img_path)
-                for idx, url, img_path in download_tasks
-            }
+            futures = {}
+            try:
+                pages = iter_pages(chapter.url) if iter_pages else scraper.get_pages(chapter.url)
+                for i, url in enumerate(pages):
+                    ext = _get_extension(url)
+                    img_path = temp_path / f"page_{i:03d}{ext}"
+                    download_tasks.append((i, url, img_path))
+                    futures[executor.submit(_fetch_page, scraper, url, img_path, page_workers)] = (i, url, img_path)
+            except Exception as e:
+                raise DownloaderError(f"Failed to get pages: {e}")
+
+            _check_cancel()
+
+            if not download_tasks:
+                raise DownloaderError("No pages found for chapter")
+
+            total_pages = len(download_tasks)
             for future in as_completed(futures):
                 idx, url, img_path = futures[future]
                 try:
@@ -650,13 +699,30 @@ def download_chapter(
                     f"attempt {attempt}/{max_retries}..."
                 )
                 time.sleep(2 ** (attempt - 1))
-                for idx, url, img_path in failed:
-                    _check_cancel()
-                    try:
-                        if scraper.download_image(url, img_path):
-                            results[idx] = img_path
-                    except Exception:
-                        pass
+                _check_cancel()
+                # Same pool width as the first pass — retrying a dozen
+                # pages one at a time used to add a full round trip per
+                # page on top of the back-off sleep.
+                retry_executor = ThreadPoolExecutor(max_workers=page_workers)
+                try:
+                    retry_futures = {
+                        retry_executor.submit(_fetch_page, scraper, url, img_path, page_workers): (idx, img_path)
+                        for idx, url, img_path in failed
+                    }
+                    for future in as_completed(retry_futures):
+                        idx, img_path = retry_futures[future]
+                        try:
+                            if future.result():
+                                results[idx] = img_path
+                        except Exception:
+                            pass
+                        if cancel_event is not None and cancel_event.is_set():
+                            cancelled = True
+                            break
+                finally:
+                    retry_executor.shutdown(wait=False, cancel_futures=True)
+                if cancelled:
+                    raise InterruptedError("Download cancelled")
 
         still_failed = [idx for idx, _, _ in download_tasks if idx not in results]
         if still_failed:
@@ -675,7 +741,7 @@ def download_chapter(
             )
             if not partial_ok:
                 raise DownloaderError(
-                    f"Incomplete download: {len(still_failed)}/{len(page_urls)} "
+                    f"Incomplete download: {len(still_failed)}/{total_pages} "
                     f"pages failed (pages {failed_page_nums})",
                     failed_pages=failed_page_nums,
                     total_pages=total_pages,
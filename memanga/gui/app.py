@@ -11,6 +11,7 @@ from PySide6.QtGui import QShortcut, QKeySequence
 from .. import __version__
 from ..config import Config
 from ..state import State
+from ..scrapers.base import enable_html_disk_cache
 from .events import EventBus
 from .workers import BackgroundWorker
 from .cache import CoverCache
@@ -30,6 +31,7 @@ class MeMangaApp(QMainWindow):
         # Shared state
         self.config = Config()
         self.app_state = State()
+        enable_html_disk_cache(self.config.config_dir / "http-cache")
         self._seed_default_sources_if_first_launch()
         self.events = EventBus()
         self.worker = BackgroundWorker(self.events)
@@ -3,19 +3,259 @@ Base scraper class and data models
 """
 
 import re
+import html
+import json
+import os
 import time
+import hashlib
+import tempfile
 import logging
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool sizes for scraper sessions. Pages download several at a
+# time from one CDN host, and requests' default of 10 connections per host
+# (with surplus sockets thrown away after each burst) forces fresh TLS
+# handshakes mid-chapter.
+_POOL_CONNECTIONS = 16  # distinct hosts kept pooled
+_POOL_MAXSIZE = 32  # connections kept alive per host
+
+# Recent HTML responses that can be revalidated (ETag / Last-Modified) or
+# reused outright (Cache-Control: max-age). Module-level because
+# get_scraper() hands out a fresh scraper per operation — a per-instance
+# cache would never see the second request for a chapter list.
+_HTML_CACHE_SIZE = 64
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# <a ... href="..."> ... </a> in raw HTML, for _links_containing. The
+# lookbehind keeps data-href and the like from passing for the real href.
+_ANCHOR_RE = re.compile(r'<a\s[^>]*?(?<![\w-])href\s*=\s*(["\'])(.*?)\1[^>]*>(.*?)</a\s*>', re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+# <img ...> tags in raw HTML and their src / data-src attributes (quoted or
+# bare), for _img_sources
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.I)
+_IMG_SRC_ATTR_RE = re.compile(
+    r"""\s(src|data-src)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I)
+_CHAPTER_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
 
-def _retry(func, max_attempts=3, base_delay=1.0, exceptions=(Exception,)):
+
+@dataclass
+class _CachedPage:
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float  # time.monotonic() deadline; 0 = always revalidate
+
+
+_html_cache: "OrderedDict[Tuple[type, str], _CachedPage]" = OrderedDict()
+_html_cache_lock = threading.Lock()
+
+# Last parse result per cached page (see BaseScraper._parse_once), so a
+# 304 or max-age hit on a chapter list skips re-parsing the same HTML too.
+# Keyed and bounded like _html_cache, and guarded by the same lock.
+_parsed_cache: "OrderedDict[Tuple[type, str], Tuple[str, list]]" = OrderedDict()
+
+
+def _cache_entry(response, min_ttl: float = 0) -> Optional[_CachedPage]:
+    """Build a cache entry for ``response``, or None if it isn't cacheable.
+
+    ``min_ttl`` keeps the body fresh for at least that many seconds even
+    without validators or max-age, unless the server says no-cache/no-store.
+    """
+    headers = getattr(response, "headers", None) or {}
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    max_age = 0
+    if "no-cache" not in cache_control:
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            max_age = int(match.group(1))
+        max_age = max(max_age, min_ttl)
+    if not (etag or last_modified or max_age):
+        return None
+    return _CachedPage(
+        text=response.text,
+        etag=etag,
+        last_modified=last_modified,
+        fresh_until=time.monotonic() + max_age if max_age else 0.0,
+    )
+
+
+def _tune_pool(session: requests.Session) -> requests.Session:
+    """Enlarge the keep-alive pool of every adapter mounted on ``session``.
+
+    Pools are resized in place rather than by mounting a fresh adapter, so
+    custom adapters (cloudscraper's cipher-suite one) keep their TLS setup.
+    """
+    for adapter in set(getattr(session, "adapters", {}).values()):
+        # Already tuned (a shared session handed to a new instance): keep
+        # the pool and its live connections instead of rebuilding it.
+        if (isinstance(adapter, HTTPAdapter)
+                and getattr(adapter, "_pool_maxsize", None) != _POOL_MAXSIZE):
+            adapter.init_poolmanager(_POOL_CONNECTIONS, _POOL_MAXSIZE)
+    return session
+
+
+# Image CDN sessions, one per scraper class. The downloader builds a new
+# scraper for every chapter, so a per-instance session would redo the TCP
+# and TLS handshakes to the CDN each time; this one keeps them alive.
+_image_sessions: Dict[type, requests.Session] = {}
+_image_sessions_lock = threading.Lock()
+
+# Page sessions, one per scraper class, for the same reason: chapter
+# checks and downloads reuse the site's keep-alive connections. Kept per
+# class, not process-wide, since scrapers set their own headers/cookies.
+_page_sessions: Dict[type, requests.Session] = {}
+_page_sessions_lock = threading.Lock()
+
+
+def _page_session(cls: type) -> requests.Session:
+    """Return the page session shared by every instance of ``cls``."""
+    with _page_sessions_lock:
+        session = _page_sessions.get(cls)
+        if session is None:
+            session = _page_sessions[cls] = requests.Session()
+    return session
+
+
+def xpath_has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS ``.name`` class selector."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def xpath_img_sources(images: str = "//img") -> str:
+    """XPath selecting each image's ``src``, or ``data-src`` when src is empty.
+
+    The XPath form of ``img.get("src") or img.get("data-src")``, yielding
+    attribute values in document order without visiting the elements from
+    Python. ``images`` is any expression selecting the <img> elements.
+    """
+    return f'({images})[@src != ""]/@src | ({images})[not(@src != "")]/@data-src'
+
+
+def clear_html_cache():
+    """Drop every cached HTML response (used by tests)."""
+    with _html_cache_lock:
+        _html_cache.clear()
+        _parsed_cache.clear()
+
+
+# Optional on-disk tier under the config dir, so validators survive across
+# runs and a daily update check can get 304s for unchanged chapter lists.
+# Off until the app calls enable_html_disk_cache() (tests never do).
+_html_disk_dir: Optional[Path] = None
+_HTML_DISK_MAX_AGE = 30 * 24 * 3600  # prune entries untouched this long
+
+
+def enable_html_disk_cache(directory: Optional[Path]):
+    """Persist revalidatable HTML responses under ``directory`` (None disables)."""
+    global _html_disk_dir
+    if directory is None:
+        _html_disk_dir = None
+        return
+    directory = Path(directory)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        cutoff = time.time() - _HTML_DISK_MAX_AGE
+        for old in directory.glob("*.json"):
+            if old.stat().st_mtime < cutoff:
+                old.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"HTML disk cache unavailable at {directory}: {e}")
+        return
+    _html_disk_dir = directory
+
+
+def _disk_path(key: Tuple[type, str]) -> Optional[Path]:
+    if _html_disk_dir is None:
+        return None
+    cls, url = key
+    digest = hashlib.sha1(f"{cls.__module__}.{cls.__qualname__}\n{url}".encode()).hexdigest()
+    return _html_disk_dir / f"{digest}.json"
+
+
+def _disk_load(key: Tuple[type, str]) -> Optional[_CachedPage]:
+    """Load a persisted entry; it always needs revalidating before use."""
+    path = _disk_path(key)
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("url") != key[1]:
+        return None
+    return _CachedPage(
+        text=data["text"],
+        etag=data.get("etag"),
+        last_modified=data.get("last_modified"),
+        fresh_until=0.0,
+    )
+
+
+def _disk_store(key: Tuple[type, str], entry: Optional[_CachedPage]):
+    """Persist ``entry`` (or drop the stale file when it's None)."""
+    path = _disk_path(key)
+    if path is None:
+        return
+    try:
+        if entry is None or not (entry.etag or entry.last_modified):
+            path.unlink(missing_ok=True)
+            return
+        payload = json.dumps({
+            "url": key[1],
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "text": entry.text,
+        })
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Failed to persist cached HTML for {key[1]}: {e}")
+
+
+# Statuses whose Retry-After header says when to come back, and the
+# longest such wait honoured before retrying
+_RETRY_AFTER_STATUSES = (429, 503)
+_MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after(error) -> Optional[float]:
+    """Seconds a 429/503 response asked us to wait, or None."""
+    response = getattr(error, "response", None)
+    if response is None or response.status_code not in _RETRY_AFTER_STATUSES:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
+def _retry(func, max_attempts=3, base_delay=1.0, exceptions=(Exception,), retry_delay=None):
     """Retry an operation with exponential backoff.
 
     Args:
@@ -23,6 +263,8 @@ def _retry(func, max_attempts=3, base_delay=1.0, exceptions=(Exception,)):
         max_attempts: Maximum number of attempts
         base_delay: Base delay in seconds (doubles each attempt)
         exceptions: Tuple of exception types to catch and retry
+        retry_delay: Optional ``fn(error) -> seconds or None``; a longer
+            wait it returns (e.g. a server's Retry-After) replaces the backoff
 
     Returns:
         Result of func()
@@ -35,6 +277,9 @@ def _retry(func, max_attempts=3, base_delay=1.0, exceptions=(Exception,)):
             last_error = e
             if attempt < max_attempts:
                 delay = base_delay * (2 ** (attempt - 1))
+                hinted = retry_delay(e) if retry_delay else None
+                if hinted is not None:
+                    delay = max(delay, hinted)
                 logger.debug(f"Attempt {attempt}/{max_attempts} failed: {e}. Retrying in {delay}s...")
                 time.sleep(delay)
     raise last_error
@@ -55,14 +300,19 @@ class Chapter:
     @property
     def numeric(self) -> float:
         """Get numeric chapter number."""
+        # sorted(chapters) reads this twice per comparison, so the parse is
+        # memoised against the number it was computed from
+        cached = self.__dict__.get("_numeric")
+        if cached is not None and cached[0] == self.number:
+            return cached[1]
         try:
-            return float(self.number)
+            value = float(self.number)
         except ValueError:
             # Extract number from string like "Chapter 10" or "10.5"
-            match = re.search(r'(\d+\.?\d*)', self.number)
-            if match:
-                return float(match.group(1))
-            return 0.0
+            match = _CHAPTER_NUMBER_RE.search(self.number)
+            value = float(match.group(1)) if match else 0.0
+        self.__dict__["_numeric"] = (self.number, value)
+        return value
 
 
 @dataclass
@@ -80,9 +330,19 @@ class BaseScraper(ABC):
 
     name: str = "base"
     base_url: str = ""
+    # Pages download_chapter fetches at once for this source; None uses the
+    # downloader's default. Raise it for CDNs that tolerate wider fan-out.
+    page_workers: Optional[int] = None
+    # Seconds _get_html serves a cached page without asking the server,
+    # for sites that send no validators or max-age; 0 follows the headers
+    html_cache_ttl: float = 0
+    # Headers image_session sends on top of the page session's (a Referer
+    # set in __init__ carries over), set once when the shared session is
+    # built instead of on every download
+    image_headers: Dict[str, str] = {}
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _page_session(type(self))
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -92,6 +352,30 @@ class BaseScraper(ABC):
         self._rate_limit = 1.0  # Seconds between requests
         self._rate_lock = threading.Lock()
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by every request this scraper makes."""
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session):
+        # Subclasses swap in cloudscraper or bare sessions after __init__;
+        # route every assignment through the pool tuning.
+        self._session = _tune_pool(session)
+
+    @property
+    def image_session(self) -> requests.Session:
+        """Keep-alive session for page images, shared across instances of this class."""
+        cls = type(self)
+        with _image_sessions_lock:
+            session = _image_sessions.get(cls)
+            if session is None:
+                session = _tune_pool(requests.Session())
+                session.headers.update(self.session.headers)
+                session.headers.update(self.image_headers)
+                _image_sessions[cls] = session
+        return session
+
     def _request(self, url: str, **kwargs) -> requests.Response:
         """Make a rate-limited request with retry."""
         def _do_request():
@@ -111,16 +395,204 @@ class BaseScraper(ABC):
             max_attempts=3,
             base_delay=1.0,
             exceptions=(requests.RequestException,),
+            retry_delay=_retry_after,
         )
 
     def _get_html(self, url: str) -> str:
-        """Fetch HTML content from URL."""
-        return self._request(url).text
+        """Fetch HTML content from URL.
+
+        Responses carrying an ETag/Last-Modified validator are kept in a
+        small shared cache; the next fetch of the same URL is sent as a
+        conditional request and a ``304 Not Modified`` reuses the cached
+        body. Within a ``Cache-Control: max-age`` window the network is
+        skipped entirely. With enable_html_disk_cache() the validators and
+        bodies also persist across runs.
+        """
+        key = (type(self), url)
+        with _html_cache_lock:
+            cached = _html_cache.get(key)
+            if cached is not None:
+                _html_cache.move_to_end(key)
+        if cached is None:
+            cached = _disk_load(key)
+        if cached is not None and time.monotonic() < cached.fresh_until:
+            return cached.text
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = self._request(url, headers=headers) if headers else self._request(url)
+
+        if response.status_code == 304 and cached is not None:
+            with _html_cache_lock:
+                _html_cache.setdefault(key, cached)
+            return cached.text
+
+        entry = _cache_entry(response, self.html_cache_ttl)
+        _disk_store(key, entry)
+        with _html_cache_lock:
+            if entry is None:
+                _html_cache.pop(key, None)
+            else:
+                _html_cache[key] = entry
+                _html_cache.move_to_end(key)
+                while len(_html_cache) > _HTML_CACHE_SIZE:
+                    _html_cache.popitem(last=False)
+        return response.text
+
+    def _parse_once(self, url: str, page_html: str, parse) -> list:
+        """
+        Return ``parse(page_html)``, reusing the last result for ``url``.
+
+        The previous result is returned as long as the HTML is the same
+        text, which is what _get_html hands back on a cache hit or 304.
+
+        Args:
+            url: URL the HTML was fetched from (the cache key)
+            page_html: HTML returned by _get_html
+            parse: Callable turning the HTML into a list
+
+        Returns:
+            A new list; the cached one is never handed out
+        """
+        key = (type(self), url)
+        with _html_cache_lock:
+            hit = _parsed_cache.get(key)
+            if hit is not None and hit[0] == page_html:
+                _parsed_cache.move_to_end(key)
+                return list(hit[1])
+        result = parse(page_html)
+        with _html_cache_lock:
+            _parsed_cache[key] = (page_html, result)
+            _parsed_cache.move_to_end(key)
+            while len(_parsed_cache) > _HTML_CACHE_SIZE:
+                _parsed_cache.popitem(last=False)
+        return list(result)
 
     def _get_json(self, url: str, **kwargs) -> dict:
         """Fetch JSON from URL."""
         return self._request(url, **kwargs).json()
 
+    def _make_absolute(self, url: str) -> str:
+        """Convert a relative or protocol-relative URL to absolute.
+
+        Called once per link on long chapter and page lists, so it checks
+        slices instead of calling ``startswith``/``urljoin``.
+        """
+        if not url or url[:4] == "http":
+            return url
+        if url[:2] == "//":
+            return "https:" + url
+        if url[:1] == "/":
+            return self.base_url + url
+        return self.base_url + "/" + url
+
+    @staticmethod
+    def _html_tree(page_html: str):
+        """
+        Parse HTML into an lxml tree for precompiled XPath lookups.
+
+        Skips the bs4 layer (CSS selector parsing, a Python Tag wrapper per
+        node) for scrapers that only read attributes and text. Returns None
+        for an empty document, which lxml refuses to parse.
+        """
+        if not page_html or not page_html.strip():
+            return None
+        from lxml import html as lxml_html
+        return lxml_html.fromstring(page_html)
+
+    @staticmethod
+    def _text_of(element) -> str:
+        """Text of an lxml element as bs4's ``get_text(strip=True)`` gives it."""
+        return "".join(part.strip() for part in element.itertext())
+
+    @staticmethod
+    def _links_containing(page_html: str, needle: str) -> List[Tuple[str, str]]:
+        """
+        Get ``(href, text)`` for every ``<a>`` whose href contains ``needle``.
+
+        Chapter lists can run to thousands of nodes, so anchors are pulled
+        from the raw HTML with one regex pass instead of building a DOM.
+        BeautifulSoup is only used when that finds nothing (e.g. unquoted
+        attributes). Text matches ``get_text(strip=True)``.
+        """
+        links = []
+        for m in _ANCHOR_RE.finditer(page_html):
+            href = html.unescape(m.group(2))
+            if needle in href:
+                text = "".join(part.strip() for part in _TAG_RE.split(m.group(3)))
+                links.append((href, html.unescape(text)))
+        if links:
+            return links
+
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(page_html, "lxml")
+        return [
+            (a.get("href", ""), a.get_text(strip=True))
+            for a in soup.select(f'a[href*="{needle}"]')
+        ]
+
+    @staticmethod
+    def _img_sources(page_html: str) -> List[Tuple[str, str]]:
+        """
+        Get ``(src, data-src)`` for every ``<img>``, in document order.
+
+        Reader pages only need these two attributes, so they are pulled from
+        the raw HTML with regexes instead of building a DOM. A missing
+        attribute is ``""``; values are entity-decoded like bs4's.
+        """
+        images = []
+        for tag in _IMG_TAG_RE.finditer(page_html):
+            src = data_src = ""
+            for name, double, single, bare in _IMG_SRC_ATTR_RE.findall(tag.group(0)):
+                value = html.unescape(double or single or bare)
+                if name.lower() == "src":
+                    src = src or value
+                else:
+                    data_src = data_src or value
+            images.append((src, data_src))
+        return images
+
+    @staticmethod
+    def _iter_elements(response, tag: str, encoding: Optional[str] = None, chunk_size: int = 16 * 1024):
+        """
+        Yield each complete ``tag`` element while a streamed body is parsed.
+
+        Lets callers stop reading a multi-MB page as soon as they have what
+        they need. Each yielded element is cleared, and its earlier siblings
+        dropped, once the consumer moves on; other finished elements (the
+        rows wrapping each link, say) stay in the tree until the parse ends.
+
+        Args:
+            response: Response opened with ``stream=True``
+            tag: Element name to yield (e.g. "a")
+            encoding: Pin the document encoding instead of sniffing it
+            chunk_size: Bytes read per chunk
+        """
+        from lxml import etree
+        parser = etree.HTMLPullParser(events=("end",), tag=tag, encoding=encoding)
+
+        def _drain():
+            for _, element in parser.read_events():
+                yield element
+                element.clear()
+                # Drop already-handled siblings as well as their content
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            parser.feed(chunk)
+            yield from _drain()
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            return  # empty document: no root element, nothing to yield
+        yield from _drain()
+
     @abstractmethod
     def search(self, query: str) -> List[Manga]:
         """
@@ -160,6 +632,22 @@ class BaseScraper(ABC):
         """
         pass
 
+    def iter_pages(self, chapter_url: str) -> Iterator[str]:
+        """
+        Yield page image URLs for a chapter as they are discovered.
+
+        The downloader starts fetching each page as soon as it is yielded.
+        The default just walks get_pages(); scrapers that find pages
+        incrementally override this and build get_pages() on top of it.
+
+        Args:
+            chapter_url: URL to the chapter page
+
+        Yields:
+            Image URLs in order
+        """
+        yield from self.get_pages(chapter_url)
+
     def download_image(self, url: str, path: Path) -> bool:
         """
         Download an image to disk.
@@ -174,15 +662,58 @@ class BaseScraper(ABC):
             True if successful
         """
         try:
-            response = self._request(url)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
+            with self._request(url, stream=True) as response:
+                self._save_stream(response, path)
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to download {url}: {e}")
+            return False
+
+    def _download_with_image_session(self, url: str, path: Path) -> bool:
+        """
+        Download an image through image_session, streamed to disk.
+
+        For overrides whose site wants image_headers rather than the
+        retrying, rate-limited _request() path. The page never sits whole
+        in memory while the downloader's other workers fetch theirs.
+
+        Returns:
+            True if successful
+        """
+        try:
+            with self.image_session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             logger.debug(f"Failed to download {url}: {e}")
             return False
 
+    @staticmethod
+    def _save_stream(response: requests.Response, path: Path, chunk_size: int = 64 * 1024):
+        """Write a ``stream=True`` response body to ``path`` chunk by chunk.
+
+        Keeps memory flat regardless of image size instead of holding the
+        whole body in ``response.content``. A partially written file is
+        removed if the transfer dies midway, so callers never mistake it
+        for a finished page.
+        """
+        path = Path(path)
+        try:
+            f = open(path, "wb")
+        except FileNotFoundError:
+            # Every page of a chapter shares one directory, which the caller
+            # normally made already; only pay for mkdir when it is missing
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, "wb")
+        try:
+            with f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
     def get_cover_url(self, manga_url: str) -> Optional[str]:
         """Get cover image URL from a manga page.
 
@@ -213,3 +744,27 @@ class BaseScraper(ABC):
         """
         chapters = self.get_chapters(manga_url)
         return [ch for ch in chapters if ch.numeric > last_chapter]
+
+    def get_pages_many(self, chapter_urls: List[str], max_workers: int = 16) -> Dict[str, List[str]]:
+        """
+        Get page URLs for several chapters concurrently.
+
+        Args:
+            chapter_urls: Chapter URLs to resolve
+            max_workers: Chapters resolved at once
+
+        Returns:
+            Dict mapping each chapter URL to its page URLs; a chapter whose
+            lookup fails maps to an empty list
+        """
+        def _pages(url: str) -> List[str]:
+            try:
+                return self.get_pages(url)
+            except Exception as e:
+                logger.debug(f"Failed to get pages for {url}: {e}")
+                return []
+
+        if not chapter_urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chapter_urls))) as pool:
+            return dict(zip(chapter_urls, pool.map(_pages, chapter_urls)))
@@ -63,13 +63,10 @@ class ComixScraper(PlaywrightScraper):
 
     def _search_in_thread(self, query: str) -> List[Manga]:
         """Drive the rendered browse search box."""
-        from playwright_stealth import Stealth
-
         browser, context = self._get_browser_in_thread()
         page = context.new_page()
 
         try:
-            Stealth().apply_stealth_sync(page)
             page.goto(f"{self.base_url}/browse", wait_until="domcontentloaded", timeout=45000)
             page.wait_for_selector('input[type="search"]', timeout=20000)
             page.fill('input[type="search"]', query)
@@ -116,8 +113,6 @@ class ComixScraper(PlaywrightScraper):
 
     def _get_chapters_in_thread(self, manga_url: str) -> List[Chapter]:
         """Collect rendered chapter rows across paginated chapter-list pages."""
-        from playwright_stealth import Stealth
-
         # Comix exposes 20 chapter rows per rendered page. Five pages covers
         # the newest 100 rows, which is enough for normal update checks while
         # avoiding very slow first-time crawls on long-running series. Set
@@ -127,8 +122,6 @@ class ComixScraper(PlaywrightScraper):
         page = context.new_page()
 
         try:
-            Stealth().apply_stealth_sync(page)
-
             chapters = []
             seen = set()
             base = manga_url.split("?", 1)[0]
@@ -168,13 +161,10 @@ class ComixScraper(PlaywrightScraper):
 
     def _get_pages_in_thread(self, chapter_url: str) -> List[str]:
         """Extract reader image URLs from the rendered chapter page."""
-        from playwright_stealth import Stealth
-
         browser, context = self._get_browser_in_thread()
         page = context.new_page()
 
         try:
-            Stealth().apply_stealth_sync(page)
             page.goto(chapter_url, wait_until="domcontentloaded", timeout=45000)
             page.wait_for_selector(".rpage-page__img, img", timeout=20000)
 
@@ -16,6 +16,19 @@ from bs4 import BeautifulSoup
 from .playwright_base import PlaywrightScraper
 from .base import Chapter, Manga
 
+# Same optional orjson fast path as mangasee; its JSONDecodeError
+# subclasses the stdlib one, so the except clauses below catch both
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Embedded vm.* data in the reader/directory <script>s
+_DIRECTORY_JSON_RE = re.compile(r'\[\s*\{[^\]]+\}\s*\]')
+_CHAPTERS_JSON_RE = re.compile(r'vm\.Chapters\s*=\s*(\[[^\]]+\])')
+_CUR_PATH_RE = re.compile(r'vm\.CurPathName\s*=\s*["\']([^"\']+)["\']')
+_CUR_CHAPTER_RE = re.compile(r'vm\.CurChapter\s*=\s*(\{[^}]+\})')
+
 
 class Manga4LifeScraper(PlaywrightScraper):
     """Scraper for Manga4Life / MangaLife."""
@@ -79,10 +92,10 @@ class Manga4LifeScraper(PlaywrightScraper):
                 text = script.string or ''
                 if 'vm.Directory' in text or 'vm.SearchResult' in text:
                     # Extract JSON array
-                    match = re.search(r'\[\s*\{[^\]]+\}\s*\]', text)
+                    match = _DIRECTORY_JSON_RE.search(text)
                     if match:
                         try:
-                            items = json.loads(match.group())
+                            items = _json_loads(match.group())
                             query_lower = query.lower()
                             for item in items:
                                 title = item.get('s') or item.get('title') or ''
@@ -143,10 +156,10 @@ class Manga4LifeScraper(PlaywrightScraper):
                 text = script.string or ''
                 if 'vm.Chapters' in text or 'MainFunction' in text:
                     # Find chapter array
-                    match = re.search(r'vm\.Chapters\s*=\s*(\[[^\]]+\])', text)
+                    match = _CHAPTERS_JSON_RE.search(text)
                     if match:
                         try:
-                            chaps = json.loads(match.group(1))
+                            chaps = _json_loads(match.group(1))
                             for ch in chaps:
                                 num = ch.get('Chapter', '0')
                                 # Manga4Life encodes chapter as XCCCC.D
@@ -175,13 +188,13 @@ class Manga4LifeScraper(PlaywrightScraper):
             text = script.string or ''
             if 'vm.CurChapter' in text or 'MainFunction' in text:
                 # Extract page data
-                path_match = re.search(r'vm\.CurPathName\s*=\s*["\']([^"\']+)["\']', text)
-                chapter_match = re.search(r'vm\.CurChapter\s*=\s*(\{[^}]+\})', text)
+                path_match = _CUR_PATH_RE.search(text)
+                chapter_match = _CUR_CHAPTER_RE.search(text)
                 
                 if path_match and chapter_match:
                     try:
                         path = path_match.group(1)
-                        chapter_data = json.loads(chapter_match.group(1))
+                        chapter_data = _json_loads(chapter_match.group(1))
                         
                         chapter = chapter_data.get('Chapter', '')
                         directory = chapter_data.get('Directory', '')
@@ -103,14 +103,10 @@ class MangaBuddyScraper(PlaywrightScraper):
         MangaBuddy loads images dynamically via JavaScript, so we need
         a real browser to render the page and extract image URLs.
         """
-        from playwright_stealth import Stealth
-
         browser, context = self._get_browser_in_thread()
         page = context.new_page()
 
         try:
-            Stealth().apply_stealth_sync(page)
-
             page.goto(chapter_url, wait_until='domcontentloaded', timeout=45000)
             page.wait_for_timeout(3000)
 
@@ -7,10 +7,27 @@ CDN images at bx1.mangapeak.me
 """
 
 import re
-from typing import List
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+from bs4 import BeautifulSoup
+
 from .base import BaseScraper, Chapter, Manga
 
+# HEAD probes in flight at once while enumerating chapter pages. Kept
+# well under the session's per-host pool size so probes reuse keep-alive
+# connections instead of churning them.
+_PROBE_BATCH = 8
+_MAX_PAGES = 200
+
+# Reader URLs look like /read/{manga}/ch1-8788
+_CHAPTER_URL_RE = re.compile(r'/ch(\d+\.?\d*)-(\d+)')
+_CHAPTER_TEXT_RE = re.compile(r'(?:ch\.?|chapter)\s*(\d+\.?\d*)', re.I)
+# https://bx1.mangapeak.me/storage/chapters/{hash}/{page}.webp
+_CDN_PAGE_RE = re.compile(r'https?://[^\s"\'<>\\]+mangapeak\.me/storage/chapters/[a-f0-9]+/\d+\.webp')
+_ANY_PAGE_RE = re.compile(r'https?://[^\s"\'<>\\]+/storage/chapters/[a-f0-9]+/\d+\.webp')
+# Page filename as it appears in the reader HTML: (hash, raw "007", number 7)
+_PAGE_FILE_RE = re.compile(r'/storage/chapters/([a-f0-9]+)/(0*(\d+))\.webp')
+
 
 class MangaTaroScraper(BaseScraper):
     """Scraper for MangaTaro - the ComicK replacement."""
@@ -26,23 +43,29 @@ class MangaTaroScraper(BaseScraper):
         1. Try direct URL with slug version of query
         2. Browse the API endpoint and filter client-side
         """
-        from bs4 import BeautifulSoup
-        
         results = []
+        seen_urls = set()
         
-        # Method 1: Try direct URL construction
         slug = query.lower().replace(" ", "-").replace("'", "").replace(":", "")
         direct_url = f"{self.base_url}/manga/{slug}"
+        api_url = f"{self.base_url}/api/manga?q={query.replace(' ', '+')}"
         
+        # The two lookups are independent, so fetch them side by side and
+        # parse afterwards in the original order
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            direct_resp, api_resp = pool.map(self._try_get, (direct_url, api_url))
+        
+        # Method 1: Try direct URL construction
         try:
-            resp = self.session.get(direct_url, timeout=15)
-            if resp.status_code == 200 and "/manga/" in resp.url:
+            resp = direct_resp
+            if resp is not None and resp.status_code == 200 and "/manga/" in resp.url:
                 soup = BeautifulSoup(resp.text, "html.parser")
                 title_tag = soup.find("title")
                 if title_tag and "manga" in title_tag.string.lower():
                     title = title_tag.string.replace(" Manga | Read Online Free at MangaTaro", "").strip()
                     cover = soup.select_one('img[src*="/media/"]')
                     cover_url = cover.get("src") if cover else None
+                    seen_urls.add(direct_url)
                     results.append(Manga(
                         title=title,
                         url=direct_url,
@@ -53,9 +76,8 @@ class MangaTaroScraper(BaseScraper):
         
         # Method 2: Browse API endpoint and filter
         try:
-            api_url = f"{self.base_url}/api/manga?q={query.replace(' ', '+')}"
-            resp = self.session.get(api_url, timeout=15)
-            if resp.status_code == 200:
+            resp = api_resp
+            if resp is not None and resp.status_code == 200:
                 soup = BeautifulSoup(resp.text, "html.parser")
                 
                 query_lower = query.lower()
@@ -69,7 +91,8 @@ class MangaTaroScraper(BaseScraper):
                     if text and query_lower in text.lower():
                         manga_url = href if href.startswith("http") else f"{self.base_url}{href}"
                         
-                        if manga_url not in [r.url for r in results]:
+                        if manga_url not in seen_urls:
+                            seen_urls.add(manga_url)
                             results.append(Manga(
                                 title=text,
                                 url=manga_url,
@@ -80,14 +103,19 @@ class MangaTaroScraper(BaseScraper):
         
         return results[:10]
     
+    def _try_get(self, url: str):
+        """GET ``url``, returning None instead of raising on network errors."""
+        try:
+            return self.session.get(url, timeout=15)
+        except Exception:
+            return None
+    
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga.
         
         MangaTaro has chapters in a dropdown on the reader page.
         We first find a chapter link, then load that page to get the full list.
         """
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(manga_url)
         soup = BeautifulSoup(html, "html.parser")
         
@@ -100,44 +128,14 @@ class MangaTaroScraper(BaseScraper):
             if not read_url.startswith("http"):
                 read_url = f"{self.base_url}{read_url}"
             
-            # Load the reader page to get chapter dropdown
+            # Load the reader page to get chapter dropdown; an unchanged
+            # page reuses the last parse (see BaseScraper._parse_once)
             reader_html = self._get_html(read_url)
-            reader_soup = BeautifulSoup(reader_html, "html.parser")
-            
-            # Find the chapter selector dropdown
-            for select in reader_soup.find_all("select"):
-                options = select.find_all("option")
-                if len(options) > 1:  # Has multiple chapters
-                    for option in options:
-                        href = option.get("value", "")
-                        if "/read/" not in href:
-                            continue
-                        
-                        chapter_url = href if href.startswith("http") else f"{self.base_url}{href}"
-                        chapter_text = option.get_text(strip=True)
-                        
-                        # Extract chapter number from URL: /read/manga/ch1-8788
-                        match = re.search(r'/ch(\d+\.?\d*)-(\d+)', href)
-                        if match:
-                            chapter_num = match.group(1)
-                        else:
-                            # Extract from text: "Ch. 1" or "Chapter 1"
-                            text_match = re.search(r'(?:ch\.?|chapter)\s*(\d+\.?\d*)', chapter_text, re.I)
-                            chapter_num = text_match.group(1) if text_match else "0"
-                        
-                        if chapter_url not in [c.url for c in chapters]:
-                            chapters.append(Chapter(
-                                number=chapter_num,
-                                title=chapter_text or None,
-                                url=chapter_url,
-                                date=None,
-                            ))
-                    
-                    if chapters:
-                        break  # Found chapters, stop looking
+            chapters = self._parse_once(read_url, reader_html, self._parse_dropdown)
         
         # Fallback: look for chapter links directly on manga page
         if not chapters:
+            seen_urls = set()
             for link in soup.select('a[href*="/read/"]'):
                 href = link.get("href", "")
                 if not href or "/read/" not in href:
@@ -145,10 +143,11 @@ class MangaTaroScraper(BaseScraper):
                 
                 chapter_url = href if href.startswith("http") else f"{self.base_url}{href}"
                 
-                match = re.search(r'/ch(\d+\.?\d*)-(\d+)', href)
+                match = _CHAPTER_URL_RE.search(href)
                 chapter_num = match.group(1) if match else "0"
                 
-                if chapter_url not in [c.url for c in chapters]:
+                if chapter_url not in seen_urls:
+                    seen_urls.add(chapter_url)
                     chapters.append(Chapter(
                         number=chapter_num,
                         title=link.get_text(strip=True) or None,
@@ -158,22 +157,64 @@ class MangaTaroScraper(BaseScraper):
         
         return sorted(chapters, key=lambda x: x.numeric)
     
+    def _parse_dropdown(self, reader_html: str) -> List[Chapter]:
+        """Chapters from the first multi-option dropdown on a reader page."""
+        reader_soup = BeautifulSoup(reader_html, "html.parser")
+        chapters = []
+        seen_urls = set()
+        
+        # Find the chapter selector dropdown
+        for select in reader_soup.find_all("select"):
+            options = select.find_all("option")
+            if len(options) > 1:  # Has multiple chapters
+                for option in options:
+                    href = option.get("value", "")
+                    if "/read/" not in href:
+                        continue
+                    
+                    chapter_url = href if href.startswith("http") else f"{self.base_url}{href}"
+                    chapter_text = option.get_text(strip=True)
+                    
+                    # Extract chapter number from URL: /read/manga/ch1-8788
+                    match = _CHAPTER_URL_RE.search(href)
+                    if match:
+                        chapter_num = match.group(1)
+                    else:
+                        # Extract from text: "Ch. 1" or "Chapter 1"
+                        text_match = _CHAPTER_TEXT_RE.search(chapter_text)
+                        chapter_num = text_match.group(1) if text_match else "0"
+                    
+                    if chapter_url not in seen_urls:
+                        seen_urls.add(chapter_url)
+                        chapters.append(Chapter(
+                            number=chapter_num,
+                            title=chapter_text or None,
+                            url=chapter_url,
+                            date=None,
+                        ))
+                
+                if chapters:
+                    break  # Found chapters, stop looking
+        
+        return chapters
+    
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
+        return list(self.iter_pages(chapter_url))
+    
+    def iter_pages(self, chapter_url: str) -> Iterator[str]:
+        """Yield page image URLs, streaming them out of the CDN probe."""
         html = self._get_html(chapter_url)
         
         # Extract CDN image URLs from the page
-        # Pattern: https://bx1.mangapeak.me/storage/chapters/{hash}/{page}.webp
-        cdn_pattern = r'https?://[^\s"\'<>\\]+mangapeak\.me/storage/chapters/[a-f0-9]+/\d+\.webp'
-        cdn_urls = re.findall(cdn_pattern, html)
+        cdn_urls = _CDN_PAGE_RE.findall(html)
         
         if not cdn_urls:
             # Try alternate pattern for mangataro.org URLs
-            alt_pattern = r'https?://[^\s"\'<>\\]+/storage/chapters/[a-f0-9]+/\d+\.webp'
-            cdn_urls = re.findall(alt_pattern, html)
+            cdn_urls = _ANY_PAGE_RE.findall(html)
         
         if not cdn_urls:
-            return []
+            return
         
         # Get the base URL (chapter hash) from first image
         first_url = cdn_urls[0]
@@ -184,26 +225,61 @@ class MangaTaroScraper(BaseScraper):
             hash_part = base_url.split('/storage/chapters/')[-1]
             base_url = f"{self.cdn_base}/storage/chapters/{hash_part}"
         
-        # Enumerate pages by checking which ones exist
-        pages = []
-        for i in range(1, 200):  # Max 200 pages
-            page_url = f"{base_url}/{str(i).zfill(3)}.webp"
-            try:
-                resp = self.session.head(page_url, timeout=5)
-                if resp.status_code == 200:
-                    pages.append(page_url)
-                else:
-                    # Check without zero padding
-                    page_url2 = f"{base_url}/{i}.webp"
-                    resp2 = self.session.head(page_url2, timeout=5)
-                    if resp2.status_code == 200:
-                        pages.append(page_url2)
-                    else:
-                        break  # No more pages
-            except:
-                break
+        # Pages up to the highest filename the reader embeds are built
+        # without a HEAD each; only the tail past it (lazy-loaded pages) is
+        # probed
+        pages = self._pages_from_html(html, base_url)
+        yield from pages
+        yield from self._probe_pages(base_url, start=len(pages) + 1)
+    
+    def _pages_from_html(self, html: str, base_url: str) -> List[str]:
+        """Build page URLs 1..N from the filenames embedded in the reader HTML.
+        
+        N is the highest page number named, so numbering holes are filled
+        in rather than dropped. Lazy-loading readers may name only the
+        first few pages, so this is a floor on the page count, not the
+        count itself.
+        """
+        chapter_hash = base_url.rsplit('/', 1)[-1]
+        nums = set()
+        width = 0
+        for m in _PAGE_FILE_RE.finditer(html):
+            if m.group(1) != chapter_hash:
+                continue
+            if not nums:
+                width = len(m.group(2))  # keep the CDN's zero padding
+            nums.add(int(m.group(3)))
         
-        return pages
+        if not nums:
+            return []
+        return [f"{base_url}/{str(i).zfill(width)}.webp" for i in range(1, max(nums) + 1)]
+    
+    def _probe_pages(self, base_url: str, start: int = 1) -> Iterator[str]:
+        """Enumerate pages from ``start`` by checking which exist on the CDN.
+        
+        Probes run in batches of ``_PROBE_BATCH`` concurrent HEAD requests
+        instead of one at a time, so a 60-page chapter costs a handful of
+        round trips rather than 60. Results are yielded in page order as
+        each batch lands, and the sweep stops at the first missing page.
+        """
+        with ThreadPoolExecutor(max_workers=_PROBE_BATCH) as pool:
+            for first in range(start, _MAX_PAGES, _PROBE_BATCH):
+                batch = range(first, min(first + _PROBE_BATCH, _MAX_PAGES))
+                for page_url in pool.map(lambda i: self._probe_page(base_url, i), batch):
+                    if page_url is None:
+                        return  # No more pages
+                    yield page_url
+    
+    def _probe_page(self, base_url: str, i: int) -> Optional[str]:
+        """Return the URL of page ``i`` if it exists, else None."""
+        # Zero-padded first, then without padding
+        for page_url in (f"{base_url}/{str(i).zfill(3)}.webp", f"{base_url}/{i}.webp"):
+            try:
+                if self.session.head(page_url, timeout=5).status_code == 200:
+                    return page_url
+            except Exception:
+                return None
+        return None
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
@@ -212,10 +288,9 @@ class MangaTaroScraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Referer": f"{self.base_url}/",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_bytes(response.content)
+            with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
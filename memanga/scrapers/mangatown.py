@@ -7,9 +7,20 @@ Large manga library, shares CDN with MangaHere.
 
 import re
 from typing import List
-from pathlib import Path
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_NUM_RE = re.compile(r'/c(\d+\.?\d*)')
+
+# XPath equivalents of 'a[href*="/{slug}/c"]' and '.read_img img, #image'
+_CHAPTER_LINKS_XPATH = '//a[contains(@href, $needle)]'
+_READER_IMGS_XPATH = (
+    '//*[contains(concat(" ", normalize-space(@class), " "), " read_img ")]//img'
+    ' | //*[@id="image"]'
+)
+
 
 class MangaTownScraper(BaseScraper):
     """Scraper for MangaTown.com"""
@@ -19,11 +30,9 @@ class MangaTownScraper(BaseScraper):
     
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
-        from bs4 import BeautifulSoup
-        
         url = f"{self.base_url}/search?name={query.replace(' ', '+')}"
         html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         seen_urls = set()
@@ -70,10 +79,7 @@ class MangaTownScraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
         
         # Extract manga slug from URL
         slug = manga_url.rstrip("/").split("/")[-1]
@@ -81,11 +87,12 @@ class MangaTownScraper(BaseScraper):
         chapters = []
         seen_urls = set()
         
-        for link in soup.select(f'a[href*="/{slug}/c"]'):
+        # Plain lxml + XPath: no bs4 Tag wrapping or soupsieve on this path
+        for link in self._xpath(html, _CHAPTER_LINKS_XPATH, needle=f"/{slug}/c"):
             href = link.get("href", "")
             
             # Must have chapter number pattern
-            match = re.search(r'/c(\d+\.?\d*)', href)
+            match = _CHAPTER_NUM_RE.search(href)
             if not match:
                 continue
             
@@ -105,7 +112,7 @@ class MangaTownScraper(BaseScraper):
             seen_urls.add(full_url)
             
             chapter_num = match.group(1)
-            chapter_text = link.get_text(strip=True)
+            chapter_text = link.text_content().strip()
             
             chapters.append(Chapter(
                 number=chapter_num,
@@ -117,16 +124,13 @@ class MangaTownScraper(BaseScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
         
         pages = []
         seen = set()
         
         # Find reader images
-        for img in soup.select('.read_img img, #image'):
+        for img in self._xpath(html, _READER_IMGS_XPATH):
             src = img.get("data-src") or img.get("src")
             if src and src not in seen:
                 seen.add(src)
@@ -137,6 +141,13 @@ class MangaTownScraper(BaseScraper):
         
         return pages
     
+    @staticmethod
+    def _xpath(html: str, query: str, **variables) -> list:
+        """Run an XPath query over ``html``; empty documents yield no nodes."""
+        if not html or not html.strip():
+            return []
+        return lxml_html.fromstring(html).xpath(query, **variables)
+    
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
         try:
@@ -144,10 +155,9 @@ class MangaTownScraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Referer": f"{self.base_url}/",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_bytes(response.content)
+            with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
@@ -11,11 +11,34 @@ URL patterns:
 import re
 import logging
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
 from .playwright_base import PlaywrightScraper
 
 logger = logging.getLogger(__name__)
 
+_MANGA_HREF_RE = re.compile(r'/manga/[^/]+/?$')
+_CHAPTER_HREF_RE = re.compile(r'/manga/[^/]+/chapter-[\d.]+/?')
+_CHAPTER_NUM_RE = re.compile(r'chapter-([\d.]+)')
+# Site chrome in the reader area. 'ads' must not match inside 'uploads',
+# or every wp-content/uploads page image gets thrown away.
+_SKIP_IMG_RE = re.compile(r'logo|icon|avatar|banner|(?<!uplo)ads', re.I)
+
+# XPath version of '.reading-content img, .page-break img, .wp-manga-chapter-img'
+# evaluated per <img>, so get_pages walks the tree once
+_IS_READER_IMG = etree.XPath(
+    'boolean(ancestor::*[contains(concat(" ", normalize-space(@class), " "), " reading-content ")'
+    ' or contains(concat(" ", normalize-space(@class), " "), " page-break ")]'
+    ' or self::*[contains(concat(" ", normalize-space(@class), " "), " wp-manga-chapter-img ")])'
+)
+
+# Chapter links the static HTML must carry before we trust it over a
+# browser render (Madara sometimes loads the list over AJAX instead)
+_STATIC_MIN_CHAPTERS = 5
+
+# Phrases from a Cloudflare interstitial; only the first 4 KB is sampled
+_CF_HINTS = ("just a moment", "checking your browser", "cf-challenge")
+
 
 class MangaYYScraper(PlaywrightScraper):
     """Scraper for mangayy.org (WordPress Madara)."""
@@ -30,13 +53,15 @@ class MangaYYScraper(PlaywrightScraper):
             # Use WordPress search
             search_url = f"{self.base_url}/?s={query.replace(' ', '+')}&post_type=wp-manga"
             content = self._get_page_content(search_url, wait_time=5000)
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
             
             results = []
+            seen = set()
+            query_lower = query.lower()
             
             # Find manga links in search results
             for item in soup.select('.c-tabs-item__content, .page-item-detail, .manga'):
-                link = item.find('a', href=re.compile(r'/manga/[^/]+/?$'))
+                link = item.find('a', href=_MANGA_HREF_RE)
                 if not link:
                     continue
                 
@@ -50,62 +75,95 @@ class MangaYYScraper(PlaywrightScraper):
                 if img:
                     cover = img.get('src') or img.get('data-src')
                 
-                if url and title:
+                if url and title and url not in seen:
+                    seen.add(url)
                     results.append({
                         'title': title,
                         'url': url,
                         'cover': cover
                     })
             
-            # If no results from search, try homepage filtering
+            # Selector miss: other markup in the same tree may still link
+            # the manga, so filter its links before going anywhere else
             if not results:
-                content = self._get_page_content(self.base_url, wait_time=4000)
-                soup = BeautifulSoup(content, 'html.parser')
-                query_lower = query.lower()
+                manga_links = soup.find_all('a', href=_MANGA_HREF_RE)
+                results = self._match_links(manga_links, query_lower, seen)
                 
-                for link in soup.find_all('a', href=re.compile(r'/manga/[^/]+/?$')):
-                    title = link.get_text(strip=True)
-                    if title and query_lower in title.lower():
-                        url = link.get('href', '')
-                        results.append({
-                            'title': title,
-                            'url': url,
-                            'cover': None
-                        })
+                # Only a genuinely empty search page is worth a second
+                # browser round trip to the homepage
+                if not manga_links:
+                    content = self._get_page_content(self.base_url, wait_time=4000)
+                    soup = BeautifulSoup(content, 'lxml')
+                    results = self._match_links(
+                        soup.find_all('a', href=_MANGA_HREF_RE), query_lower, seen)
             
-            # Remove duplicates
-            seen = set()
-            unique = []
-            for r in results:
-                if r['url'] not in seen:
-                    seen.add(r['url'])
-                    unique.append(r)
-            
-            logger.info(f"Found {len(unique)} results for '{query}'")
-            return unique[:20]
+            logger.info(f"Found {len(results)} results for '{query}'")
+            return results[:20]
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
     
+    @staticmethod
+    def _match_links(links, query_lower: str, seen: set) -> list[dict]:
+        """Turn manga links whose text contains the query into results."""
+        results = []
+        for link in links:
+            title = link.get_text(strip=True)
+            if title and query_lower in title.lower():
+                url = link.get('href', '')
+                if url in seen:
+                    continue
+                seen.add(url)
+                results.append({
+                    'title': title,
+                    'url': url,
+                    'cover': None
+                })
+        return results
+    
+    def _get_content(self, url: str, wait_time: int, ready) -> str:
+        """Fetch ``url`` with plain requests, falling back to Playwright.
+        
+        Madara usually ships the chapter list and reader images in the
+        server HTML, so a plain GET saves the browser spin-up. The browser
+        is only used when that HTML is a Cloudflare challenge or ``ready``
+        says the data we need isn't in it.
+        """
+        try:
+            response = self.session.get(url, timeout=15)
+            html = response.text
+            if (response.status_code == 200
+                    and not any(h in html[:4096].lower() for h in _CF_HINTS)
+                    and ready(html)):
+                return html
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+        return self._get_page_content(url, wait_time=wait_time)
+    
     def get_chapters(self, manga_url: str) -> list[dict]:
         """Get all chapters for a manga."""
         try:
-            content = self._get_page_content(manga_url, wait_time=4000)
-            soup = BeautifulSoup(content, 'html.parser')
+            content = self._get_content(
+                manga_url, 4000,
+                lambda html: len(_CHAPTER_HREF_RE.findall(html)) >= _STATIC_MIN_CHAPTERS,
+            )
+            soup = BeautifulSoup(content, 'lxml')
             
             chapters = []
+            seen = set()
             
             # Find chapter links (Madara pattern)
-            for link in soup.find_all('a', href=re.compile(r'/manga/[^/]+/chapter-[\d.]+/?')):
+            for link in soup.find_all('a', href=_CHAPTER_HREF_RE):
                 href = link.get('href', '')
                 text = link.get_text(strip=True)
                 
-                if not href:
+                if not href or href in seen:
                     continue
+                seen.add(href)
                 
                 # Extract chapter number
-                match = re.search(r'chapter-([\d.]+)', href)
+                match = _CHAPTER_NUM_RE.search(href)
                 chapter_num = match.group(1) if match else "0"
                 
                 title = text if text else f"Chapter {chapter_num}"
@@ -116,19 +174,11 @@ class MangaYYScraper(PlaywrightScraper):
                     'chapter': chapter_num
                 })
             
-            # Remove duplicates
-            seen = set()
-            unique = []
-            for ch in chapters:
-                if ch['url'] not in seen:
-                    seen.add(ch['url'])
-                    unique.append(ch)
-            
             # Sort descending
-            unique.sort(key=lambda x: float(x.get('chapter', 0) or 0), reverse=True)
+            chapters.sort(key=lambda x: float(x.get('chapter', 0) or 0), reverse=True)
             
-            logger.info(f"Found {len(unique)} chapters for {manga_url}")
-            return unique
+            logger.info(f"Found {len(chapters)} chapters for {manga_url}")
+            return chapters
             
         except Exception as e:
             logger.error(f"Failed to get chapters: {e}")
@@ -137,31 +187,38 @@ class MangaYYScraper(PlaywrightScraper):
     def get_pages(self, chapter_url: str) -> list[str]:
         """Get all images for a chapter."""
         try:
-            content = self._get_page_content(chapter_url, wait_time=5000)
-            soup = BeautifulSoup(content, 'html.parser')
+            content = self._get_content(
+                chapter_url, 5000, lambda html: 'wp-manga-chapter-img' in html)
+            tree = lxml_html.fromstring(content)
             
             images = []
-            
-            # Find images in reading area
-            for img in soup.select('.reading-content img, .page-break img, .wp-manga-chapter-img'):
-                src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+            fallback = []
+            
+            # One pass over every <img>: reader-area images are preferred,
+            # anything else that looks like a page is kept as a fallback
+            for img in tree.iter('img'):
+                src = img.get('src') or img.get('data-src')
+                if src and ('chapter' in src.lower() or 'page' in src.lower() or 'manga' in src.lower()):
+                    fallback.append(src.strip())
+                
+                if not _IS_READER_IMG(img):
+                    continue
+                
+                src = src or img.get('data-lazy-src')
                 if not src:
                     continue
                 
                 # Skip small images, icons, etc.
-                if any(x in src.lower() for x in ['logo', 'icon', 'avatar', 'ads', 'banner']):
+                if _SKIP_IMG_RE.search(src):
                     continue
                 
                 # Accept manga content images
                 if 'wp-content/uploads' in src or 'manga' in src.lower():
                     images.append(src.strip())
             
-            # If no images found, try broader search
+            # If no reader images found, use the broader matches
             if not images:
-                for img in soup.find_all('img'):
-                    src = img.get('src') or img.get('data-src')
-                    if src and ('chapter' in src.lower() or 'page' in src.lower() or 'manga' in src.lower()):
-                        images.append(src.strip())
+                images = fallback
             
             logger.info(f"Found {len(images)} images for {chapter_url}")
             return images
@@ -7,8 +7,21 @@ Madara-based WordPress manga site - simple requests-based scraper.
 
 import re
 from typing import List
-from pathlib import Path
-from .base import BaseScraper, Chapter, Manga
+from lxml import etree
+
+from .base import BaseScraper, Chapter, Manga, xpath_has_class
+
+_CHAPTER_NUM_RE = re.compile(r'chapter[_\s-]*(\d+\.?\d*)', re.I)
+# Placeholder/spinner images the reader swaps out via lazy loading
+_SKIP_IMG_RE = re.compile(r'loading|lazy|\.gif', re.I)
+
+# Compiled once: soup.select() re-parses its CSS selector on every call and
+# wraps each lxml node in a bs4 Tag, neither of which these loops need
+_SEARCH_ITEMS = etree.XPath(f'//*[{xpath_has_class("c-tabs-item__content")}]')
+_ITEM_TITLE_LINK = etree.XPath(f'.//*[{xpath_has_class("post-title")}]//a')
+_CHAPTER_ITEMS = etree.XPath(f'//*[{xpath_has_class("chapter-item")}]')
+_MADARA_CHAPTER_LINKS = etree.XPath(f'//*[{xpath_has_class("wp-manga-chapter")}]//a')
+_READER_IMGS = etree.XPath(f'//*[{xpath_has_class("reading-content")}]//img')
 
 
 class ManhuaFastScraper(BaseScraper):
@@ -16,27 +29,28 @@ class ManhuaFastScraper(BaseScraper):
 
     name = "manhuafast"
     base_url = "https://manhuafast.com"
+    page_workers = 8
 
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
-        from bs4 import BeautifulSoup
-        
         url = f"{self.base_url}/?s={query.replace(' ', '+')}&post_type=wp-manga"
-        html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        tree = self._html_tree(self._get_html(url))
+        if tree is None:
+            return []
         
         results = []
-        for item in soup.select(".c-tabs-item__content"):
-            title_el = item.select_one(".post-title a")
-            if not title_el:
+        for item in _SEARCH_ITEMS(tree):
+            title_links = _ITEM_TITLE_LINK(item)
+            if not title_links:
                 continue
+            title_el = title_links[0]
             
-            title = title_el.get_text(strip=True)
+            title = title_el.text_content().strip()
             manga_url = title_el.get("href", "")
             
-            cover_el = item.select_one("img")
+            cover_el = next(item.iter("img"), None)
             cover_url = None
-            if cover_el:
+            if cover_el is not None:
                 cover_url = cover_el.get("data-src") or cover_el.get("src")
             
             results.append(Manga(
@@ -49,72 +63,71 @@ class ManhuaFastScraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
-        from bs4 import BeautifulSoup
-        
+        # Through _get_html so the daily update check gets a 304 off the
+        # conditional-request cache instead of the whole multi-MB list
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(manga_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the manga page HTML."""
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         
         chapters = []
         seen = set()
         
         # Try .chapter-item first (ManhuaFast specific)
-        for item in soup.select(".chapter-item"):
-            link = item.select_one("a")
-            if not link:
+        for item in _CHAPTER_ITEMS(tree):
+            link = next(item.iter("a"), None)
+            if link is None:
                 continue
             
             chapter_url = link.get("href", "")
             if not chapter_url or chapter_url in seen:
                 continue
             seen.add(chapter_url)
-            
-            chapter_text = link.get_text(strip=True)
-            
-            # Extract chapter number
-            match = re.search(r'chapter[_\s-]*(\d+\.?\d*)', chapter_text, re.I)
-            chapter_num = match.group(1) if match else chapter_text
-            
-            chapters.append(Chapter(
-                number=chapter_num,
-                title=None,
-                url=chapter_url,
-                date=None,
-            ))
+            chapters.append(self._chapter_from_link(link, chapter_url))
         
         # Fallback to standard Madara selector
         if not chapters:
-            for link in soup.select(".wp-manga-chapter a"):
+            for link in _MADARA_CHAPTER_LINKS(tree):
                 chapter_url = link.get("href", "")
                 if not chapter_url or chapter_url in seen:
                     continue
                 seen.add(chapter_url)
-                
-                chapter_text = link.get_text(strip=True)
-                match = re.search(r'chapter[_\s-]*(\d+\.?\d*)', chapter_text, re.I)
-                chapter_num = match.group(1) if match else chapter_text
-                
-                chapters.append(Chapter(
-                    number=chapter_num,
-                    title=None,
-                    url=chapter_url,
-                    date=None,
-                ))
+                chapters.append(self._chapter_from_link(link, chapter_url))
         
         return sorted(chapters)
     
+    @staticmethod
+    def _chapter_from_link(link, chapter_url: str) -> Chapter:
+        """Build a Chapter from a chapter-list ``<a>`` element."""
+        chapter_text = "".join(link.itertext()).strip()
+        
+        # Extract chapter number
+        match = _CHAPTER_NUM_RE.search(chapter_text)
+        chapter_num = match.group(1) if match else chapter_text
+        
+        return Chapter(
+            number=chapter_num,
+            title=None,
+            url=chapter_url,
+            date=None,
+        )
+    
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        from bs4 import BeautifulSoup
-        
-        html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        tree = self._html_tree(self._get_html(chapter_url))
+        if tree is None:
+            return []
         
         pages = []
-        for img in soup.select(".reading-content img"):
+        for img in _READER_IMGS(tree):
             src = img.get("data-src") or img.get("src") or img.get("data-lazy-src")
             if src:
                 src = src.strip()
-                if src and not any(x in src.lower() for x in ["loading", "lazy", ".gif"]):
+                if src and not _SKIP_IMG_RE.search(src):
                     pages.append(src)
         
         return pages
@@ -126,10 +139,9 @@ class ManhuaFastScraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Referer": f"{self.base_url}/",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_bytes(response.content)
+            with self.image_session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
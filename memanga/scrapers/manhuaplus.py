@@ -6,24 +6,43 @@ Large manhua/manhwa library with AJAX-based chapter loading.
 """
 
 import re
-from typing import List
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from bs4 import BeautifulSoup
+from lxml import etree
+
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+\.?\d*)', re.I)
+_CHAPTER_ID_RE = re.compile(r'CHAPTER_ID\s*=\s*(\d+)')
+# Chapter rows that carry their ID, e.g. <li data-chapter-id="123"><a href=...>,
+# and the row's own href or else its first link's. Looked up inside the row
+# only, so a locked row with no link never borrows the next row's.
+_CHAPTER_ID_ROWS = etree.XPath('//*[@data-chapter-id]')
+_ROW_HREF = etree.XPath('(@href | .//a/@href)[1]')
+
+# (scraper class, chapter_url) -> CHAPTER_ID seen on a chapter list, so
+# get_pages can go straight to the image AJAX endpoint. Module-level
+# because get_scraper() hands out a fresh scraper per operation: the
+# download never runs on the instance that listed the chapters.
+_CHAPTER_IDS_SIZE = 4096
+_chapter_ids: "OrderedDict[Tuple[type, str], str]" = OrderedDict()
+_chapter_ids_lock = threading.Lock()
+
 
 class ManhuaPlusScraper(BaseScraper):
     """Scraper for ManhuaPlus.org"""
     
     name = "manhuaplus"
     base_url = "https://manhuaplus.org"
+    page_workers = 8
     
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
-        from bs4 import BeautifulSoup
-        
         url = f"{self.base_url}/?s={query.replace(' ', '+')}&post_type=wp-manga"
         html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         for link in soup.select(".post-title a"):
@@ -47,33 +66,25 @@ class ManhuaPlusScraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
+        self._harvest_chapter_ids(html)
         
         chapters = []
         seen_urls = set()
         
         # Find chapter links by href pattern
-        for link in soup.select('a[href*="chapter-"]'):
-            href = link.get("href", "")
+        for href, chapter_text in self._links_containing(html, "chapter-"):
             if not href or href in seen_urls:
                 continue
-            
-            # Skip non-chapter links
-            if "chapter-" not in href:
-                continue
                 
             seen_urls.add(href)
-            chapter_text = link.get_text(strip=True)
             
             # Skip generic links like "Read Now"
             if chapter_text.lower() in ["read now", "read newest", "read first"]:
                 continue
             
             # Extract chapter number from URL
-            match = re.search(r'chapter-(\d+\.?\d*)', href, re.I)
+            match = _CHAPTER_NUM_RE.search(href)
             chapter_num = match.group(1) if match else "0"
             
             chapters.append(Chapter(
@@ -84,20 +95,57 @@ class ManhuaPlusScraper(BaseScraper):
         
         return sorted(chapters, key=lambda x: x.numeric)
     
+    def _harvest_chapter_ids(self, html: str):
+        """Remember the ``data-chapter-id`` of each chapter row, if present."""
+        if "data-chapter-id" not in html:
+            return
+        tree = self._html_tree(html)
+        if tree is None:
+            return
+        cls = type(self)
+        found = {}
+        for row in _CHAPTER_ID_ROWS(tree):
+            chapter_id = row.get("data-chapter-id", "").strip()
+            href = _ROW_HREF(row)
+            if chapter_id.isdigit() and href:
+                found.setdefault((cls, href[0]), chapter_id)
+        with _chapter_ids_lock:
+            for key, chapter_id in found.items():
+                _chapter_ids[key] = chapter_id
+                _chapter_ids.move_to_end(key)
+            while len(_chapter_ids) > _CHAPTER_IDS_SIZE:
+                _chapter_ids.popitem(last=False)
+    
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        from bs4 import BeautifulSoup
-        
-        # First get the chapter ID from the page
-        html = self._get_html(chapter_url)
+        # The chapter list usually told us the ID; otherwise, or if the
+        # cached ID no longer answers, read it off the chapter page
+        with _chapter_ids_lock:
+            chapter_id = _chapter_ids.get((type(self), chapter_url))
+        data = self._image_list(chapter_id, chapter_url) if chapter_id else None
+        if data is None:
+            match = _CHAPTER_ID_RE.search(self._get_html(chapter_url))
+            if not match or match.group(1) == chapter_id:
+                return []
+            data = self._image_list(match.group(1), chapter_url)
+            if data is None:
+                return []
         
-        match = re.search(r'CHAPTER_ID\s*=\s*(\d+)', html)
-        if not match:
-            return []
+        # Parse HTML to get image URLs from link hrefs
+        soup = BeautifulSoup(data["html"], "lxml")
         
-        chapter_id = match.group(1)
+        pages = []
+        seen = set()
+        for link in soup.select("a.readImg, a[href*='.webp'], a[href*='.jpg'], a[href*='.png']"):
+            href = link.get("href", "").strip()
+            if href and href not in seen and any(ext in href.lower() for ext in ['.jpg', '.png', '.webp']):
+                seen.add(href)
+                pages.append(href)
         
-        # Fetch images via AJAX endpoint
+        return pages
+    
+    def _image_list(self, chapter_id: str, chapter_url: str) -> Optional[dict]:
+        """Fetch a chapter's image list via AJAX, or None if it gave nothing."""
         ajax_url = f"{self.base_url}/ajax/image/list/chap/{chapter_id}"
         headers = {
             "Referer": chapter_url,
@@ -108,23 +156,11 @@ class ManhuaPlusScraper(BaseScraper):
             response = self.session.get(ajax_url, headers=headers, timeout=30)
             data = response.json()
         except Exception:
-            return []
+            return None
         
         if not data.get("status") or not data.get("html"):
-            return []
-        
-        # Parse HTML to get image URLs from link hrefs
-        soup = BeautifulSoup(data["html"], "html.parser")
-        
-        pages = []
-        seen = set()
-        for link in soup.select("a.readImg, a[href*='.webp'], a[href*='.jpg'], a[href*='.png']"):
-            href = link.get("href", "").strip()
-            if href and href not in seen and any(ext in href.lower() for ext in ['.jpg', '.png', '.webp']):
-                seen.add(href)
-                pages.append(href)
-        
-        return pages
+            return None
+        return data
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
@@ -133,10 +169,9 @@ class ManhuaPlusScraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Referer": f"{self.base_url}/",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_bytes(response.content)
+            with self.image_session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
@@ -7,23 +7,25 @@ Adult manhwa/webtoon library.
 
 import re
 from typing import List
-from pathlib import Path
+from bs4 import BeautifulSoup
+
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+\.?\d*)', re.I)
+
 
 class Manhwa18Scraper(BaseScraper):
     """Scraper for Manhwa18.cc"""
     
     name = "manhwa18"
     base_url = "https://manhwa18.cc"
+    page_workers = 8
     
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
-        from bs4 import BeautifulSoup
-        
         url = f"{self.base_url}/search?q={query.replace(' ', '+')}"
         html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         for item in soup.select(".manga-item"):
@@ -56,19 +58,14 @@ class Manhwa18Scraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
         
         chapters = []
         seen_urls = set()
         
-        for link in soup.select('a[href*="chapter-"]'):
-            href = link.get("href", "")
-            
+        for href, chapter_text in self._links_containing(html, "chapter-"):
             # Must have chapter-NUMBER pattern (not just "chapter" anywhere)
-            match = re.search(r'chapter-(\d+\.?\d*)', href, re.I)
+            match = _CHAPTER_NUM_RE.search(href)
             if not match:
                 continue
             
@@ -77,8 +74,6 @@ class Manhwa18Scraper(BaseScraper):
                 continue
             seen_urls.add(full_url)
             
-            chapter_text = link.get_text(strip=True)
-            
             # Skip generic links
             if chapter_text.lower() in ["read first", "read last", "first chapter", "last chapter"]:
                 continue
@@ -95,10 +90,8 @@ class Manhwa18Scraper(BaseScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         seen = set()
@@ -121,10 +114,9 @@ class Manhwa18Scraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Referer": f"{self.base_url}/",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_bytes(response.content)
+            with self.image_session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
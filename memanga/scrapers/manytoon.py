@@ -9,17 +9,24 @@ from .playwright_base import PlaywrightScraper
 from .base import Manga, Chapter
 from bs4 import BeautifulSoup
 
+_COMIC_SLUG_RE = re.compile(r"/comic/([^/]+)")
+_CHAPTER_NUM_RE = re.compile(r"/chapter-?([\d.]+)")
+_MANGA_SRC_RE = re.compile(r"manga", re.I)
+_SKIP_IMG_RE = re.compile(r"logo|icon", re.I)
+
 
 class ManyToonScraper(PlaywrightScraper):
     name = "Manytoon"
     domains = ["manytoon.com"]
     base_url = "https://manytoon.com"
+    # Only the HTML is parsed (image URLs come from src attributes)
+    blocked_resource_types = frozenset({"image", "media", "font", "stylesheet"})
 
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
         url = f"{self.base_url}/?s={query.replace(' ', '+')}"
         html = self._get_page_content(url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         results = []
         seen = set()
@@ -30,7 +37,7 @@ class ManyToonScraper(PlaywrightScraper):
                 continue
 
             # Extract slug from URL
-            match = re.search(r"/comic/([^/]+)/?", href)
+            match = _COMIC_SLUG_RE.search(href)
             if not match:
                 continue
 
@@ -50,11 +57,12 @@ class ManyToonScraper(PlaywrightScraper):
 
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get list of chapters for a manga."""
-        html = self._get_page_content(manga_url, wait_time=4000)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._get_page_content(
+            manga_url, wait_time=4000, wait_selector=".wp-manga-chapter a")
+        soup = BeautifulSoup(html, "lxml")
 
         # Extract slug from manga_url for filtering chapter links
-        slug_match = re.search(r"/comic/([^/]+)", manga_url)
+        slug_match = _COMIC_SLUG_RE.search(manga_url)
         slug = slug_match.group(1) if slug_match else ""
 
         chapters = []
@@ -66,7 +74,7 @@ class ManyToonScraper(PlaywrightScraper):
             text = link.get_text(strip=True)
 
             # Extract chapter number
-            match = re.search(r"/chapter-?([\d.]+)", href)
+            match = _CHAPTER_NUM_RE.search(href)
             if not match:
                 continue
 
@@ -95,20 +103,24 @@ class ManyToonScraper(PlaywrightScraper):
 
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        html = self._get_page_content(chapter_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._get_page_content(
+            chapter_url, wait_time=5000, wait_selector=".reading-content img, .page-break img")
+        soup = BeautifulSoup(html, "lxml")
 
         images = []
+        seen = set()
 
         # WordPress Madara stores images in /wp-content/uploads/WP-manga/
         for img in soup.select("img"):
             src = img.get("src") or img.get("data-src") or ""
             # Filter for manga page images
-            if "WP-manga" in src or "manga" in src.lower():
+            # ("WP-manga" uploads are covered by the case-insensitive match)
+            if _MANGA_SRC_RE.search(src):
                 # Skip logos and icons
-                if "logo" in src.lower() or "icon" in src.lower():
+                if _SKIP_IMG_RE.search(src):
                     continue
-                if src not in images:
+                if src not in seen:
+                    seen.add(src)
                     images.append(src)
 
         return images
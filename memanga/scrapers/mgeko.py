@@ -8,8 +8,15 @@ Simple requests-based scraper for manga reading.
 import re
 from typing import List
 from pathlib import Path
+from bs4 import BeautifulSoup
+
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_NUM_RE = re.compile(r'chapter[_-]?(\d+\.?\d*)', re.I)
+_ANY_NUM_RE = re.compile(r'(\d+\.?\d*)')
+# Page images come off a CDN/imgsrv host or a chapter path ('chapter' in any case)
+_PAGE_SRC_RE = re.compile(r'cdn|imgsrv|(?i:chapter)')
+
 
 class MGekoScraper(BaseScraper):
     """Scraper for MGeko."""
@@ -19,11 +26,9 @@ class MGekoScraper(BaseScraper):
     
     def search(self, query: str) -> List[Manga]:
         """Search for manga by title."""
-        from bs4 import BeautifulSoup
-        
         url = f"{self.base_url}/search/?search={query.replace(' ', '+')}"
         html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         for item in soup.select(".novel-item"):
@@ -54,8 +59,6 @@ class MGekoScraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
-        from bs4 import BeautifulSoup
-        
         # Try all-chapters page first
         if not manga_url.endswith("/"):
             manga_url += "/"
@@ -66,24 +69,20 @@ class MGekoScraper(BaseScraper):
         except:
             html = self._get_html(manga_url)
         
-        soup = BeautifulSoup(html, "html.parser")
-        
         chapters = []
         seen = set()
         
-        for link in soup.select('a[href*="/reader/"]'):
-            href = link.get("href", "")
+        for href, chapter_text in self._links_containing(html, "/reader/"):
             if not href or href in seen:
                 continue
             seen.add(href)
             
             chapter_url = f"{self.base_url}{href}" if href.startswith("/") else href
-            chapter_text = link.get_text(strip=True)
             
             # Extract chapter number from URL or text
-            match = re.search(r'chapter[_-]?(\d+\.?\d*)', href, re.I)
+            match = _CHAPTER_NUM_RE.search(href)
             if not match:
-                match = re.search(r'(\d+\.?\d*)', chapter_text)
+                match = _ANY_NUM_RE.search(chapter_text)
             
             chapter_num = match.group(1) if match else chapter_text
             
@@ -98,16 +97,14 @@ class MGekoScraper(BaseScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        from bs4 import BeautifulSoup
-        
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         for img in soup.select("img"):
             src = img.get("data-src") or img.get("src", "")
             # Look for manga page images (usually from CDN)
-            if src and ("cdn" in src or "imgsrv" in src or "chapter" in src.lower()):
+            if src and _PAGE_SRC_RE.search(src):
                 if not src.endswith((".gif", "logo")):
                     pages.append(src)
         
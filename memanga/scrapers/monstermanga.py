@@ -9,12 +9,15 @@ from typing import List
 from bs4 import BeautifulSoup
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_NUM_RE = re.compile(r'monster-chapter-(\d+(?:\.\d+)?)')
+
 
 class MonsterMangaScraper(BaseScraper):
     """Scraper for monstermanga.org - Monster manga by Naoki Urasawa."""
     
     name = "monstermanga"
     base_url = "https://www.monstermanga.org"
+    page_workers = 8
     
     def __init__(self):
         super().__init__()
@@ -33,19 +36,16 @@ class MonsterMangaScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters."""
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
         
         chapters = []
         seen = set()
         
         # Find chapter links (format: /manga/monster-chapter-X-0/)
-        for link in soup.select("a[href*='monster-chapter-']"):
-            href = link.get("href", "")
+        for href, text in self._links_containing(html, "monster-chapter-"):
             if not href or href in seen:
                 continue
             seen.add(href)
             
-            text = link.get_text(strip=True)
             if not text:
                 continue
             
@@ -54,7 +54,7 @@ class MonsterMangaScraper(BaseScraper):
                 href = self.base_url + href
             
             # Extract chapter number (format: monster-chapter-162-0)
-            match = re.search(r'monster-chapter-(\d+(?:\.\d+)?)', href.lower())
+            match = _CHAPTER_NUM_RE.search(href.lower())
             number = match.group(1) if match else "0"
             
             chapters.append(Chapter(
@@ -70,7 +70,7 @@ class MonsterMangaScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         seen = set()
@@ -93,12 +93,9 @@ class MonsterMangaScraper(BaseScraper):
                 "Referer": self.base_url,
                 "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
             }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
+            with self.image_session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
@@ -8,6 +8,15 @@ from bs4 import BeautifulSoup
 
 from .base import BaseScraper, Chapter, Manga
 
+_GALLERY_ID_RE = re.compile(r"/g/(\d+)")
+_THUMB_HOST_RE = re.compile(r"//t(\d+)\.")
+_THUMB_EXT_RE = re.compile(r"(\d+)t\.(jpg|png|gif|webp)")
+_DOUBLE_EXT_RE = re.compile(r"\.(webp|jpg|png)\.\1")
+
+# Page type codes used by the gallery API
+_API_EXT = {"j": "jpg", "p": "png", "g": "gif", "w": "webp"}
+_IMAGE_HOST = "https://i.nhentai.net"
+
 
 class NHentaiScraper(BaseScraper):
     """Scraper for nhentai.net (doujin gallery site)"""
@@ -19,7 +28,7 @@ class NHentaiScraper(BaseScraper):
         """Search for galleries."""
         url = f"{self.base_url}/search/?q={query}"
         html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         for gallery in soup.select(".gallery a.cover"):
@@ -44,7 +53,7 @@ class NHentaiScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """For doujin sites, return a single 'chapter' representing the gallery."""
         # Extract gallery ID from URL
-        match = re.search(r"/g/(\d+)", manga_url)
+        match = _GALLERY_ID_RE.search(manga_url)
         if match:
             gallery_id = match.group(1)
             return [Chapter(number="1", title=f"Gallery {gallery_id}", url=manga_url)]
@@ -52,8 +61,16 @@ class NHentaiScraper(BaseScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page images from a gallery."""
+        # The gallery API names every page directly; the thumbnail scrape
+        # below is only needed when it's unavailable
+        match = _GALLERY_ID_RE.search(chapter_url)
+        if match:
+            pages = self._pages_from_api(match.group(1))
+            if pages:
+                return pages
+        
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         # Find thumbnails and convert to full images
@@ -65,13 +82,28 @@ class NHentaiScraper(BaseScraper):
             if src and "nhentai.net" in src:
                 # Convert thumbnail URL to full image URL
                 # Replace t{n} with i{n} and remove 't' before extension
-                full_src = re.sub(r"//t(\d+)\.", r"//i\1.", src)
-                full_src = re.sub(r"(\d+)t\.(jpg|png|gif|webp)", r"\1.\2", full_src)
+                full_src = _THUMB_HOST_RE.sub(r"//i\1.", src)
+                full_src = _THUMB_EXT_RE.sub(r"\1.\2", full_src)
                 # Remove double extensions like .webp.webp
-                full_src = re.sub(r"\.(webp|jpg|png)\.\1", r".\1", full_src)
+                full_src = _DOUBLE_EXT_RE.sub(r".\1", full_src)
                 
                 if full_src.startswith("//"):
                     full_src = "https:" + full_src
                 pages.append(full_src)
         
         return pages
+    
+    def _pages_from_api(self, gallery_id: str) -> List[str]:
+        """Build full image URLs from /api/gallery/{id}; [] on any failure."""
+        try:
+            response = self.session.get(f"{self.base_url}/api/gallery/{gallery_id}", timeout=15)
+            if response.status_code != 200:
+                return []
+            data = response.json()
+            media_id = data["media_id"]
+            return [
+                f"{_IMAGE_HOST}/galleries/{media_id}/{i}.{_API_EXT[page['t']]}"
+                for i, page in enumerate(data["images"]["pages"], start=1)
+            ]
+        except Exception:
+            return []
@@ -4,10 +4,25 @@ Site: https://omegascans.org
 """
 
 import re
+import logging
+from operator import itemgetter
 from typing import List
 from .playwright_base import PlaywrightScraper
-from .base import Manga, Chapter
-from bs4 import BeautifulSoup
+from .base import Manga, Chapter, xpath_img_sources
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Every lookup below only reads hrefs, srcs and link text, so the rendered
+# page goes straight into lxml and these XPaths instead of a bs4 soup
+_SERIES_LINKS = etree.XPath('//a[contains(@href, "/series/")]')
+_LINKS_CONTAINING = etree.XPath('//a[contains(@href, $needle)]')
+_IMG_SOURCES = etree.XPath(xpath_img_sources(), smart_strings=False)
+# The same src-or-data-src pick, run in the browser by get_pages
+_IMG_SOURCES_JS = "els => els.map(e => e.getAttribute('src') || e.getAttribute('data-src') || '')"
+
+_SERIES_SLUG_RE = re.compile(r"/series/([^/]+)")
+_CHAPTER_NUM_RE = re.compile(r"/chapter-?([\d.]+)")
 
 
 class OmegaScansScraper(PlaywrightScraper):
@@ -20,66 +35,77 @@ class OmegaScansScraper(PlaywrightScraper):
         # OmegaScans doesn't have a search API, scrape the homepage
         # and filter by query
         url = self.base_url
-        html = self._get_page_content(url, wait_time=3000)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._get_page_content(
+            url, wait_time=3000, wait_selector='a[href*="/series/"]')
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
 
-        results = []
-        query_lower = query.lower()
-        seen = set()
+        # Slugs from the URL are already lowercase, so only the title
+        # needs folding, and only when the slug itself doesn't match
+        query_lower = query.casefold()
+        titles = {}
 
         # Find series links with their titles
-        for link in soup.select('a[href*="/series/"]'):
+        for link in _SERIES_LINKS(tree):
             href = link.get("href", "")
-            if "/series/" in href and "/chapter" not in href:
-                # Extract slug from href
-                match = re.search(r"/series/([^/]+)", href)
-                if not match:
-                    continue
-
-                slug = match.group(1)
-                if slug in seen:
-                    continue
-
-                # Get title - either from link text or convert slug
-                text = link.get_text(strip=True)
-                if text:
-                    # Title might be concatenated with description, try to split
-                    # Usually title is followed by description without space
-                    title = text.split('\n')[0][:100]
-                else:
-                    # Convert slug to title: "solo-leveling" -> "Solo Leveling"
-                    title = slug.replace("-", " ").title()
-
-                # Check if query matches title or slug
-                if query_lower in title.lower() or query_lower in slug.lower():
-                    seen.add(slug)
-                    results.append(Manga(
-                        title=title,
-                        url=f"{self.base_url}/series/{slug}",
-                    ))
-
-        return results[:20]
+            if "/chapter" in href:
+                continue
+
+            # Extract slug from href
+            match = _SERIES_SLUG_RE.search(href)
+            if not match:
+                continue
+
+            slug = match.group(1)
+            if slug in titles:
+                continue
+
+            # Get title - either from link text or convert slug
+            text = self._text_of(link)
+            if text:
+                # Title might be concatenated with description, try to split
+                # Usually title is followed by description without space
+                title = text.split('\n')[0][:100]
+            else:
+                # Convert slug to title: "solo-leveling" -> "Solo Leveling"
+                title = slug.replace("-", " ").title()
+
+            # Check if query matches slug or title
+            if query_lower in slug or query_lower in title.casefold():
+                titles[slug] = title
+                if len(titles) == 20:
+                    break
+
+        results = [
+            Manga(title=title, url=f"{self.base_url}/series/{slug}")
+            for slug, title in titles.items()
+        ]
+        return results
 
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get list of chapters for a manga."""
-        html = self._get_page_content(manga_url, wait_time=3000)
-        soup = BeautifulSoup(html, "html.parser")
-
         # Extract slug from manga_url for filtering chapter links
-        slug_match = re.search(r"/series/([^/]+)", manga_url)
+        slug_match = _SERIES_SLUG_RE.search(manga_url)
         slug = slug_match.group(1) if slug_match else ""
+        needle = f"/series/{slug}/chapter" if slug else "/chapter"
+
+        html = self._get_page_content(
+            manga_url, wait_time=3000, wait_selector=f'a[href*="{needle}"]')
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
 
         chapters = []
         seen = set()
 
         # Find chapter links - pattern: /series/{slug}/chapter-{num}
-        selector = f'a[href*="/series/{slug}/chapter"]' if slug else 'a[href*="/chapter"]'
-        for link in soup.select(selector):
+        for link in _LINKS_CONTAINING(tree, needle=needle):
             href = link.get("href", "")
-            text = link.get_text(strip=True)
+            text = self._text_of(link)
 
             # Extract chapter number from URL
-            match = re.search(r"/chapter-?([\d.]+)", href)
+            match = _CHAPTER_NUM_RE.search(href)
             if not match:
                 continue
 
@@ -88,42 +114,47 @@ class OmegaScansScraper(PlaywrightScraper):
                 continue
             seen.add(chapter_num)
 
-            # Build chapter URL
-            if href.startswith("http"):
-                chapter_url = href
-            elif href.startswith("/"):
-                chapter_url = f"{self.base_url}{href}"
-            else:
-                chapter_url = f"{self.base_url}/{href}"
+            # Sort key parsed once here rather than again inside sort()
+            try:
+                sort_key = float(chapter_num)
+            except ValueError:
+                sort_key = 0.0
 
-            chapters.append(Chapter(
+            chapters.append((sort_key, Chapter(
                 number=chapter_num,
                 title=text or f"Chapter {chapter_num}",
-                url=chapter_url,
-            ))
+                url=self._make_absolute(href),
+            )))
 
         # Sort by chapter number (descending - newest first)
-        def parse_chapter(ch):
-            try:
-                return float(ch.number)
-            except (ValueError, TypeError):
-                return 0
-
-        chapters.sort(key=parse_chapter, reverse=True)
-        return chapters
+        chapters.sort(key=itemgetter(0), reverse=True)
+        return [chapter for _, chapter in chapters]
 
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
-        html = self._get_page_content(chapter_url, wait_time=4000)
-        soup = BeautifulSoup(html, "html.parser")
+        wait_selector = 'img[src*="media.omegascans.org"]'
+        try:
+            # Only the srcs are needed, so read them out of the live DOM
+            sources = self._scrape_selector(
+                chapter_url, "img", _IMG_SOURCES_JS,
+                wait_time=4000, wait_selector=wait_selector)
+        except Exception as e:
+            logger.debug(f"Reading image srcs from the DOM failed for {chapter_url}: {e}")
+            html = self._get_page_content(
+                chapter_url, wait_time=4000, wait_selector=wait_selector)
+            tree = self._html_tree(html)
+            if tree is None:
+                return []
+            sources = _IMG_SOURCES(tree)
 
         images = []
+        seen = set()
 
         # Find images from media.omegascans.org
-        for img in soup.select("img"):
-            src = img.get("src") or img.get("data-src") or ""
+        for src in sources:
             if "media.omegascans.org" in src and "/uploads/" in src:
-                if src not in images:
+                if src not in seen:
+                    seen.add(src)
                     images.append(src)
 
         return images
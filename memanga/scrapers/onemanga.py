@@ -6,23 +6,54 @@ Uses MangaHub CDN for images.
 """
 
 import re
+import html
 import logging
 import cloudscraper
-from bs4 import BeautifulSoup
+from lxml import etree
 from typing import List, Optional
 from pathlib import Path
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus
 
 from .base import BaseScraper, Chapter, Manga
 
 logger = logging.getLogger(__name__)
 
+# Search and chapter lookups only read link hrefs/text and the covers
+# nested in them, so those pages are walked with lxml XPath, not bs4
+_MANGA_LINKS = etree.XPath('//a[contains(@href, "/manga/")]')
+_CHAPTER_LINKS = etree.XPath('//a[contains(@href, "/chapter/")]')
+
+# Chapter number sources, most reliable first: "#123-Title" link text,
+# "Chapter 123" text, then a short number in the URL (long ones are IDs)
+_HASH_NUM_RE = re.compile(r"#(\d+(?:\.\d+)?)-")
+_CHAPTER_TEXT_RE = re.compile(r"chapter\s*(\d+(?:\.\d+)?)", re.I)
+_CHAPTER_URL_RE = re.compile(r"chapter-(\d{1,4}(?:\.\d+)?)\b", re.I)
+
+# Search links that are site navigation: the bare /manga/ index and
+# /manga-list style pages, matched in one scan
+_NAV_HREF_RE = re.compile(r"/manga(?:-|/$)")
+
+# src/data-src attribute holding a MangaHub CDN image; scripts and
+# og:image meta tags on the same host don't match
+_MGHCDN_SRC_RE = re.compile(
+    r"""\b(?:data-)?src\s*=\s*["'](https?://[^"'\s>]*mghcdn\.com/[^"'\s>?]+"""
+    r"""\.(?:jpe?g|png|webp|gif)(?:\?[^"'\s>]*)?)["']""",
+    re.I,
+)
+
+# Distinct series search collects before it stops reading links (it
+# returns 20; the margin covers entries that never get a title)
+_SEARCH_CANDIDATES = 40
+
 
 class OneMangaScraper(BaseScraper):
     """Scraper for 1manga.co"""
     
     name = "1manga.co"
     base_url = "https://1manga.co"
+    # Pages come back without ETag/Last-Modified, so reruns and resumed
+    # downloads within five minutes reuse the HTML instead of refetching
+    html_cache_ttl = 300
     
     def __init__(self):
         super().__init__()
@@ -39,20 +70,21 @@ class OneMangaScraper(BaseScraper):
         url = f"{self.base_url}/search?keyword={quote_plus(query)}"
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            page_html = self._get_html(url)
         except Exception as e:
             logger.error(f"Search request failed: {e}")
             return []
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = self._html_tree(page_html)
+        if tree is None:
+            return []
         results = []
         
         # Find manga links in search results (prefer links with text from media-heading)
         seen_urls = set()
         manga_data = {}  # url -> (title, cover)
         
-        manga_links = soup.find_all("a", href=lambda x: x and "/manga/" in x)
+        manga_links = _MANGA_LINKS(tree)
         
         for link in manga_links:
             href = link.get("href", "")
@@ -60,18 +92,24 @@ class OneMangaScraper(BaseScraper):
                 continue
             
             # Skip navigation links
-            if href.endswith("/manga/") or "/manga-" in href or href.count("/") < 3:
+            if _NAV_HREF_RE.search(href) or href.count("/") < 3:
                 continue
             
-            manga_url = href if href.startswith("http") else urljoin(self.base_url, href)
+            manga_url = self._make_absolute(href)
+            
+            # A card's cover and title links sit next to each other, so by
+            # the time a 41st series shows up the first 40 are complete.
+            # That leaves room for title-less entries dropped below.
+            if manga_url not in manga_data and len(manga_data) >= _SEARCH_CANDIDATES:
+                break
             
             # Get title from link text
-            title = link.get_text(strip=True)
+            title = self._text_of(link)
             
             # Get cover image from link or nearby
             cover = None
-            img = link.find("img")
-            if img:
+            img = next(link.iter("img"), None)
+            if img is not None:
                 cover = img.get("src") or img.get("data-src")
             
             # Only add if we have a title, or update if this one has a better title
@@ -93,23 +131,26 @@ class OneMangaScraper(BaseScraper):
                     url=url,
                     cover_url=cover
                 ))
+                if len(results) == 20:
+                    break
         
-        return results[:20]
+        return results
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get list of chapters for a manga."""
         try:
-            response = self.session.get(manga_url, timeout=15)
-            response.raise_for_status()
+            page_html = self._get_html(manga_url)
         except Exception as e:
             logger.error(f"Failed to get chapters: {e}")
             return []
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = self._html_tree(page_html)
+        if tree is None:
+            return []
         chapters = []
         
         # Find chapter links
-        chapter_links = soup.find_all("a", href=lambda x: x and "/chapter/" in x)
+        chapter_links = _CHAPTER_LINKS(tree)
         seen_nums = set()
         
         for link in chapter_links:
@@ -119,23 +160,23 @@ class OneMangaScraper(BaseScraper):
             
             # Extract chapter number from text first (more reliable)
             # Pattern: #XXX-Title or Chapter XXX
-            text = link.get_text(strip=True)
+            text = self._text_of(link)
             chapter_num = None
             
             # Try text pattern #123- first (1manga specific)
-            match = re.search(r"#(\d+(?:\.\d+)?)-", text)
+            match = _HASH_NUM_RE.search(text)
             if match:
                 chapter_num = float(match.group(1))
             
             # Try "Chapter 123" pattern
             if chapter_num is None:
-                match = re.search(r"chapter\s*(\d+(?:\.\d+)?)", text, re.I)
+                match = _CHAPTER_TEXT_RE.search(text)
                 if match:
                     chapter_num = float(match.group(1))
             
             # Last resort: try URL pattern (but only short numbers to avoid weird IDs)
             if chapter_num is None:
-                match = re.search(r"chapter-(\d{1,4}(?:\.\d+)?)\b", href, re.I)
+                match = _CHAPTER_URL_RE.search(href)
                 if match:
                     chapter_num = float(match.group(1))
             
@@ -144,7 +185,7 @@ class OneMangaScraper(BaseScraper):
             
             seen_nums.add(chapter_num)
             
-            chapter_url = href if href.startswith("http") else urljoin(self.base_url, href)
+            chapter_url = self._make_absolute(href)
             
             # Clean up title
             title = text.strip()
@@ -157,41 +198,31 @@ class OneMangaScraper(BaseScraper):
                 url=chapter_url
             ))
         
-        # Sort by chapter number descending
+        # Sort by chapter number descending (seen_nums already deduped them)
         chapters.sort(key=lambda c: c.numeric, reverse=True)
-        
-        # Remove duplicates
-        unique_chapters = []
-        seen_nums = set()
-        for chapter in chapters:
-            if chapter.numeric not in seen_nums:
-                seen_nums.add(chapter.numeric)
-                unique_chapters.append(chapter)
-        
-        return unique_chapters
+        return chapters
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get image URLs for a chapter."""
         try:
-            response = self.session.get(chapter_url, timeout=15)
-            response.raise_for_status()
+            page_html = self._get_html(chapter_url)
         except Exception as e:
             logger.error(f"Failed to get chapter pages: {e}")
             return []
         
-        soup = BeautifulSoup(response.text, "html.parser")
         page_urls = []
-        
-        # Find manga images - look for MangaHub CDN images specifically
-        images = soup.find_all("img")
-        for img in images:
-            src = img.get("src") or img.get("data-src") or ""
-            
-            # Look for MangaHub CDN pattern: imgx.mghcdn.com
-            # Format: https://imgx.mghcdn.com/{manga}/{chapter}/{page}.jpg
-            if "mghcdn.com" in src:
-                if src not in page_urls:
-                    page_urls.append(src)
+        seen = set()
+        
+        # Pages are the MangaHub CDN images (imgx.mghcdn.com), which
+        # one regex pass over the raw HTML finds without building a tree
+        # Format: https://imgx.mghcdn.com/{manga}/{chapter}/{page}.jpg
+        for match in _MGHCDN_SRC_RE.finditer(page_html):
+            src = match.group(1)
+            if "&" in src:
+                src = html.unescape(src)
+            if src not in seen:
+                seen.add(src)
+                page_urls.append(src)
         
         return page_urls
     
@@ -204,17 +235,16 @@ class OneMangaScraper(BaseScraper):
         }
         
         try:
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            content = response.content
-            if len(content) < 1000:
-                logger.warning(f"Image too small ({len(content)} bytes): {url}")
+            with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                self._save_stream(response, path)
+            
+            # Checked on disk so the body never has to sit in memory
+            size = path.stat().st_size
+            if size < 1000:
+                logger.warning(f"Image too small ({size} bytes): {url}")
+                path.unlink(missing_ok=True)
                 return False
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(content)
             return True
         except Exception as e:
             logger.error(f"Failed to download image {url}: {e}")
@@ -5,9 +5,10 @@ Uses ThreadPoolExecutor to run Playwright sync API in a separate thread,
 avoiding conflicts with asyncio event loops (e.g., from rich library).
 """
 
+import os
 import time
 import logging
-from typing import Optional
+from typing import Callable, Optional
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from .base import BaseScraper
@@ -18,8 +19,28 @@ logger = logging.getLogger(__name__)
 _thread_local = threading.local()
 
 
+def _default_browser_workers() -> int:
+    """Browser threads per scraper class (``MEMANGA_BROWSER_WORKERS``, default 4)."""
+    try:
+        return max(1, int(os.environ.get("MEMANGA_BROWSER_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+def _drop_page():
+    """Close and forget the thread-local reusable page, if any."""
+    if hasattr(_thread_local, 'page'):
+        try:
+            _thread_local.page.close()
+        except Exception:
+            pass
+        del _thread_local.page
+
+
 def cleanup_browsers():
     """Close all thread-local Playwright browser instances."""
+    _drop_page()
+
     if hasattr(_thread_local, 'context'):
         try:
             _thread_local.context.close()
@@ -56,6 +77,20 @@ class PlaywrightScraper(BaseScraper):
     # browser thread — with 5+ such sources in the popular set, the
     # slow ones starve the rest and the search appears to hang.
 
+    # Resource types (Playwright's request.resource_type) aborted while
+    # fetching page content. `_get_page_content` only returns the HTML, and
+    # page URLs come from <img> attributes, so images, media and fonts are
+    # never needed. Stylesheets stay on by default since lazy loaders and
+    # challenge pages can depend on layout; scrapers may override the set
+    # (empty keeps everything). `_execute_js` pages are never blocked.
+    blocked_resource_types: frozenset = frozenset({"image", "media", "font"})
+
+    # Worker threads in each subclass's executor. Every thread lazily
+    # launches its own Firefox (see `_thread_local`), and threads are only
+    # spawned when the others are busy, so idle sources still cost one
+    # browser while concurrent calls to the same site run in parallel.
+    browser_workers: int = _default_browser_workers()
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         # Skip if a subclass explicitly defines its own executor (e.g.
@@ -63,11 +98,16 @@ class PlaywrightScraper(BaseScraper):
         # subclass would otherwise fall back to a shared one.
         if "_executor" not in cls.__dict__:
             cls._executor = ThreadPoolExecutor(
-                max_workers=1,
+                max_workers=cls.browser_workers,
                 thread_name_prefix=f"pw-{cls.__name__}",
             )
         if "_executor_lock" not in cls.__dict__:
-            cls._executor_lock = threading.Lock()
+            # One slot per worker thread, so a submitted task always has
+            # a free thread to start on right away
+            cls._executor_lock = threading.BoundedSemaphore(cls.browser_workers)
+        # Idents of this class's worker threads that launched a browser,
+        # so cleanup knows whether there is anything to shut down
+        cls._browser_threads = set()
 
     @classmethod
     def _run_serialized(cls, fn, *args, timeout: float, **kwargs):
@@ -76,8 +116,9 @@ class PlaywrightScraper(BaseScraper):
         ``Future.result(timeout=N)`` measures wall-clock from the ``submit``
         call, which means a queued task can blow its budget while waiting
         for the prior task to finish — a real bug when downloading many
-        chapters in parallel. Holding the lock around submit + wait
-        guarantees the timeout reflects actual work time only.
+        chapters in parallel. Holding one of the ``browser_workers`` slots
+        around submit + wait guarantees the timeout reflects actual work
+        time only.
         """
         with cls._executor_lock:
             future = cls._executor.submit(fn, *args, **kwargs)
@@ -108,6 +149,7 @@ class PlaywrightScraper(BaseScraper):
         cleanup_browsers()
 
         from playwright.sync_api import sync_playwright
+        from playwright_stealth import Stealth
         pw = sync_playwright().start()
         try:
             browser = pw.firefox.launch(headless=True)
@@ -115,6 +157,9 @@ class PlaywrightScraper(BaseScraper):
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
             )
+            # Registered once as a context init script, so every page
+            # opened on this context starts out patched
+            Stealth().apply_stealth_sync(context)
         except Exception:
             # Roll back the Playwright start so the next call can retry
             # cleanly instead of inheriting half-broken state.
@@ -128,63 +173,132 @@ class PlaywrightScraper(BaseScraper):
         _thread_local.playwright = pw
         _thread_local.browser = browser
         _thread_local.context = context
+        type(self)._browser_threads.add(threading.get_ident())
         return browser, context
 
-    def _fetch_page_content(self, url: str, wait_time: int = 2000, cookies: list = None) -> str:
-        """Internal: fetch page content (runs in thread) with retry."""
-        from playwright_stealth import Stealth
+    def _page_in_thread(self, blocked: frozenset = frozenset()):
+        """Get the thread-local page, opening it on first use.
 
+        Opening a page means a new renderer, so one page per thread is
+        kept and just navigated with ``goto``.
+        Callers must not close it; a fetch that fails drops it with
+        `_drop_page` so the retry gets a fresh one. ``blocked`` is the
+        set of resource types to abort; the route is only reinstalled
+        when it differs from what the page already has.
+        """
+        browser, context = self._get_browser_in_thread()
+        page = getattr(_thread_local, 'page', None)
+        if page is None or _thread_local.page_context is not context:
+            _drop_page()
+            page = context.new_page()
+            _thread_local.page = page
+            _thread_local.page_context = context
+            _thread_local.page_blocked = frozenset()
+
+        if blocked != _thread_local.page_blocked:
+            if _thread_local.page_blocked:
+                page.unroute("**/*")
+            if blocked:
+                page.route("**/*", self._abort_blocked)
+            _thread_local.page_blocked = blocked
+        return page
+
+    def _fetch_page_content(self, url: str, wait_time: int = 2000, cookies: list = None,
+                            wait_selector: Optional[str] = None,
+                            read: Optional[Callable] = None):
+        """Internal: fetch page content (runs in thread) with retry.
+
+        ``read(page)`` produces the result once the page has rendered;
+        the default is the serialized HTML from ``page.content()``.
+        """
         last_error = None
         for attempt in range(1, 4):
-            browser, context = self._get_browser_in_thread()
-            page = context.new_page()
             try:
-                Stealth().apply_stealth_sync(page)
-
+                page = self._page_in_thread(self.blocked_resource_types)
                 if cookies:
-                    context.add_cookies(cookies)
+                    _thread_local.page_context.add_cookies(cookies)
 
                 page.goto(url, wait_until="domcontentloaded", timeout=45000)
 
-                if wait_time > 0:
+                if wait_selector:
+                    # Return as soon as the content we parse has rendered;
+                    # on timeout take whatever is there, like the fixed wait.
+                    # "attached" rather than the default "visible": blocked
+                    # images never get a size but their src is already set
+                    try:
+                        page.wait_for_selector(wait_selector, state="attached", timeout=wait_time)
+                    except Exception as e:
+                        logger.debug(f"'{wait_selector}' not found on {url} after {wait_time}ms: {e}")
+                elif wait_time > 0:
                     page.wait_for_timeout(wait_time)
 
-                return page.content()
+                return read(page) if read else page.content()
             except Exception as e:
                 last_error = e
+                _drop_page()
                 if attempt < 3:
                     delay = attempt * 2
                     logger.debug(f"Playwright fetch attempt {attempt}/3 failed: {e}. Retrying in {delay}s...")
                     time.sleep(delay)
-            finally:
-                page.close()
 
         raise last_error
 
-    def _get_page_content(self, url: str, wait_time: int = 2000, cookies: list = None) -> str:
+    def _abort_blocked(self, route):
+        """Route handler: drop requests for ``blocked_resource_types``."""
+        if route.request.resource_type in self.blocked_resource_types:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _get_page_content(self, url: str, wait_time: int = 2000, cookies: list = None,
+                          wait_selector: Optional[str] = None) -> str:
         """
         Get page content using Playwright with stealth.
         Runs in a separate thread to avoid asyncio conflicts.
 
         Args:
             url: URL to fetch
-            wait_time: Extra wait time in ms after load
+            wait_time: Extra wait time in ms after load (the maximum wait
+                when ``wait_selector`` is given)
             cookies: Optional list of cookies to set
+            wait_selector: CSS selector to wait for instead of sleeping
+                the full ``wait_time``
+        """
+        return self._run_serialized(
+            self._fetch_page_content, url, wait_time, cookies, wait_selector, timeout=60,
+        )
+
+    def _scrape_selector(self, url: str, selector: str, script: str, wait_time: int = 2000,
+                         wait_selector: Optional[str] = None) -> list:
+        """
+        Map every element matching ``selector`` through ``script`` in the page.
+
+        For lookups that only need a few attributes (image srcs, link
+        hrefs), this returns them straight from the DOM, skipping the
+        ``page.content()`` serialization and the re-parse on our side.
+        Loading, waiting and retries work as in `_get_page_content`.
+
+        Args:
+            url: URL to fetch
+            selector: CSS selector of the elements to map
+            script: JS function given the element array, e.g.
+                ``"els => els.map(e => e.getAttribute('href'))"``; its
+                return value must be JSON-serializable
+            wait_time: As for `_get_page_content`
+            wait_selector: As for `_get_page_content`
         """
         return self._run_serialized(
-            self._fetch_page_content, url, wait_time, cookies, timeout=60,
+            self._fetch_page_content, url, wait_time, None, wait_selector,
+            lambda page: page.eval_on_selector_all(selector, script), timeout=60,
         )
 
     def _run_js_in_thread(self, url: str, script: str, wait_time: int = 2000):
         """Internal: execute JS on page (runs in thread) with retry."""
-        from playwright_stealth import Stealth
-
         last_error = None
         for attempt in range(1, 4):
-            browser, context = self._get_browser_in_thread()
-            page = context.new_page()
             try:
-                Stealth().apply_stealth_sync(page)
+                # Scripts may inspect loaded images, so nothing is blocked
+                page = self._page_in_thread()
                 page.goto(url, wait_until="domcontentloaded", timeout=45000)
 
                 if wait_time > 0:
@@ -193,12 +307,11 @@ class PlaywrightScraper(BaseScraper):
                 return page.evaluate(script)
             except Exception as e:
                 last_error = e
+                _drop_page()
                 if attempt < 3:
                     delay = attempt * 2
                     logger.debug(f"Playwright JS attempt {attempt}/3 failed: {e}. Retrying in {delay}s...")
                     time.sleep(delay)
-            finally:
-                page.close()
 
         raise last_error
 
@@ -233,8 +346,45 @@ class PlaywrightScraper(BaseScraper):
                 seen.add(sub)
                 if "_executor" in sub.__dict__:
                     try:
-                        sub._run_serialized(cleanup_browsers, timeout=10)
+                        sub._cleanup_worker_threads()
                     except Exception:
                         pass
                 _walk(sub)
         _walk(cls)
+
+    @classmethod
+    def _cleanup_worker_threads(cls, timeout: float = 10):
+        """Run cleanup_browsers on every worker thread of this class.
+
+        Tasks can't be aimed at a given pool thread, so one is submitted
+        per ``browser_workers`` slot and each waits on a barrier after
+        cleaning up: all of them are in flight at once, which takes every
+        thread the pool has (spawning any it hasn't yet). Every slot is
+        held meanwhile so no fetch runs during teardown. Skipped when no
+        thread ever launched a browser.
+        """
+        if not cls._browser_threads:
+            return
+        workers = cls.browser_workers
+        held = 0
+        try:
+            for _ in range(workers):
+                if not cls._executor_lock.acquire(timeout=timeout):
+                    break
+                held += 1
+            barrier = threading.Barrier(workers)
+
+            def _clean():
+                cleanup_browsers()
+                cls._browser_threads.discard(threading.get_ident())
+                try:
+                    barrier.wait(timeout=timeout)
+                except threading.BrokenBarrierError:
+                    pass
+
+            futures = [cls._executor.submit(_clean) for _ in range(workers)]
+            for future in futures:
+                future.result(timeout=timeout * 2)
+        finally:
+            for _ in range(held):
+                cls._executor_lock.release()
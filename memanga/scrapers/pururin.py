@@ -10,10 +10,34 @@ import re
 from typing import List
 from urllib.parse import quote
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .playwright_base import PlaywrightScraper
-from .base import Chapter, Manga
+from .base import Chapter, Manga, xpath_has_class, xpath_img_sources
+
+_GALLERY_ID_RE = re.compile(r'/gallery/(\d+)')
+
+# XPath forms of the CSS selectors this scraper used with bs4, compiled once
+# '.gallery-item, .gallery, .card'
+_SEARCH_ITEMS = etree.XPath(
+    f'//*[{xpath_has_class("gallery-item")} or {xpath_has_class("gallery")}'
+    f' or {xpath_has_class("card")}]'
+)
+_ITEM_GALLERY_LINK = etree.XPath('.//a[contains(@href, "/gallery/")]')
+# '.title, h3, h4, .card-title'
+_ITEM_TITLE = etree.XPath(
+    f'.//*[{xpath_has_class("title")} or self::h3 or self::h4 or {xpath_has_class("card-title")}]'
+)
+# src/data-src of '.gallery-image img, .page-img, img[data-src*="cdn"]'
+_GALLERY_IMAGE_SOURCES = etree.XPath(xpath_img_sources(
+    f'//*[{xpath_has_class("gallery-image")}]//img | //*[{xpath_has_class("page-img")}]'
+    ' | //img[contains(@data-src, "cdn")]'
+), smart_strings=False)
+_READER_LINKS = etree.XPath('//a[contains(@href, "/read/") or contains(@href, "/view/")]')
+# 'img[src*="cdn"], .main-image img'
+_READER_IMAGE = etree.XPath(
+    f'//img[contains(@src, "cdn")] | //*[{xpath_has_class("main-image")}]//img'
+)
 
 
 class PururinScraper(PlaywrightScraper):
@@ -26,40 +50,44 @@ class PururinScraper(PlaywrightScraper):
         """Search for doujin."""
         search_url = f"{self.base_url}/search?q={quote(query)}"
         
-        html = self._get_page_content(search_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._get_page_content(
+            search_url, wait_time=5000, wait_selector='a[href*="/gallery/"]')
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         
         results = []
         seen = set()
         
         # Gallery items
-        for item in soup.select('.gallery-item, .gallery, .card'):
-            link = item.select_one('a[href*="/gallery/"]')
-            if not link:
+        for item in _SEARCH_ITEMS(tree):
+            links = _ITEM_GALLERY_LINK(item)
+            if not links:
                 continue
+            link = links[0]
             
             href = link.get('href', '')
             if not href or href in seen:
                 continue
             
             seen.add(href)
-            full_url = href if href.startswith('http') else f"{self.base_url}{href}"
+            full_url = self._make_absolute(href)
             
             # Get title
-            title_el = item.select_one('.title, h3, h4, .card-title')
-            title = title_el.get_text(strip=True) if title_el else ''
+            title_els = _ITEM_TITLE(item)
+            title = self._text_of(title_els[0]) if title_els else ''
             
             if not title:
-                title = link.get('title', '') or link.get_text(strip=True)
+                title = link.get('title', '') or self._text_of(link)
             
             title = title.strip()
             if not title or len(title) < 2:
                 continue
             
             # Get cover
-            img = item.select_one('img')
+            img = next(item.iter('img'), None)
             cover_url = None
-            if img:
+            if img is not None:
                 cover_url = img.get('src') or img.get('data-src')
             
             results.append(Manga(
@@ -67,8 +95,10 @@ class PururinScraper(PlaywrightScraper):
                 url=full_url,
                 cover_url=cover_url,
             ))
+            if len(results) == 20:
+                break
         
-        return results[:20]
+        return results
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """
@@ -76,7 +106,7 @@ class PururinScraper(PlaywrightScraper):
         Returns a single chapter representing the full gallery.
         """
         # Extract gallery ID from URL
-        match = re.search(r'/gallery/(\d+)', manga_url)
+        match = _GALLERY_ID_RE.search(manga_url)
         gallery_id = match.group(1) if match else "1"
         
         return [Chapter(
@@ -87,31 +117,41 @@ class PururinScraper(PlaywrightScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a gallery."""
-        html = self._get_page_content(chapter_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        html = self._get_page_content(
+            chapter_url, wait_time=5000,
+            wait_selector='.gallery-image img, .page-img, img[data-src*="cdn"], '
+                          'a[href*="/read/"], a[href*="/view/"]')
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         
         pages = []
+        seen = set()
         
         # Try to find gallery images
-        for img in soup.select('.gallery-image img, .page-img, img[data-src*="cdn"]'):
-            src = img.get('src') or img.get('data-src')
-            if src and src not in pages:
+        for src in _GALLERY_IMAGE_SOURCES(tree):
+            if src not in seen:
+                seen.add(src)
                 pages.append(src)
         
         # If no direct images, look for thumbnail links to full images
         if not pages:
-            for link in soup.select('a[href*="/read/"], a[href*="/view/"]'):
+            for link in _READER_LINKS(tree):
                 href = link.get('href', '')
                 if href:
                     # Try to extract full image URL from page
-                    full_url = href if href.startswith('http') else f"{self.base_url}{href}"
+                    full_url = self._make_absolute(href)
                     try:
-                        page_html = self._get_page_content(full_url, wait_time=2000)
-                        page_soup = BeautifulSoup(page_html, 'html.parser')
-                        img = page_soup.select_one('img[src*="cdn"], .main-image img')
-                        if img:
+                        page_html = self._get_page_content(
+                            full_url, wait_time=2000,
+                            wait_selector='img[src*="cdn"], .main-image img')
+                        page_tree = self._html_tree(page_html)
+                        imgs = _READER_IMAGE(page_tree) if page_tree is not None else []
+                        if imgs:
+                            img = imgs[0]
                             src = img.get('src') or img.get('data-src')
-                            if src and src not in pages:
+                            if src and src not in seen:
+                                seen.add(src)
                                 pages.append(src)
                     except:
                         pass
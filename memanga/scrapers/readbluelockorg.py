@@ -7,15 +7,28 @@ Images hosted on images.asuratoon.top CDN with lazy loading.
 
 import re
 from typing import List
-from bs4 import BeautifulSoup
+from lxml import etree
 from .base import BaseScraper, Chapter, Manga
 
+# hrefs of chapter links: contain /manga/ and, in any case, "chapter"
+_CHAPTER_HREFS = etree.XPath(
+    "//a[contains(@href, '/manga/')"
+    " and contains(translate(@href, 'CHAPTER', 'chapter'), 'chapter')]/@href",
+    smart_strings=False,
+)
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+(?:\.\d+)?)', re.I)
+
 
 class ReadBlueLockOrgScraper(BaseScraper):
     """Scraper for readbluelock.org - Blue Lock dedicated site."""
     
     name = "readbluelockorg"
     base_url = "https://readbluelock.org"
+    # The site sends no ETag/Last-Modified; reuse the chapter list for five
+    # minutes so update checks and the download that follows fetch it once
+    html_cache_ttl = 300
+    
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
     
     def __init__(self):
         super().__init__()
@@ -34,17 +47,19 @@ class ReadBlueLockOrgScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for the manga."""
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(self.base_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the homepage HTML."""
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         
         chapters = []
         seen = set()
         
         # Find all chapter links
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if "/manga/" not in href or "chapter" not in href.lower():
-                continue
-            
+        for href in _CHAPTER_HREFS(tree):
             # Normalize URL
             if not href.startswith("http"):
                 if href.startswith("/"):
@@ -53,7 +68,7 @@ class ReadBlueLockOrgScraper(BaseScraper):
                     href = self.base_url + "/" + href
             
             # Extract chapter number
-            match = re.search(r'chapter-(\d+(?:\.\d+)?)', href)
+            match = _CHAPTER_NUM_RE.search(href)
             if match:
                 number = match.group(1)
                 if number not in seen:
@@ -76,15 +91,12 @@ class ReadBlueLockOrgScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
-        
         pages = []
         seen = set()
         
-        for img in soup.find_all("img"):
+        for src, data_src in self._img_sources(html):
             # Use data-src for lazy loaded images, fallback to src
-            src = img.get("data-src") or img.get("src") or ""
-            src = src.strip()
+            src = (data_src or src).strip()
             
             # Filter for manga page images from asuratoon CDN
             if "asuratoon.top" in src and src not in seen:
@@ -95,18 +107,4 @@ class ReadBlueLockOrgScraper(BaseScraper):
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper Referer header."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
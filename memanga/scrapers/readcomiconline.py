@@ -8,8 +8,26 @@ import re
 from typing import List, Optional
 from urllib.parse import urljoin, quote
 
+from lxml import etree
+
 from .base import BaseScraper, Manga, Chapter
 
+_COMIC_SLUG_RE = re.compile(r'/Comic/([^/?]+)')
+_ISSUE_TEXT_RE = re.compile(r'(?:Issue|Chapter|Episode)\s*#?(\d+\.?\d*)', re.I)
+_ISSUE_URL_RE = re.compile(r'Issue-(\d+)|Chapter-(\d+)', re.I)
+_ID_RE = re.compile(r'id=(\d+)')
+_LINKS_CONTAINING = etree.XPath("//a[contains(@href, $needle)]")
+_SKIP_IMG_RE = re.compile(r'icon|logo|avatar', re.I)
+_LST_IMAGES_RE = re.compile(r'lstImages\.push\(["\']([^"\']+)["\']\)')
+# JavaScript arrays of page URLs, and the image URLs inside one
+_IMAGE_ARRAY_RES = (
+    re.compile(r'var\s+images\s*=\s*\[([^\]]+)\]', re.I),
+    re.compile(r'"images"\s*:\s*\[([^\]]+)\]', re.I),
+    re.compile(r'lstUrls\s*=\s*\[([^\]]+)\]', re.I),
+)
+_ARRAY_URL_RE = re.compile(
+    r'["\']?(https?://[^"\'>\s,]+(?:\.jpg|\.jpeg|\.png|\.webp)[^"\'>\s,]*)["\']?', re.I)
+
 
 class ReadComicOnlineScraper(BaseScraper):
     """Scraper for readcomiconline.li"""
@@ -41,7 +59,7 @@ class ReadComicOnlineScraper(BaseScraper):
                 print(f"GET search also failed: {e2}")
                 return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         results = []
         seen = set()
         
@@ -55,7 +73,7 @@ class ReadComicOnlineScraper(BaseScraper):
             if '?id=' in href or '/Issue' in href or '/Chapter' in href:
                 continue
             
-            match = re.search(r'/Comic/([^/?]+)', href)
+            match = _COMIC_SLUG_RE.search(href)
             if not match:
                 continue
             slug = match.group(1)
@@ -92,49 +110,51 @@ class ReadComicOnlineScraper(BaseScraper):
                 url=manga_url,
                 cover_url=cover_url,
             ))
+            if len(results) == 20:
+                break
         
-        return results[:20]
+        return results
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get chapters/issues for a comic"""
-        from bs4 import BeautifulSoup
-        
         try:
             html = self._get_html(manga_url)
         except Exception as e:
             print(f"Failed to get comic page: {e}")
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         chapters = []
         seen = set()
         
         # Extract comic slug from URL
-        slug_match = re.search(r'/Comic/([^/?]+)', manga_url)
+        slug_match = _COMIC_SLUG_RE.search(manga_url)
         if not slug_match:
             return []
         comic_slug = slug_match.group(1)
         
         # Find issue/chapter links
-        for link in soup.select(f'a[href*="/Comic/{comic_slug}/"]'):
+        for link in _LINKS_CONTAINING(tree, needle=f"/Comic/{comic_slug}/"):
             href = link.get('href', '')
             if href in seen or '?id=' not in href:
                 continue
             seen.add(href)
             
             # Extract issue number from text
-            text = link.get_text(strip=True)
-            match = re.search(r'(?:Issue|Chapter|Episode)\s*#?(\d+\.?\d*)', text, re.I)
+            text = self._text_of(link)
+            match = _ISSUE_TEXT_RE.search(text)
             if match:
                 chapter_num = match.group(1)
             else:
                 # Try from URL
-                url_match = re.search(r'Issue-(\d+)|Chapter-(\d+)', href, re.I)
+                url_match = _ISSUE_URL_RE.search(href)
                 if url_match:
                     chapter_num = url_match.group(1) or url_match.group(2)
                 else:
                     # Use id parameter
-                    id_match = re.search(r'id=(\d+)', href)
+                    id_match = _ID_RE.search(href)
                     if id_match:
                         chapter_num = id_match.group(1)
                     else:
@@ -157,7 +177,7 @@ class ReadComicOnlineScraper(BaseScraper):
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get page images for a chapter/issue"""
-        from bs4 import BeautifulSoup
+        from bs4 import BeautifulSoup, SoupStrainer
         
         try:
             html = self._get_html(chapter_url)
@@ -165,46 +185,45 @@ class ReadComicOnlineScraper(BaseScraper):
             print(f"Failed to get chapter page: {e}")
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        pages = []
-        
         # ReadComicOnline uses JavaScript to load images
-        # Pattern 1: lstImages JavaScript array
-        for match in re.findall(r'lstImages\.push\(["\']([^"\']+)["\']\)', html):
-            if match not in pages:
-                pages.append(match)
+        # Pattern 1: lstImages JavaScript array. It is the reader's own page
+        # list, so when present the document is never parsed at all.
+        pages = list(dict.fromkeys(_LST_IMAGES_RE.findall(html)))
+        if pages:
+            return pages
+        
+        # The regexes below read the raw HTML; the soup only needs the <img> tags
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('img'))
+        seen = set()
         
         # Pattern 2: Look for image URLs in data attributes
         for img in soup.select('img[data-src], img.js-page'):
             src = img.get('data-src') or img.get('src')
-            if src and src not in pages:
-                if not any(skip in src.lower() for skip in ['icon', 'logo', 'avatar']):
-                    if not src.startswith('http'):
-                        src = urljoin(self.base_url, src)
+            if src and not _SKIP_IMG_RE.search(src):
+                if not src.startswith('http'):
+                    src = urljoin(self.base_url, src)
+                if src not in seen:
+                    seen.add(src)
                     pages.append(src)
         
         # Pattern 3: Look in JavaScript variables
-        var_patterns = [
-            r'var\s+images\s*=\s*\[([^\]]+)\]',
-            r'"images"\s*:\s*\[([^\]]+)\]',
-            r'lstUrls\s*=\s*\[([^\]]+)\]',
-        ]
-        
-        for pattern in var_patterns:
-            var_match = re.search(pattern, html, re.I)
+        for array_re in _IMAGE_ARRAY_RES:
+            var_match = array_re.search(html)
             if var_match:
                 array_content = var_match.group(1)
-                url_pattern = r'["\']?(https?://[^"\'>\s,]+(?:\.jpg|\.jpeg|\.png|\.webp)[^"\'>\s,]*)["\']?'
-                for url in re.findall(url_pattern, array_content, re.I):
-                    if url not in pages:
+                for url in _ARRAY_URL_RE.findall(array_content):
+                    if url not in seen:
+                        seen.add(url)
                         pages.append(url)
         
         # Pattern 4: imgCurrent or chapter-img class
         for img in soup.select('#imgCurrent, .chapter-img'):
             src = img.get('src') or img.get('data-src')
-            if src and src not in pages:
+            if src:
                 if not src.startswith('http'):
                     src = urljoin(self.base_url, src)
-                pages.append(src)
+                if src not in seen:
+                    seen.add(src)
+                    pages.append(src)
         
         return pages
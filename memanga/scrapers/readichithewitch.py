@@ -6,15 +6,23 @@ Uses custom CDN at cdn.readichithewitch.com/file/mangap/...
 
 import re
 from typing import List
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import BaseScraper, Chapter, Manga
 
+_LINKS = SoupStrainer("a", href=True)
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+(?:\.\d+)?)', re.I)
+
 
 class ReadIchiTheWitchScraper(BaseScraper):
     """Scraper for readichithewitch.com - Ichi the Witch manga."""
     
     name = "readichithewitch"
     base_url = "https://ww1.readichithewitch.com"
+    # The site sends no ETag/Last-Modified; reuse the chapter list for five
+    # minutes so update checks and the download that follows fetch it once
+    html_cache_ttl = 300
+    
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
     
     def __init__(self):
         super().__init__()
@@ -34,7 +42,11 @@ class ReadIchiTheWitchScraper(BaseScraper):
         """Get all chapters."""
         manga_page = f"{self.base_url}/manga/ichi-the-witch/"
         html = self._get_html(manga_page)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(manga_page, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the manga page HTML."""
+        soup = BeautifulSoup(html, "lxml", parse_only=_LINKS)
         
         chapters = []
         seen = set()
@@ -55,7 +67,7 @@ class ReadIchiTheWitchScraper(BaseScraper):
                 href = self.base_url + href
             
             # Extract chapter number
-            match = re.search(r'chapter-(\d+(?:\.\d+)?)', href.lower())
+            match = _CHAPTER_NUM_RE.search(href)
             number = match.group(1) if match else "0"
             
             chapters.append(Chapter(
@@ -71,15 +83,12 @@ class ReadIchiTheWitchScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs from CDN."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
-        
         pages = []
         seen = set()
         
         # Find images from cdn.readichithewitch.com
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src") or ""
-            src = src.strip()
+        for src, data_src in self._img_sources(html):
+            src = (src or data_src).strip()
             
             # Accept cdn.readichithewitch.com images
             if "cdn.readichithewitch.com" in src:
@@ -91,18 +100,4 @@ class ReadIchiTheWitchScraper(BaseScraper):
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
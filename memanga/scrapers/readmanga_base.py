@@ -7,9 +7,21 @@ Sites: readsnk.com, readberserk.com, readhaikyuu.com, readjujutsukaisen.com, rea
 
 import re
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from .base import BaseScraper, Chapter, Manga
 
+# Only <a href> subtrees are built when parsing search results; the rest
+# of the page (scripts, sidebars, comments) is skipped by the tree builder
+_LINKS = SoupStrainer("a", href=True)
+_CHAPTER_LINKS = etree.XPath("//a[contains(@href, '/chapter/')]")
+
+_URL_CHAPTER_RE = re.compile(r'chapter[/-](\d+(?:\.\d+)?)', re.I)
+_TEXT_CHAPTER_RE = re.compile(r'chapter\s*(\d+(?:\.\d+)?)', re.I)
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+# CDN hosts shared by the whole family; a site's cdn_pattern is added on top
+_CDN_PATTERN = r"cdn\.(read|manga)|mangap/|/file/|AnimeRleases"
+
 
 class ReadMangaBaseScraper(BaseScraper):
     """
@@ -23,30 +35,30 @@ class ReadMangaBaseScraper(BaseScraper):
     base_url: str = ""
     cdn_pattern: str = ""  # Pattern to match CDN URLs in images
     
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
+    
     def __init__(self):
         super().__init__()
         # These sites need Referer header for images
         self.session.headers.update({
             "Referer": self.base_url,
         })
+        cdn = f"{_CDN_PATTERN}|{self.cdn_pattern}" if self.cdn_pattern else _CDN_PATTERN
+        self._cdn_re = re.compile(cdn, re.I)
     
-    def _make_absolute(self, url: str) -> str:
-        """Convert relative URL to absolute."""
-        if not url:
-            return url
-        if url.startswith("http"):
-            return url
-        if url.startswith("/"):
-            return self.base_url + url
-        return self.base_url + "/" + url
+    @staticmethod
+    def _parse(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a page with the C-backed lxml parser (the single place to change it)."""
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
     
     def search(self, query: str) -> List[Manga]:
         """Search for manga."""
         search_url = f"{self.base_url}/?s={query.replace(' ', '+')}"
         html = self._get_html(search_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html, _LINKS)
         
         results = []
+        seen_urls = set()
         # These sites typically have manga links in search results
         for item in soup.select("a[href*='/manga/']"):
             href = item.get("href", "")
@@ -63,31 +75,42 @@ class ReadMangaBaseScraper(BaseScraper):
                 if img:
                     title = img.get("alt", "")
             
-            if title and href:
-                # Avoid duplicates
-                if not any(m.url == href for m in results):
-                    cover = None
-                    img = item.find("img")
-                    if img:
-                        cover = img.get("data-src") or img.get("src")
-                        cover = self._make_absolute(cover)
-                    
-                    results.append(Manga(
-                        title=title,
-                        url=href,
-                        cover_url=cover,
-                    ))
+            # Avoid duplicates
+            if not title or href in seen_urls:
+                continue
+            seen_urls.add(href)
+            
+            cover = None
+            img = item.find("img")
+            if img:
+                cover = img.get("data-src") or img.get("src")
+                cover = self._make_absolute(cover)
+            
+            results.append(Manga(
+                title=title,
+                url=href,
+                cover_url=cover,
+            ))
+            if len(results) == 20:  # Limit results
+                break
         
-        return results[:20]  # Limit results
+        return results
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(manga_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from a manga page's HTML."""
+        tree = self._html_tree(html)
+        if tree is None:
+            return []
         
         chapters = []
+        seen_urls = set()
         # Look for chapter links
-        for link in soup.select("a[href*='/chapter/']"):
+        for link in _CHAPTER_LINKS(tree):
             href = link.get("href", "")
             if not href:
                 continue
@@ -95,31 +118,34 @@ class ReadMangaBaseScraper(BaseScraper):
             # Make URL absolute
             href = self._make_absolute(href)
             
+            # Avoid duplicates
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            
             # Extract chapter number from URL or text
-            text = link.get_text(strip=True)
+            text = self._text_of(link)
             
             # Try to extract number from URL first
             # Pattern: chapter-name-chapter-123 or chapter-name-123
-            match = re.search(r'chapter[/-](\d+(?:\.\d+)?)', href.lower())
+            match = _URL_CHAPTER_RE.search(href)
             if match:
                 number = match.group(1)
             else:
                 # Try from text
-                match = re.search(r'chapter\s*(\d+(?:\.\d+)?)', text.lower())
+                match = _TEXT_CHAPTER_RE.search(text)
                 if match:
                     number = match.group(1)
                 else:
                     # Extract any number
-                    match = re.search(r'(\d+(?:\.\d+)?)', text)
+                    match = _NUMBER_RE.search(text)
                     number = match.group(1) if match else "0"
             
-            # Avoid duplicates
-            if not any(c.url == href for c in chapters):
-                chapters.append(Chapter(
-                    number=number,
-                    title=text,
-                    url=href,
-                ))
+            chapters.append(Chapter(
+                number=number,
+                title=text,
+                url=href,
+            ))
         
         # Sort by chapter number (descending is typical for these sites)
         chapters.sort(key=lambda c: c.numeric, reverse=True)
@@ -128,14 +154,12 @@ class ReadMangaBaseScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
-        
         pages = []
         seen_urls = set()
         
         # Find manga images by looking for CDN URLs
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src") or ""
+        for src, data_src in self._img_sources(html):
+            src = src or data_src
             
             # Check if it's a manga page image (CDN URL pattern)
             if self._is_manga_image(src):
@@ -150,37 +174,9 @@ class ReadMangaBaseScraper(BaseScraper):
         if not url:
             return False
         
-        # Check for CDN patterns
-        patterns = [
-            r"cdn\.(read|manga)",
-            r"mangap/",
-            r"/file/",
-            r"AnimeRleases",
-        ]
-        
-        if self.cdn_pattern:
-            patterns.append(self.cdn_pattern)
-        
-        for pattern in patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        
-        return False
+        # One alternation of every CDN pattern, compiled in __init__
+        return self._cdn_re.search(url) is not None
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper Referer header."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
@@ -248,6 +248,7 @@ _cfg_trigun = {
     "base_url": "https://trigunmanga.com",
     "manga_title": "Trigun",
     "image_cdn_filters": ["blogger.googleusercontent.com"],
+    "page_workers": 8,
 }
 
 _cfg_tomie = {
@@ -380,6 +381,7 @@ _cfg_sxfmanga = {
     "manga_slug": "spy-x-family",
     "is_single_manga": True,
     "image_cdn_filters": ["img.spoilerhat.com", "mangafox"],
+    "page_workers": 8,
 }
 
 _cfg_mashlemanga = {
@@ -7,9 +7,16 @@ Images hosted on multiple CDNs (mangaclash, readkakegurui).
 
 import re
 from typing import List
-from bs4 import BeautifulSoup
+from lxml import etree
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_HREFS = etree.XPath("//a[contains(@href, '/chapters/')]/@href", smart_strings=False)
+_CHAPTER_NUM_RE = re.compile(r'/chapters/(\d+)')
+# Page CDNs (older chapters: mangaclash, newer: readkakegurui) and the
+# placeholder images they also serve
+_PAGE_HOST_RE = re.compile(r'mangaclash\.com|readkakegurui\.com')
+_PLACEHOLDER_RE = re.compile(r'/logo|/pomodoro')
+
 
 class SakamotoMangaScraper(BaseScraper):
     """Scraper for sakamotomanga.com - Sakamoto Days dedicated site."""
@@ -17,6 +24,8 @@ class SakamotoMangaScraper(BaseScraper):
     name = "sakamotomanga"
     base_url = "https://sakamotomanga.com"
     
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
+    
     def __init__(self):
         super().__init__()
         self.session.headers.update({
@@ -33,81 +42,45 @@ class SakamotoMangaScraper(BaseScraper):
     
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for the manga."""
-        # Homepage only shows recent chapters, but we can probe for all
-        # Based on testing, chapters go from 1 to 238+
-        chapters = []
-        
         # First, get chapters listed on homepage
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
-        
-        seen = set()
+        return self._parse_once(self.base_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list implied by the newest chapter on the homepage."""
+        # Homepage only shows recent chapters, but we can probe for all
+        # Based on testing, chapters go from 1 to 238+
+        tree = self._html_tree(html)
         max_chapter = 1
         
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if "/chapters/" not in href:
-                continue
-            
-            match = re.search(r'/chapters/(\d+)', href)
+        for href in _CHAPTER_HREFS(tree) if tree is not None else ():
+            match = _CHAPTER_NUM_RE.search(href)
             if match:
-                number = int(match.group(1))
-                max_chapter = max(max_chapter, number)
-                if str(number) not in seen:
-                    seen.add(str(number))
+                max_chapter = max(max_chapter, int(match.group(1)))
         
         # Generate all chapters from 1 to max
-        for i in range(1, max_chapter + 1):
-            chapter_url = f"{self.base_url}/sakamoto-days/manga/chapters/{i}"
-            chapters.append(Chapter(
-                number=str(i),
-                title=f"Chapter {i}",
-                url=chapter_url,
-            ))
-        
-        return chapters
+        chapters_url = f"{self.base_url}/sakamoto-days/manga/chapters"
+        return [
+            Chapter(number=str(i), title=f"Chapter {i}", url=f"{chapters_url}/{i}")
+            for i in range(1, max_chapter + 1)
+        ]
     
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
-        
         pages = []
         seen = set()
         
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src") or ""
-            src = src.strip()
-            
-            # Filter for manga page images from multiple CDNs
-            # Older chapters: mangaclash, Newer chapters: readkakegurui
-            is_manga_image = (
-                "mangaclash.com" in src or
-                "readkakegurui.com" in src
-            )
+        for src, data_src in self._img_sources(html):
+            src = (src or data_src).strip()
             
-            if is_manga_image and src not in seen:
-                # Skip placeholder images
-                if "/logo" not in src and "/pomodoro" not in src:
-                    seen.add(src)
-                    pages.append(src)
+            if src in seen or not _PAGE_HOST_RE.search(src) or _PLACEHOLDER_RE.search(src):
+                continue
+            seen.add(src)
+            pages.append(src)
         
         return pages
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper Referer header."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
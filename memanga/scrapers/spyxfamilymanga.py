@@ -6,15 +6,23 @@ Uses custom WordPress theme, images hosted on cdn3.mangaclash.com.
 
 import re
 from typing import List
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_RE = re.compile(r'chapter-(\d+(?:[.-]\d+)?)')
+# Page images are served from mangaclash; other <img>s are site chrome
+_PAGE_IMGS = sv.compile('img[src*="mangaclash.com"], img[data-src*="mangaclash.com"]')
+
 
 class SpyXFamilyMangaScraper(BaseScraper):
     """Scraper for spyxfamilymanga.org - Spy x Family manga."""
     
     name = "spyxfamilymanga"
     base_url = "https://spyxfamilymanga.org"
+    page_workers = 8
+    
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
     
     def __init__(self):
         super().__init__()
@@ -33,7 +41,11 @@ class SpyXFamilyMangaScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters from the manga page."""
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(self.base_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the homepage HTML."""
+        soup = BeautifulSoup(html, "lxml")
         
         chapters = []
         seen = set()
@@ -59,7 +71,7 @@ class SpyXFamilyMangaScraper(BaseScraper):
                 href = self.base_url + href
             
             # Extract chapter number
-            match = re.search(r'chapter-(\d+(?:[.-]\d+)?)', href.lower())
+            match = _CHAPTER_RE.search(href.lower())
             number = match.group(1).replace("-", ".") if match else "0"
             
             chapters.append(Chapter(
@@ -75,37 +87,22 @@ class SpyXFamilyMangaScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs from cdn3.mangaclash.com."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         seen = set()
         
-        # Find images with manga-image class or from mangaclash CDN
-        for img in soup.find_all("img"):
+        for img in _PAGE_IMGS.select(soup):
             src = img.get("data-src") or img.get("src") or ""
             src = src.strip()
             
-            if "cdn3.mangaclash.com" in src or "mangaclash.com" in src:
-                if src not in seen:
-                    seen.add(src)
-                    pages.append(src)
+            # data-src wins, so the host may still be on the other attribute
+            if "mangaclash.com" in src and src not in seen:
+                seen.add(src)
+                pages.append(src)
         
         return pages
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
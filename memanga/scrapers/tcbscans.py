@@ -7,6 +7,10 @@ import re
 from typing import List
 from .base import BaseScraper, Chapter, Manga
 
+# Chapter number from a link title: "Chapter 12", else any number
+_CHAPTER_NAMED_RE = re.compile(r'chapter[.\s-]*(\d+\.?\d*)', re.I)
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+
 
 class TCBScansScraper(BaseScraper):
     """Scraper for TCB Scans - One Piece, Jujutsu Kaisen, My Hero Academia, etc."""
@@ -19,7 +23,7 @@ class TCBScansScraper(BaseScraper):
         from bs4 import BeautifulSoup
         
         html = self._get_html(f"{self.base_url}/projects")
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         query_lower = query.lower()
@@ -55,7 +59,7 @@ class TCBScansScraper(BaseScraper):
         from bs4 import BeautifulSoup
         
         html = self._get_html(manga_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         chapters = []
         
@@ -75,9 +79,9 @@ class TCBScansScraper(BaseScraper):
             full_title = f"{title_text}: {subtitle_text}" if subtitle_text else title_text
             
             # Extract chapter number
-            match = re.search(r'chapter[.\s-]*(\d+\.?\d*)', title_text, re.I)
+            match = _CHAPTER_NAMED_RE.search(title_text)
             if not match:
-                match = re.search(r'(\d+\.?\d*)', title_text)
+                match = _NUM_RE.search(title_text)
             
             chapter_num = match.group(1) if match else "0"
             
@@ -103,7 +107,7 @@ class TCBScansScraper(BaseScraper):
         from bs4 import BeautifulSoup
         
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         
@@ -18,8 +18,18 @@ import re
 from typing import List
 from pathlib import Path
 from bs4 import BeautifulSoup
+from lxml import etree
 from ..base import BaseScraper, Chapter, Manga
 
+_CHAPTER_RE = re.compile(r'chapter[- ]?(\d+(?:\.\d+)?)')
+# Blogger size segments, rewritten to full resolution
+_BLOGGER_SIZE_RE = re.compile(r'/s\d+/')
+_BLOGGER_BOX_RE = re.compile(r'/w\d+-h\d+/')
+# Page lookups only read attributes, so they run on the lxml tree
+_IMGS = etree.XPath("//img")
+_META_IMAGES = etree.XPath("//meta[@property=$prop or @name=$prop]/@content",
+                           smart_strings=False)
+
 
 class OGImageMetaScraper(BaseScraper):
     """Template for sites using og:image/twitter:image meta tags for page images."""
@@ -31,6 +41,7 @@ class OGImageMetaScraper(BaseScraper):
     cover_url: str = ""
     uses_cloudscraper: bool = False
     normalize_blogger: bool = True
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
 
     def __init__(self):
         super().__init__()
@@ -57,16 +68,21 @@ class OGImageMetaScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get chapters from homepage links."""
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(self.base_url, html, self._parse_chapters)
+
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the homepage HTML."""
+        soup = BeautifulSoup(html, "lxml")
 
         chapters = []
         seen = set()
 
+        link_re = re.compile(self.chapter_link_pattern, re.IGNORECASE)
         for link in soup.find_all("a", href=True):
             href = link["href"]
             if href in seen:
                 continue
-            if not re.search(self.chapter_link_pattern, href, re.IGNORECASE):
+            if not link_re.search(href):
                 continue
             seen.add(href)
 
@@ -79,7 +95,7 @@ class OGImageMetaScraper(BaseScraper):
                 href = self.base_url.rstrip("/") + "/" + href.lstrip("/")
 
             # Extract chapter number
-            match = re.search(r'chapter[- ]?(\d+(?:\.\d+)?)', href.lower())
+            match = _CHAPTER_RE.search(href.lower())
             number = match.group(1) if match else "0"
 
             chapters.append(Chapter(
@@ -93,14 +109,15 @@ class OGImageMetaScraper(BaseScraper):
 
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get page images from img tags and og:image meta tags."""
-        html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        tree = self._html_tree(self._get_html(chapter_url))
+        if tree is None:
+            return []
 
         pages = []
         seen = set()
 
         # 1. Primary: scan img tags (most reliable for actual chapter pages)
-        for img in soup.find_all("img"):
+        for img in _IMGS(tree):
             url = (img.get("data-lazy-src") or img.get("data-src")
                    or img.get("src") or "")
             if url and self._is_cdn_image(url) and url not in seen:
@@ -110,8 +127,7 @@ class OGImageMetaScraper(BaseScraper):
         # 2. Fallback: og:image/twitter:image meta tags (some sites use these)
         if not pages:
             for prop in ("og:image", "twitter:image"):
-                for meta in soup.select(f'meta[property="{prop}"], meta[name="{prop}"]'):
-                    url = meta.get("content", "")
+                for url in _META_IMAGES(tree, prop=prop):
                     if url and self._is_cdn_image(url) and url not in seen:
                         seen.add(url)
                         pages.append(self._normalize_url(url))
@@ -132,26 +148,27 @@ class OGImageMetaScraper(BaseScraper):
         """Normalize image URLs (e.g., Blogger resolution)."""
         if self.normalize_blogger and ("blogger.googleusercontent.com" in url or "bp.blogspot.com" in url):
             # Upgrade to max resolution
-            url = re.sub(r'/s\d+/', '/s1600/', url)
-            url = re.sub(r'/w\d+-h\d+/', '/s1600/', url)
+            url = _BLOGGER_SIZE_RE.sub('/s1600/', url)
+            url = _BLOGGER_BOX_RE.sub('/s1600/', url)
         return url
 
     def download_image(self, url: str, path: Path) -> bool:
         """Download image with Referer header."""
         try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            if len(response.content) < 1000:
+            if self.uses_cloudscraper:
+                # Keep the Cloudflare clearance cookies for the image host
+                response = self.session.get(url, headers=self.image_headers,
+                                            timeout=30, stream=True)
+            else:
+                response = self.image_session.get(url, timeout=30, stream=True)
+            with response:
+                response.raise_for_status()
+                self._save_stream(response, path)
+
+            # Tiny bodies are error placeholders, not pages
+            if path.stat().st_size < 1000:
+                path.unlink()
                 return False
-
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
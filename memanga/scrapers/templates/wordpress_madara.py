@@ -21,6 +21,8 @@ from urllib.parse import quote
 from bs4 import BeautifulSoup
 from ..base import BaseScraper, Chapter, Manga
 
+_CHAPTER_RE = re.compile(r'chapter[_\s-]*(\d+(?:\.\d+)?)')
+
 
 class WordPressMadaraScraper(BaseScraper):
     """Template for WordPress Madara theme sites."""
@@ -32,6 +34,7 @@ class WordPressMadaraScraper(BaseScraper):
     image_cdn_filters: list = []
     uses_cloudscraper: bool = False
     uses_ajax: bool = False
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
 
     def __init__(self):
         super().__init__()
@@ -57,7 +60,7 @@ class WordPressMadaraScraper(BaseScraper):
 
         search_url = f"{self.base_url}/?s={quote(query)}&post_type=wp-manga"
         html = self._get_html(search_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         results = []
         for item in soup.select(".post-title a, h3 a, h4 a"):
@@ -109,13 +112,13 @@ class WordPressMadaraScraper(BaseScraper):
         """Get chapters by parsing HTML directly."""
         try:
             html = self._get_html(manga_url)
-            return self._parse_chapter_links(html)
+            return self._parse_once(manga_url, html, self._parse_chapter_links)
         except Exception:
             return []
 
     def _parse_chapter_links(self, html: str) -> List[Chapter]:
         """Parse chapter links from HTML content."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         chapters = []
         seen = set()
 
@@ -138,9 +141,9 @@ class WordPressMadaraScraper(BaseScraper):
                 if not href.startswith("http"):
                     href = self.base_url.rstrip("/") + "/" + href.lstrip("/")
 
-                match = re.search(r'chapter[_\s-]*(\d+(?:\.\d+)?)', href.lower())
+                match = _CHAPTER_RE.search(href.lower())
                 if not match:
-                    match = re.search(r'chapter[_\s-]*(\d+(?:\.\d+)?)', text.lower())
+                    match = _CHAPTER_RE.search(text.lower())
                 number = match.group(1) if match else "0"
 
                 chapters.append(Chapter(number=number, title=text, url=href))
@@ -151,15 +154,24 @@ class WordPressMadaraScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get page images from reading-content area."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         pages = []
         seen = set()
 
         # Search in Madara reading containers
         container = soup.select_one(".reading-content") or soup
-
-        for img in container.find_all("img"):
+        if self.image_cdn_filters:
+            # Let the selector engine skip images from other hosts
+            imgs = container.select(", ".join(
+                f'img[{attr}*="{f}" i]'
+                for f in self.image_cdn_filters
+                for attr in ("data-src", "data-lazy-src", "src")
+            ))
+        else:
+            imgs = container.find_all("img")
+
+        for img in imgs:
             url = (img.get("data-src") or img.get("data-lazy-src")
                    or img.get("src") or "")
             url = url.strip()
@@ -194,19 +206,20 @@ class WordPressMadaraScraper(BaseScraper):
     def download_image(self, url: str, path: Path) -> bool:
         """Download image with Referer header."""
         try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            if len(response.content) < 1000:
+            if self.uses_cloudscraper:
+                # Keep the Cloudflare clearance cookies for the image host
+                response = self.session.get(url, headers=self.image_headers,
+                                            timeout=30, stream=True)
+            else:
+                response = self.image_session.get(url, timeout=30, stream=True)
+            with response:
+                response.raise_for_status()
+                self._save_stream(response, path)
+
+            # Tiny bodies are error placeholders, not pages
+            if path.stat().st_size < 1000:
+                path.unlink()
                 return False
-
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
             return True
         except Exception as e:
             print(f"Failed to download {url}: {e}")
@@ -6,15 +6,23 @@ Uses WordPress, images hosted in wp-content/uploads.
 
 import re
 from typing import List
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from .base import BaseScraper, Chapter, Manga
 
+_CHAPTER_RE = re.compile(r'chapter-(\d+(?:\.\d+)?)')
+# Chapter pages are WordPress uploads; other <img>s are site chrome
+_PAGE_IMGS = sv.compile('img[src*="wp-content/uploads"], img[data-src*="wp-content/uploads"]')
+
 
 class TGMangaScraper(BaseScraper):
     """Scraper for tgmanga.com - Tokyo Ghoul manga."""
     
     name = "tgmanga"
     base_url = "https://tgmanga.com"
+    page_workers = 8
+    
+    image_headers = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
     
     def __init__(self):
         super().__init__()
@@ -33,7 +41,11 @@ class TGMangaScraper(BaseScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters."""
         html = self._get_html(self.base_url)
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_once(self.base_url, html, self._parse_chapters)
+    
+    def _parse_chapters(self, html: str) -> List[Chapter]:
+        """Chapter list from the homepage HTML."""
+        soup = BeautifulSoup(html, "lxml")
         
         chapters = []
         seen = set()
@@ -54,7 +66,7 @@ class TGMangaScraper(BaseScraper):
                 href = self.base_url + href
             
             # Extract chapter number (format: tokyo-ghoul-chapter-143)
-            match = re.search(r'chapter-(\d+(?:\.\d+)?)', href.lower())
+            match = _CHAPTER_RE.search(href.lower())
             number = match.group(1) if match else "0"
             
             chapters.append(Chapter(
@@ -70,38 +82,24 @@ class TGMangaScraper(BaseScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs from wp-content/uploads."""
         html = self._get_html(chapter_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         seen = set()
         
         # Find images from wp-content/uploads (first img is usually the first page)
-        for img in soup.find_all("img"):
+        for img in _PAGE_IMGS.select(soup):
             src = img.get("src") or img.get("data-src") or ""
             src = src.strip()
             
             # Only accept wp-content/uploads images (chapter pages)
-            if "wp-content/uploads" in src and ".jpeg" in src.lower():
-                if src not in seen:
-                    seen.add(src)
-                    pages.append(src)
+            if ("wp-content/uploads" in src and ".jpeg" in src.lower()
+                    and src not in seen):
+                seen.add(src)
+                pages.append(src)
         
         return pages
     
     def download_image(self, url: str, path) -> bool:
         """Download image with proper headers."""
-        try:
-            headers = {
-                "Referer": self.base_url,
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            }
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        return self._download_with_image_session(url, path)
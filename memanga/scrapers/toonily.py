@@ -9,11 +9,34 @@ import re
 from typing import List
 from urllib.parse import urljoin, quote
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from .playwright_base import PlaywrightScraper
 from .base import Chapter, Manga
 
+# CSS selectors compiled once; several run per result item in search
+_BOOK_ITEMS = sv.compile('.book-item')
+_ITEM_LINK = sv.compile('a[href]')
+_ITEM_TITLE = sv.compile('.title, .name, h3, h4')
+_IMG = sv.compile('img')
+_ROOT_LINKS = sv.compile('a[href^="/"]')
+_CHAPTER_LINKS = sv.compile('a[href*="chapter"]')
+_READER_IMGS = sv.compile(
+    '.reading-content img, .chapter-content img, .page-break img, img[class*="chapter"]'
+)
+
+_SLUG_RE = re.compile(r'toonily\.me/([^/]+)')
+# Chapter number: from the href, then "Ch. 12" in the text, then any number
+_CHAPTER_NAMED_RE = re.compile(r'chapter[_\s-]*(\d+\.?\d*)', re.I)
+_CH_DOT_RE = re.compile(r'ch\.?\s*(\d+\.?\d*)', re.I)
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+# Skip lists: non-manga search links (case-sensitive, as the site's
+# paths are lowercase) and UI images that aren't chapter pages
+_NON_MANGA_HREF_RE = re.compile(r'/chapter|/auth/|/genre/|/page/')
+_NON_MANGA_SLUG_RE = re.compile(r'auth|genre|page|chapter|search')
+_UI_IMG_RE = re.compile(r'logo|avatar|icon|loading|thumb', re.I)
+
 
 class ToonilyScraper(PlaywrightScraper):
     """Scraper for Toonily (toonily.me)."""
@@ -26,14 +49,14 @@ class ToonilyScraper(PlaywrightScraper):
         search_url = f"{self.base_url}/?s={quote(query)}"
         
         html = self._get_page_content(search_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         results = []
         seen_slugs = set()
         
         # Toonily uses .book-item containers with relative links
-        for item in soup.select('.book-item'):
-            link = item.select_one('a[href]')
+        for item in _BOOK_ITEMS.select(soup):
+            link = _ITEM_LINK.select_one(item)
             if not link:
                 continue
             
@@ -42,7 +65,7 @@ class ToonilyScraper(PlaywrightScraper):
                 continue
             
             # Skip non-manga pages
-            if any(x in href for x in ['/chapter', '/auth/', '/genre/', '/page/']):
+            if _NON_MANGA_HREF_RE.search(href):
                 continue
             
             # Get slug
@@ -55,12 +78,12 @@ class ToonilyScraper(PlaywrightScraper):
             full_url = f"{self.base_url}/{slug}"
             
             # Get title - look in title element or img alt
-            title_el = item.select_one('.title, .name, h3, h4')
+            title_el = _ITEM_TITLE.select_one(item)
             title = title_el.get_text(strip=True) if title_el else ''
+            img = _IMG.select_one(item)
             
             if not title:
                 # Try img alt
-                img = item.select_one('img')
                 if img:
                     title = img.get('alt', '') or img.get('title', '')
             
@@ -77,7 +100,6 @@ class ToonilyScraper(PlaywrightScraper):
                 continue
             
             # Get cover
-            img = item.select_one('img')
             cover_url = None
             if img:
                 cover_url = img.get('src') or img.get('data-src')
@@ -90,20 +112,20 @@ class ToonilyScraper(PlaywrightScraper):
         
         # Fallback: look for any links that look like manga
         if not results:
-            for link in soup.select('a[href^="/"]'):
+            for link in _ROOT_LINKS.select(soup):
                 href = link.get('href', '')
                 slug = href.strip('/')
                 
                 if not slug or '/' in slug:
                     continue
-                if any(x in slug for x in ['auth', 'genre', 'page', 'chapter', 'search']):
+                if _NON_MANGA_SLUG_RE.search(slug):
                     continue
                 if slug in seen_slugs:
                     continue
                 
                 seen_slugs.add(slug)
                 
-                img = link.select_one('img')
+                img = _IMG.select_one(link)
                 title = ''
                 
                 if img:
@@ -123,17 +145,17 @@ class ToonilyScraper(PlaywrightScraper):
     def get_chapters(self, manga_url: str) -> List[Chapter]:
         """Get all chapters for a manga."""
         html = self._get_page_content(manga_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         chapters = []
         seen = set()
         
         # Extract slug from URL for matching
-        slug_match = re.search(r'toonily\.me/([^/]+)', manga_url)
+        slug_match = _SLUG_RE.search(manga_url)
         slug = slug_match.group(1) if slug_match else ''
         
         # Look for chapter links
-        for link in soup.select('a[href*="chapter"]'):
+        for link in _CHAPTER_LINKS.select(soup):
             href = link.get('href', '')
             if not href or href in seen:
                 continue
@@ -150,11 +172,11 @@ class ToonilyScraper(PlaywrightScraper):
             text = link.get('title') or link.get_text(strip=True)
             
             # Extract chapter number
-            match = re.search(r'chapter[_\s-]*(\d+\.?\d*)', href, re.I)
+            match = _CHAPTER_NAMED_RE.search(href)
             if not match:
-                match = re.search(r'ch\.?\s*(\d+\.?\d*)', text, re.I)
+                match = _CH_DOT_RE.search(text)
             if not match:
-                match = re.search(r'(\d+\.?\d*)', text)
+                match = _NUM_RE.search(text)
             
             chapter_num = match.group(1) if match else "0"
             
@@ -170,16 +192,16 @@ class ToonilyScraper(PlaywrightScraper):
     def get_pages(self, chapter_url: str) -> List[str]:
         """Get all page image URLs for a chapter."""
         html = self._get_page_content(chapter_url, wait_time=5000)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         pages = []
         
         # Look for chapter images in various containers
-        for img in soup.select('.reading-content img, .chapter-content img, .page-break img, img[class*="chapter"]'):
+        for img in _READER_IMGS.select(soup):
             src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
             if src and src not in pages:
                 # Skip non-content images
-                if any(x in src.lower() for x in ['logo', 'avatar', 'icon', 'loading', 'thumb']):
+                if _UI_IMG_RE.search(src):
                     continue
                 
                 # Clean up URL
@@ -191,7 +213,7 @@ class ToonilyScraper(PlaywrightScraper):
         
         # Fallback: look for any large images
         if not pages:
-            for img in soup.select('img'):
+            for img in _IMG.select(soup):
                 src = img.get('src') or img.get('data-src')
                 if not src:
                     continue
@@ -202,7 +224,7 @@ class ToonilyScraper(PlaywrightScraper):
                     continue
                 
                 # Skip UI images
-                if any(x in src.lower() for x in ['logo', 'avatar', 'icon', 'loading', 'thumb']):
+                if _UI_IMG_RE.search(src):
                     continue
                 
                 if src not in pages:
@@ -70,6 +70,10 @@ hidden_imports += [
     "pywin32_ctypes.win32cred",
     "yaml",
     "bs4",
+    "lxml",
+    "lxml.etree",
+    "lxml.html",
+    "soupsieve",
     "playwright",
     "playwright.sync_api",
     "playwright_stealth",
@@ -63,6 +63,10 @@ hidden_imports += [
     "keyring.backends",
     "yaml",
     "bs4",
+    "lxml",
+    "lxml.etree",
+    "lxml.html",
+    "soupsieve",
     "playwright",
     "playwright.sync_api",
     "playwright_stealth",
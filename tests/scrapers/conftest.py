@@ -20,6 +20,8 @@ from pathlib import Path
 
 import pytest
 
+from memanga.scrapers.base import clear_html_cache
+
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -32,11 +34,13 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 class _FakeResponse:
     def __init__(self, text: str = "", *, status: int = 200,
-                 content: bytes | None = None, json_data=None):
+                 content: bytes | None = None, json_data=None,
+                 headers: dict | None = None):
         self._text = text
         self.status_code = status
         self._content = content if content is not None else text.encode("utf-8")
         self._json = json_data
+        self.headers = headers or {}
 
     @property
     def text(self) -> str:
@@ -46,6 +50,19 @@ class _FakeResponse:
     def content(self) -> bytes:
         return self._content
 
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def json(self):
         if self._json is not None:
             return self._json
@@ -54,7 +71,7 @@ class _FakeResponse:
     def raise_for_status(self):
         if self.status_code >= 400:
             from requests import HTTPError
-            raise HTTPError(f"{self.status_code} error")
+            raise HTTPError(f"{self.status_code} error", response=self)
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -125,6 +142,15 @@ def _patch_request(monkeypatch, scraper, *, text="", content=None, status=200):
 # ──────────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _isolate_html_cache():
+    """Start and end every test with empty module-level HTML/parse caches,
+    which every scraper instance shares."""
+    clear_html_cache()
+    yield
+    clear_html_cache()
+
+
 @pytest.fixture
 def fake_response():
     """The FakeResponse class — instantiate with .text/.content/.json_data."""
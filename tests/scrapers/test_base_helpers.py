@@ -11,7 +11,8 @@ import time
 import pytest
 
 from memanga.scrapers.base import (
-    BaseScraper, Chapter, Manga, _retry,
+    BaseScraper, Chapter, Manga, _retry, clear_html_cache, enable_html_disk_cache,
+    xpath_img_sources, _POOL_MAXSIZE,
 )
 
 
@@ -38,6 +39,13 @@ class TestChapterNumeric:
         cs.sort()
         assert [c.number for c in cs] == ["1.5", "2", "10"]
 
+    def test_numeric_follows_renumbering(self):
+        c = Chapter("3", "", "")
+        assert c.numeric == 3.0
+        c.number = "Chapter 4.5"
+        assert c.numeric == 4.5
+        assert c == Chapter("Chapter 4.5", "", "")
+
 
 # ──────────────────────────────────────────────────────────────────────
 # Manga dataclass
@@ -107,6 +115,52 @@ class _DummyScraper(BaseScraper):
     def get_pages(self, url): return []
 
 
+class TestSessionPool:
+    def test_session_mounts_enlarged_pool(self):
+        s = _DummyScraper()
+        for prefix in ("https://", "http://"):
+            adapter = s.session.get_adapter(prefix + "cdn.example")
+            assert adapter._pool_maxsize == _POOL_MAXSIZE
+
+    def test_replacement_session_keeps_its_adapter_and_is_tuned(self):
+        import requests
+
+        class _CustomAdapter(requests.adapters.HTTPAdapter):
+            pass
+
+        session = requests.Session()
+        custom = _CustomAdapter()
+        session.mount("https://", custom)
+        s = _DummyScraper()
+        s.session = session
+        assert s.session.get_adapter("https://cdn.example") is custom
+        assert custom._pool_maxsize == _POOL_MAXSIZE
+
+    def test_image_session_outlives_the_instance(self):
+        first, second = _DummyScraper(), _DummyScraper()
+        assert first.image_session is second.image_session
+        assert first.image_session is not first.session
+        adapter = first.image_session.get_adapter("https://cdn.example")
+        assert adapter._pool_maxsize == _POOL_MAXSIZE
+
+    def test_page_session_and_its_pool_outlive_the_instance(self):
+        first = _DummyScraper()
+        pool = first.session.get_adapter("https://cdn.example").poolmanager
+        second = _DummyScraper()
+        assert second.session is first.session
+        assert second.session.get_adapter("https://cdn.example").poolmanager is pool
+
+    def test_image_headers_are_set_on_the_image_session(self):
+        from memanga.scrapers.readbluelockorg import ReadBlueLockOrgScraper
+
+        s = ReadBlueLockOrgScraper()
+        headers = s.image_session.headers
+        assert headers["Referer"] == s.base_url
+        assert headers["Accept"].startswith("image/")
+        # The page session keeps its HTML Accept header
+        assert s.session.headers["Accept"].startswith("text/html")
+
+
 class TestRateLimit:
     def test_enforces_minimum_gap_between_requests(self, monkeypatch, fake_response):
         s = _DummyScraper()
@@ -123,6 +177,124 @@ class TestRateLimit:
         # Second call must be at least 50ms after the first
         assert calls[1] - calls[0] >= 0.04
 
+    @pytest.mark.parametrize("retry_after,expected", [("7", 7.0), ("3600", 60.0)])
+    def test_429_waits_for_retry_after(self, monkeypatch, fake_response, retry_after, expected):
+        import memanga.scrapers.base as base_mod
+        s = _DummyScraper()
+        s._rate_limit = 0
+        responses = [
+            fake_response(status=429, headers={"Retry-After": retry_after}),
+            fake_response(text="ok"),
+        ]
+        monkeypatch.setattr(s.session, "get", lambda url, **kw: responses.pop(0))
+        sleeps = []
+        monkeypatch.setattr(base_mod.time, "sleep", sleeps.append)
+
+        assert s._request("https://x/1").text == "ok"
+        assert sleeps == [expected]
+
+    def test_503_without_retry_after_uses_backoff(self, monkeypatch, fake_response):
+        import memanga.scrapers.base as base_mod
+        s = _DummyScraper()
+        s._rate_limit = 0
+        responses = [fake_response(status=503), fake_response(text="ok")]
+        monkeypatch.setattr(s.session, "get", lambda url, **kw: responses.pop(0))
+        sleeps = []
+        monkeypatch.setattr(base_mod.time, "sleep", sleeps.append)
+
+        s._request("https://x/1")
+        assert sleeps == [1.0]
+
+
+class TestHtmlCache:
+    def _scraper(self, monkeypatch, responses):
+        s = _DummyScraper()
+        s._rate_limit = 0
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(kw.get("headers") or {})
+            return responses.pop(0)
+        monkeypatch.setattr(s.session, "get", fake_get)
+        return s, sent
+
+    def test_etag_revalidates_and_reuses_body_on_304(self, monkeypatch, fake_response):
+        s, sent = self._scraper(monkeypatch, [
+            fake_response(text="v1", headers={"ETag": '"abc"'}),
+            fake_response(text="", status=304),
+        ])
+        assert s._get_html("https://x/list") == "v1"
+        assert s._get_html("https://x/list") == "v1"
+        assert sent[1] == {"If-None-Match": '"abc"'}
+
+    def test_changed_page_replaces_cached_body(self, monkeypatch, fake_response):
+        s, sent = self._scraper(monkeypatch, [
+            fake_response(text="v1", headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            fake_response(text="v2", headers={"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}),
+        ])
+        s._get_html("https://x/list")
+        assert s._get_html("https://x/list") == "v2"
+        assert sent[1] == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    def test_max_age_skips_network(self, monkeypatch, fake_response):
+        s, sent = self._scraper(monkeypatch, [
+            fake_response(text="v1", headers={"Cache-Control": "public, max-age=300"}),
+        ])
+        assert s._get_html("https://x/list") == "v1"
+        assert s._get_html("https://x/list") == "v1"
+        assert len(sent) == 1
+
+    @pytest.mark.parametrize("headers", [
+        {},
+        {"ETag": '"abc"', "Cache-Control": "no-store"},
+    ])
+    def test_uncacheable_responses_are_refetched(self, monkeypatch, fake_response, headers):
+        s, sent = self._scraper(monkeypatch, [
+            fake_response(text="v1", headers=headers),
+            fake_response(text="v2", headers=headers),
+        ])
+        s._get_html("https://x/list")
+        assert s._get_html("https://x/list") == "v2"
+        assert sent == [{}, {}]
+
+    def test_disk_cache_revalidates_across_runs(self, monkeypatch, fake_response, tmp_path):
+        enable_html_disk_cache(tmp_path)
+        try:
+            s, _ = self._scraper(monkeypatch, [
+                fake_response(text="v1", headers={"ETag": '"abc"'}),
+            ])
+            s._get_html("https://x/list")
+            clear_html_cache()  # a fresh process only has the disk copy
+
+            s, sent = self._scraper(monkeypatch, [fake_response(text="", status=304)])
+            assert s._get_html("https://x/list") == "v1"
+            assert sent == [{"If-None-Match": '"abc"'}]
+        finally:
+            enable_html_disk_cache(None)
+
+    def test_disk_cache_skips_responses_without_validators(self, monkeypatch, fake_response, tmp_path):
+        enable_html_disk_cache(tmp_path)
+        try:
+            s, _ = self._scraper(monkeypatch, [fake_response(text="v1")])
+            s._get_html("https://x/list")
+            assert list(tmp_path.glob("*.json")) == []
+        finally:
+            enable_html_disk_cache(None)
+
+    def test_unchanged_page_is_not_parsed_again(self, monkeypatch, fake_response):
+        s, _ = self._scraper(monkeypatch, [
+            fake_response(text="v1", headers={"ETag": '"abc"'}),
+            fake_response(text="", status=304),
+            fake_response(text="v2", headers={"ETag": '"def"'}),
+        ])
+        parsed = []
+        def parse(page_html):
+            parsed.append(page_html)
+            return [page_html]
+        for _ in range(3):
+            result = s._parse_once("https://x/list", s._get_html("https://x/list"), parse)
+        assert parsed == ["v1", "v2"]
+        assert result == ["v2"]
+
 
 class TestGetCoverUrl:
     def test_returns_og_image_when_present(self, monkeypatch):
@@ -161,6 +333,87 @@ class TestGetNewChapters:
         assert s.get_new_chapters("https://x", last_chapter=10.0) == []
 
 
+class TestLinksContaining:
+    def test_regex_pass_matches_get_text_strip(self):
+        html = ('<a class="c" href="/m/chapter-1?a=1&amp;b=2"> <span>Chapter</span> 1 </a>'
+                "<A HREF='/m/chapter-2'>Ch &amp; 2</A><a href=\"/about\">About</a>")
+        assert BaseScraper._links_containing(html, "chapter-") == [
+            ("/m/chapter-1?a=1&b=2", "Chapter1"),
+            ("/m/chapter-2", "Ch & 2"),
+        ]
+
+    def test_ignores_data_href(self):
+        html = '<a data-href="/m/chapter-9-lazy" href="/m/chapter-9">Chapter 9</a>'
+        assert BaseScraper._links_containing(html, "chapter-") == [
+            ("/m/chapter-9", "Chapter 9"),
+        ]
+
+    def test_falls_back_to_soup_for_unquoted_hrefs(self):
+        html = "<a href=/m/chapter-3>Chapter 3</a>"
+        assert BaseScraper._links_containing(html, "chapter-") == [
+            ("/m/chapter-3", "Chapter 3"),
+        ]
+
+
+class TestImgSources:
+    def test_reads_both_attributes_in_any_quoting(self):
+        html = ('<img src="https://cdn/1.jpg?a=1&amp;b=2" alt="x">'
+                "<IMG class='lazy' data-src='https://cdn/2.jpg' src=\"\">"
+                "<img data-lazy-src=https://cdn/skip.jpg src=https://cdn/3.jpg>"
+                '<p>no image</p>')
+        assert BaseScraper._img_sources(html) == [
+            ("https://cdn/1.jpg?a=1&b=2", ""),
+            ("", "https://cdn/2.jpg"),
+            ("https://cdn/3.jpg", ""),
+        ]
+
+    def test_empty_document(self):
+        assert BaseScraper._img_sources("") == []
+
+
+class TestMakeAbsolute:
+    @pytest.mark.parametrize("href,expected", [
+        ("https://cdn.test/1.jpg", "https://cdn.test/1.jpg"),
+        ("//cdn.test/1.jpg", "https://cdn.test/1.jpg"),
+        ("/manga/x", "https://dummy.test/manga/x"),
+        ("manga/x", "https://dummy.test/manga/x"),
+        ("", ""),
+    ])
+    def test_resolves_against_base_url(self, href, expected):
+        assert _DummyScraper()._make_absolute(href) == expected
+
+
+class TestXPathImgSources:
+    def test_src_or_data_src_in_document_order(self):
+        from lxml import etree
+
+        tree = BaseScraper._html_tree(
+            '<img data-src="/1.jpg"><img src="" data-src="/2.jpg">'
+            '<img src="/3.jpg" data-src="/lazy.jpg"><img>'
+            '<section><img src="/4.jpg"></section>'
+        )
+        assert etree.XPath(xpath_img_sources())(tree) == ["/1.jpg", "/2.jpg", "/3.jpg", "/4.jpg"]
+        assert etree.XPath(xpath_img_sources('//section//img'))(tree) == ["/4.jpg"]
+
+
+class TestGetPagesMany:
+    def test_maps_each_url_and_tolerates_failures(self, monkeypatch):
+        s = _DummyScraper()
+
+        def pages(url):
+            if url.endswith("bad"):
+                raise IOError()
+            return [f"{url}/1.jpg"]
+        monkeypatch.setattr(s, "get_pages", pages)
+        assert s.get_pages_many(["https://x/1", "https://x/bad"]) == {
+            "https://x/1": ["https://x/1/1.jpg"],
+            "https://x/bad": [],
+        }
+
+    def test_empty_input(self):
+        assert _DummyScraper().get_pages_many([]) == {}
+
+
 class TestDownloadImage:
     def test_writes_to_disk_on_success(self, monkeypatch, tmp_path, fake_response):
         s = _DummyScraper()
@@ -176,3 +429,36 @@ class TestDownloadImage:
             raise IOError()
         monkeypatch.setattr(s, "_request", boom)
         assert s.download_image("https://x", tmp_path / "p.jpg") is False
+
+    def test_truncated_stream_leaves_no_partial_file(self, monkeypatch, tmp_path,
+                                                     fake_response):
+        s = _DummyScraper()
+        resp = fake_response(content=b"x" * 10)
+
+        def broken_stream(chunk_size=1):
+            yield b"xxxx"
+            raise IOError("connection reset")
+        monkeypatch.setattr(resp, "iter_content", broken_stream)
+        monkeypatch.setattr(s, "_request", lambda *a, **k: resp)
+        assert s.download_image("https://x", tmp_path / "p.jpg") is False
+        assert not (tmp_path / "p.jpg").exists()
+
+    def test_creates_missing_parent_directory(self, monkeypatch, tmp_path, fake_response):
+        s = _DummyScraper()
+        monkeypatch.setattr(s, "_request",
+                             lambda *a, **k: fake_response(content=b"data"))
+        target = tmp_path / "chapter" / "p.jpg"
+        assert s.download_image("https://x", target) is True
+        assert target.read_bytes() == b"data"
+
+    def test_image_session_download_streams_and_fails_quietly(self, monkeypatch, tmp_path,
+                                                              fake_response):
+        s = _DummyScraper()
+        monkeypatch.setattr(s.image_session, "get",
+                             lambda *a, **k: fake_response(content=b"data"))
+        assert s._download_with_image_session("https://x", tmp_path / "p.jpg") is True
+        assert (tmp_path / "p.jpg").read_bytes() == b"data"
+
+        monkeypatch.setattr(s.image_session, "get",
+                             lambda *a, **k: fake_response(status=404))
+        assert s._download_with_image_session("https://x", tmp_path / "q.jpg") is False
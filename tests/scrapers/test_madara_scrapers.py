@@ -0,0 +1,165 @@
+"""Inline-HTML tests for the hand-written Madara scrapers (ManhuaPlus, ManhuaFast...)."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers import manhuaplus
+from memanga.scrapers.manhuafast import ManhuaFastScraper
+from memanga.scrapers.manhuaplus import ManhuaPlusScraper
+
+
+BASE = "https://manhuaplus.org/manga/solo"
+
+CHAPTER_LIST = f"""
+<ul>
+  <li class="wp-manga-chapter"><a href="{BASE}/chapter-3/">Chapter 3</a></li>
+  <li class="wp-manga-chapter"><a href="{BASE}/chapter-2/">Chapter 2</a></li>
+  <li class="wp-manga-chapter"><a href="{BASE}/chapter-1/">Chapter 1</a></li>
+</ul>
+"""
+
+
+class TestChapterList:
+    def test_full_list_oldest_first(self, patch_html):
+        s = ManhuaPlusScraper()
+        patch_html(s, CHAPTER_LIST)
+        assert [c.number for c in s.get_chapters(BASE)] == ["1", "2", "3"]
+
+
+class TestManhuaFastXPath:
+    def test_search_reads_title_and_lazy_cover(self, patch_html):
+        s = ManhuaFastScraper()
+        patch_html(s, """
+            <div class="c-tabs-item__content">
+              <div class="post-title"><h3><a href="/manga/solo/">Solo <b>Leveling</b></a></h3></div>
+              <img data-src="https://cdn/solo.jpg">
+            </div>
+            <div class="c-tabs-item__content"><p>no title link</p></div>
+        """)
+        results = s.search("solo")
+        assert [(m.title, m.url, m.cover_url) for m in results] == [
+            ("Solo Leveling", "/manga/solo/", "https://cdn/solo.jpg"),
+        ]
+
+    def test_pages_skip_lazy_placeholders(self, patch_html):
+        s = ManhuaFastScraper()
+        patch_html(s, """
+            <img src="https://cdn/logo.png">
+            <div class="reading-content">
+              <img data-src=" https://cdn/p1.jpg ">
+              <img src="https://cdn/loading.gif">
+              <img src="https://cdn/p2.jpg">
+            </div>
+        """)
+        assert s.get_pages("https://manhuafast.com/c/1") == [
+            "https://cdn/p1.jpg", "https://cdn/p2.jpg",
+        ]
+
+    def test_chapter_items_win_over_madara_rows(self, patch_html):
+        s = ManhuaFastScraper()
+        patch_html(s, f"""
+            <ul>
+              <li class="chapter-item"><a href="{BASE}/chapter-2/">Chapter 2</a>
+                <a href="{BASE}/chapter-2/comments/">Comments</a></li>
+              <li class="chapter-item"><a href="{BASE}/chapter-1/">Chapter 1</a></li>
+              <li class="wp-manga-chapter"><a href="{BASE}/chapter-9/">Chapter 9</a></li>
+            </ul>
+        """)
+        assert [c.url for c in s.get_chapters(BASE)] == [
+            f"{BASE}/chapter-1/", f"{BASE}/chapter-2/",
+        ]
+
+    def test_madara_rows_are_the_fallback(self, patch_html):
+        s = ManhuaFastScraper()
+        patch_html(s, CHAPTER_LIST)
+        assert [c.number for c in s.get_chapters(BASE)] == ["1", "2", "3"]
+
+    def test_unchanged_chapter_list_is_parsed_once(self, patch_html, monkeypatch):
+        s = ManhuaFastScraper()
+        patch_html(s, CHAPTER_LIST)
+        parse = s._parse_chapters
+        calls = []
+        monkeypatch.setattr(s, "_parse_chapters",
+                            lambda html: calls.append(html) or parse(html))
+        first = s.get_chapters(BASE)
+        assert s.get_chapters(BASE) == first
+        assert len(first) == 3 and len(calls) == 1
+
+    def test_empty_document_yields_nothing(self, patch_html):
+        s = ManhuaFastScraper()
+        patch_html(s, "")
+        assert s.get_chapters(BASE) == []
+        assert s.get_pages(BASE) == []
+
+
+class TestManhuaPlusChapterIds:
+    def _ajax(self, monkeypatch, scraper, fake_response):
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(url)
+            return fake_response(json_data={
+                "status": True,
+                "html": '<a class="readImg" href="https://cdn/1.webp"></a>',
+            })
+        monkeypatch.setattr(scraper.session, "get", fake_get)
+        return sent
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self):
+        manhuaplus._chapter_ids.clear()
+        yield
+        manhuaplus._chapter_ids.clear()
+
+    def test_chapter_list_ids_skip_the_chapter_page(self, monkeypatch, patch_html, fake_response):
+        # Listing and downloading run on separate instances, as they do
+        # through get_scraper()
+        lister, downloader = ManhuaPlusScraper(), ManhuaPlusScraper()
+        fetched = []
+        def html(url):
+            fetched.append(url)
+            return (f'<li class="wp-manga-chapter" data-chapter-id="77">'
+                    f'<a href="{BASE}/chapter-3/">Chapter 3</a></li>')
+        patch_html(lister, html)
+        patch_html(downloader, html)
+        sent = self._ajax(monkeypatch, downloader, fake_response)
+        lister.get_chapters(BASE)
+        assert downloader.get_pages(f"{BASE}/chapter-3/") == ["https://cdn/1.webp"]
+        assert fetched == [BASE]
+        assert sent == ["https://manhuaplus.org/ajax/image/list/chap/77"]
+
+    def test_row_without_link_does_not_borrow_the_next_rows(self, patch_html):
+        s = ManhuaPlusScraper()
+        patch_html(s, f"""<ul>
+            <li data-chapter-id="102"><span>Chapter 2 (locked)</span></li>
+            <li data-chapter-id="101"><a href="{BASE}/chapter-1/">Chapter 1</a></li>
+        </ul>""")
+        s.get_chapters(BASE)
+        assert dict(manhuaplus._chapter_ids) == {
+            (ManhuaPlusScraper, f"{BASE}/chapter-1/"): "101",
+        }
+
+    def test_stale_cached_id_falls_back_to_chapter_page(self, monkeypatch, patch_html,
+                                                        fake_response):
+        s = ManhuaPlusScraper()
+        manhuaplus._chapter_ids[(ManhuaPlusScraper, f"{BASE}/chapter-3/")] = "77"
+        patch_html(s, "<script>var CHAPTER_ID = 42;</script>")
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(url)
+            if url.endswith("/77"):
+                return fake_response(json_data={"status": False})
+            return fake_response(json_data={
+                "status": True,
+                "html": '<a class="readImg" href="https://cdn/1.webp"></a>',
+            })
+        monkeypatch.setattr(s.session, "get", fake_get)
+        assert s.get_pages(f"{BASE}/chapter-3/") == ["https://cdn/1.webp"]
+        assert [url.rsplit("/", 1)[-1] for url in sent] == ["77", "42"]
+
+    def test_falls_back_to_chapter_page_id(self, monkeypatch, patch_html, fake_response):
+        s = ManhuaPlusScraper()
+        patch_html(s, "<script>var CHAPTER_ID = 42;</script>")
+        sent = self._ajax(monkeypatch, s, fake_response)
+        assert s.get_pages(f"{BASE}/chapter-3/") == ["https://cdn/1.webp"]
+        assert sent == ["https://manhuaplus.org/ajax/image/list/chap/42"]
@@ -0,0 +1,61 @@
+"""Inline-HTML tests for MangaSeeScraper."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.mangasee import MangaSeeScraper
+
+
+@pytest.fixture
+def scraper():
+    return MangaSeeScraper()
+
+
+class TestSearch:
+    def test_streams_links_and_stops_at_limit(self, scraper, monkeypatch,
+                                              fake_response):
+        links = "".join(f'<a href="/manga/Series-{i}">Series {i}</a>' for i in range(30))
+        html = f'<html><body><a href="/about">About</a><a href="/manga/No-Title"></a>{links}</body></html>'
+        monkeypatch.setattr(scraper, "_request",
+                            lambda *a, **k: fake_response(html))
+        results = scraper.search("series")
+        assert len(results) == 10
+        assert results[0].title == "No Title"
+        assert results[1].title == "Series 0"
+        assert results[1].url == "https://mangasee123.com/manga/Series-0"
+
+
+class TestGetChapters:
+    def test_decodes_vm_chapters_and_dedupes(self, scraper, patch_html):
+        patch_html(scraper, """<script>
+            vm.Chapters = [{"Chapter": "100020"}, {"Chapter": "100015"},
+                           {"Chapter": "100020"}];
+        </script>""")
+        chapters = scraper.get_chapters("https://mangasee123.com/manga/Kubera")
+        assert [c.number for c in chapters] == ["1.5", "2"]
+        assert chapters[1].url == (
+            "https://mangasee123.com/read-online/Kubera-chapter-2.html")
+
+    def test_fallback_links_dedupe(self, scraper, patch_html):
+        patch_html(scraper, """
+            <a href="/read-online/Kubera-chapter-3.html">3</a>
+            <a href="/read-online/Kubera-chapter-1.html">1</a>
+            <a href="/read-online/Kubera-chapter-3.html">3 again</a>
+        """)
+        chapters = scraper.get_chapters("https://mangasee123.com/manga/Kubera")
+        assert [c.number for c in chapters] == ["1", "3"]
+
+
+class TestGetPages:
+    def test_builds_urls_from_cur_chapter(self, scraper, patch_html):
+        patch_html(scraper, """<script>
+            vm.CurChapter = {"Chapter": "100020", "Page": "3"};
+            vm.CurPathName = "scans.example.com";
+        </script>""")
+        pages = scraper.get_pages(
+            "https://mangasee123.com/read-online/Kubera-chapter-2.html")
+        assert pages == [
+            f"https://scans.example.com/manga/Kubera/0002-{i:03d}.png"
+            for i in (1, 2, 3)
+        ]
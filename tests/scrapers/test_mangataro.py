@@ -0,0 +1,109 @@
+"""Inline-HTML tests for MangaTaroScraper page enumeration."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.mangataro import MangaTaroScraper
+
+
+CDN = "https://bx1.mangapeak.me/storage/chapters/abc123"
+
+
+@pytest.fixture
+def scraper():
+    return MangaTaroScraper()
+
+
+class TestSearch:
+    def test_merges_direct_and_api_results(self, scraper, monkeypatch, fake_response):
+        direct = fake_response(
+            "<title>Solo Leveling Manga | Read Online Free at MangaTaro</title>")
+        direct.url = "https://mangataro.org/manga/solo-leveling"
+        api = fake_response(
+            '<a href="/manga/solo-leveling">Solo Leveling</a>'
+            '<a href="/manga/solo-leveling-ragnarok">Solo Leveling: Ragnarok</a>'
+            '<a href="/manga/other">Other</a>')
+        responses = {
+            "https://mangataro.org/manga/solo-leveling": direct,
+            "https://mangataro.org/api/manga?q=solo+leveling": api,
+        }
+        monkeypatch.setattr(scraper.session, "get", lambda url, **k: responses[url])
+
+        results = scraper.search("solo leveling")
+        assert [r.url for r in results] == [
+            "https://mangataro.org/manga/solo-leveling",
+            "https://mangataro.org/manga/solo-leveling-ragnarok",
+        ]
+        assert results[0].title == "Solo Leveling"
+
+    def test_network_errors_return_empty(self, scraper, monkeypatch):
+        def boom(*a, **k):
+            raise IOError()
+        monkeypatch.setattr(scraper.session, "get", boom)
+        assert scraper.search("anything") == []
+
+
+class TestGetChapters:
+    def test_unchanged_reader_dropdown_is_parsed_once(self, patch_html, monkeypatch):
+        pages = {
+            "/manga/solo": '<a href="/read/solo/ch1-11">Read</a>',
+            "/read/solo/": """<select>
+                <option value="/read/solo/ch1-11">Ch. 1</option>
+                <option value="/read/solo/ch2-12">Ch. 2</option>
+            </select>""",
+        }
+        parse = MangaTaroScraper._parse_dropdown
+        calls = []
+        monkeypatch.setattr(MangaTaroScraper, "_parse_dropdown",
+                            lambda self, html: calls.append(html) or parse(self, html))
+        results = []
+        # A fresh instance per call, as get_scraper() hands them out
+        for _ in range(2):
+            s = MangaTaroScraper()
+            patch_html(s, pages)
+            results.append(s.get_chapters("https://mangataro.org/manga/solo"))
+        assert [c.number for c in results[0]] == ["1", "2"]
+        assert results[1] == results[0]
+        assert len(calls) == 1
+
+
+class TestGetPages:
+    def test_embedded_filenames_fill_holes_and_probe_the_tail(self, scraper, patch_html,
+                                                              monkeypatch):
+        # Page 2 is missing from the HTML and 4-5 are lazy-loaded
+        html = "".join(f'<img src="{CDN}/{i:03d}.webp">' for i in (3, 1))
+        patch_html(scraper, html)
+        existing = {f"{CDN}/004.webp", f"{CDN}/005.webp"}
+        probed = []
+
+        class _Head:
+            def __init__(self, url):
+                probed.append(url)
+                self.status_code = 200 if url in existing else 404
+        monkeypatch.setattr(scraper.session, "head", lambda url, **k: _Head(url))
+
+        assert scraper.get_pages("https://mangataro.org/read/x/ch1-1") == [
+            f"{CDN}/{i:03d}.webp" for i in range(1, 6)
+        ]
+        # Nothing the HTML already vouched for is probed
+        assert f"{CDN}/004.webp" in probed
+        assert not any(url.endswith(("/001.webp", "/002.webp", "/003.webp"))
+                       for url in probed)
+
+    def test_single_filename_probes_the_rest(self, scraper, patch_html, monkeypatch):
+        patch_html(scraper, f'<img src="{CDN}/001.webp">')
+        existing = {f"{CDN}/001.webp", f"{CDN}/002.webp"}
+
+        class _Head:
+            def __init__(self, url):
+                self.status_code = 200 if url in existing else 404
+        monkeypatch.setattr(scraper.session, "head", lambda url, **k: _Head(url))
+
+        assert scraper.get_pages("https://mangataro.org/read/x/ch1-1") == [
+            f"{CDN}/001.webp", f"{CDN}/002.webp",
+        ]
+
+    def test_no_images_returns_empty(self, scraper, patch_html):
+        patch_html(scraper, "<html></html>")
+        assert scraper.get_pages("https://mangataro.org/read/x/ch1-1") == []
@@ -0,0 +1,45 @@
+"""Inline-HTML tests for MangaTownScraper's lxml/XPath parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.mangatown import MangaTownScraper
+
+
+@pytest.fixture
+def scraper():
+    return MangaTownScraper()
+
+
+class TestGetChapters:
+    def test_extracts_dedupes_and_sorts(self, scraper, patch_html):
+        patch_html(scraper, """
+            <ul class="chapter_list">
+              <li><a href="/manga/one_piece/c002/">One Piece 2</a></li>
+              <li><a href="/manga/one_piece/c001/">One Piece <span>1</span></a></li>
+              <li><a href="/manga/one_piece/c002/">One Piece 2</a></li>
+              <li><a href="/manga/other/c009/">Other 9</a></li>
+            </ul>
+        """)
+        chapters = scraper.get_chapters("https://www.mangatown.com/manga/one_piece/")
+        assert [c.number for c in chapters] == ["001", "002"]
+        assert chapters[0].title == "One Piece 1"
+        assert chapters[0].url == "https://www.mangatown.com/manga/one_piece/c001/"
+
+
+class TestGetPages:
+    def test_reader_images_and_protocol_relative_urls(self, scraper, patch_html):
+        patch_html(scraper, """
+            <div class="read_img"><a><img src="//zjcdn.mangahere.org/1.jpg"></a></div>
+            <img id="image" data-src="https://zjcdn.mangahere.org/2.jpg">
+            <img src="https://www.mangatown.com/logo.png">
+        """)
+        assert scraper.get_pages("https://www.mangatown.com/manga/x/c001/") == [
+            "https://zjcdn.mangahere.org/1.jpg",
+            "https://zjcdn.mangahere.org/2.jpg",
+        ]
+
+    def test_empty_document_returns_empty(self, scraper, patch_html):
+        patch_html(scraper, "")
+        assert scraper.get_pages("https://www.mangatown.com/manga/x/c001/") == []
@@ -0,0 +1,47 @@
+"""Inline tests for NHentaiScraper page discovery."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.nhentai import NHentaiScraper
+
+
+GALLERY = "https://nhentai.net/g/12345/"
+
+
+@pytest.fixture
+def scraper():
+    return NHentaiScraper()
+
+
+class TestGetPages:
+    def test_builds_urls_from_gallery_api(self, scraper, monkeypatch, fake_response):
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(url)
+            return fake_response(json_data={
+                "media_id": "998",
+                "images": {"pages": [{"t": "j"}, {"t": "w"}, {"t": "p"}]},
+            })
+        monkeypatch.setattr(scraper.session, "get", fake_get)
+        monkeypatch.setattr(scraper, "_get_html", lambda *a, **k: pytest.fail("HTML fetched"))
+
+        assert scraper.get_pages(GALLERY) == [
+            "https://i.nhentai.net/galleries/998/1.jpg",
+            "https://i.nhentai.net/galleries/998/2.webp",
+            "https://i.nhentai.net/galleries/998/3.png",
+        ]
+        assert sent == ["https://nhentai.net/api/gallery/12345"]
+
+    def test_falls_back_to_thumbnails_when_api_fails(self, scraper, monkeypatch,
+                                                     patch_html, fake_response):
+        monkeypatch.setattr(scraper.session, "get", lambda *a, **k: fake_response(status=403))
+        patch_html(scraper, """
+            <div class="thumb-container">
+              <img data-src="https://t3.nhentai.net/galleries/998/1t.webp.webp">
+            </div>
+        """)
+        assert scraper.get_pages(GALLERY) == [
+            "https://i3.nhentai.net/galleries/998/1.webp",
+        ]
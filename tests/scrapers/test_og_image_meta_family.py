@@ -57,6 +57,17 @@ class TestGetChapters:
         patch_html(s, "<html><body></body></html>")
         assert s.get_chapters("https://akiramanga.com/") == []
 
+    def test_unchanged_homepage_is_parsed_once(self, patch_html, monkeypatch):
+        s = _make_scraper()
+        patch_html(s, '<a href="/chapter-1/">Chapter 1</a>')
+        parse = s._parse_chapters
+        calls = []
+        monkeypatch.setattr(s, "_parse_chapters",
+                            lambda html: calls.append(html) or parse(html))
+        first = s.get_chapters("https://akiramanga.com/")
+        assert s.get_chapters("https://akiramanga.com/") == first
+        assert len(first) == 1 and len(calls) == 1
+
 
 class TestGetPages:
     def test_primary_extraction_from_img_tags(self, patch_html, load_fixture):
@@ -77,6 +88,18 @@ class TestGetPages:
         # Both meta URLs normalized
         assert all("/s1600/" in p for p in pages)
 
+    def test_meta_name_attribute_and_empty_page(self, patch_html):
+        s = _make_scraper()
+        patch_html(s, {
+            "https://akiramanga.com/chapter-1/":
+                '<meta name="twitter:image" content="https://blogger.googleusercontent.com/a/s320/1.jpg">',
+            "https://akiramanga.com/chapter-2/": "",
+        })
+        assert s.get_pages("https://akiramanga.com/chapter-1/") == [
+            "https://blogger.googleusercontent.com/a/s1600/1.jpg",
+        ]
+        assert s.get_pages("https://akiramanga.com/chapter-2/") == []
+
     def test_blogger_normalization_disabled(self, patch_html, load_fixture):
         s = _make_scraper(normalize_blogger=False)
         patch_html(s, load_fixture("og_image_meta", "chapter_blogger.html"))
@@ -103,19 +126,31 @@ class TestCDNFilter:
 class TestDownloadImage:
     def test_short_content_treated_as_failure(self, monkeypatch, tmp_path, fake_response):
         s = _make_scraper()
-        monkeypatch.setattr(s.session, "get",
+        monkeypatch.setattr(s.image_session, "get",
                              lambda *a, **k: fake_response(content=b"x" * 100))
         ok = s.download_image("https://x", tmp_path / "p.jpg")
         assert ok is False
+        assert not (tmp_path / "p.jpg").exists()
 
     def test_writes_to_disk(self, monkeypatch, tmp_path, fake_response):
         s = _make_scraper()
-        monkeypatch.setattr(s.session, "get",
+        monkeypatch.setattr(s.image_session, "get",
                              lambda *a, **k: fake_response(content=b"x" * 4096))
         ok = s.download_image("https://x", tmp_path / "p.jpg")
         assert ok is True
         assert (tmp_path / "p.jpg").exists()
 
+    def test_cloudscraper_sites_keep_their_page_session(self, monkeypatch, tmp_path,
+                                                        fake_response):
+        s = _make_scraper(uses_cloudscraper=True)
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(kw)
+            return fake_response(content=b"x" * 4096)
+        monkeypatch.setattr(s.session, "get", fake_get)
+        assert s.download_image("https://x", tmp_path / "p.jpg") is True
+        assert sent[0]["headers"]["Accept"].startswith("image/")
+
 
 # ──────────────────────────────────────────────────────────────────────
 # Registry wiring spot-checks
@@ -0,0 +1,79 @@
+"""Inline tests for OneMangaScraper search and HTML reuse."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.onemanga import OneMangaScraper
+
+
+def _card(i):
+    url = f"https://1manga.co/manga/series-{i}"
+    return f'<a href="{url}"><img src="https://cdn/{i}.jpg"></a><a href="{url}">Series {i}</a>'
+
+
+class TestSearch:
+    def test_merges_cover_and_title_links(self, monkeypatch, fake_response):
+        s = OneMangaScraper()
+        html = '<a href="/manga/">All</a>' + _card(1)
+        monkeypatch.setattr(s.session, "get", lambda *a, **k: fake_response(html))
+        assert [(m.title, m.url, m.cover_url) for m in s.search("series")] == [
+            ("Series 1", "https://1manga.co/manga/series-1", "https://cdn/1.jpg"),
+        ]
+
+    def test_stops_after_twenty_results(self, monkeypatch, fake_response):
+        s = OneMangaScraper()
+        html = "".join(_card(i) for i in range(60))
+        monkeypatch.setattr(s.session, "get", lambda *a, **k: fake_response(html))
+        results = s.search("series")
+        assert [m.title for m in results] == [f"Series {i}" for i in range(20)]
+
+
+class TestHtmlReuse:
+    def test_repeat_fetch_within_ttl_skips_the_network(self, monkeypatch, fake_response):
+        sent = []
+        html = '<img src="https://imgx.mghcdn.com/x/1/1.jpg">'
+        def fake_get(url, **kw):
+            sent.append(url)
+            return fake_response(html)
+
+        for _ in range(2):
+            # A fresh scraper per operation, as get_scraper() hands out
+            s = OneMangaScraper()
+            s._rate_limit = 0
+            monkeypatch.setattr(s.session, "get", fake_get)
+            assert s.get_pages("https://1manga.co/chapter/1") == [
+                "https://imgx.mghcdn.com/x/1/1.jpg",
+            ]
+        assert sent == ["https://1manga.co/chapter/1"]
+
+
+class TestGetPages:
+    def test_cdn_images_from_raw_html(self, monkeypatch, fake_response):
+        s = OneMangaScraper()
+        s._rate_limit = 0
+        html = """
+            <meta property="og:image" content="https://thumb.mghcdn.com/cover.jpg">
+            <script src="https://imgx.mghcdn.com/app.js"></script>
+            <img src="https://imgx.mghcdn.com/x/1/1.jpg">
+            <img data-src='https://imgx.mghcdn.com/x/1/2.webp?v=2&amp;t=1'>
+            <img src="https://imgx.mghcdn.com/x/1/1.jpg">
+            <img src="https://ads.example/banner.jpg">
+        """
+        monkeypatch.setattr(s.session, "get", lambda *a, **k: fake_response(html))
+        assert s.get_pages("https://1manga.co/chapter/2") == [
+            "https://imgx.mghcdn.com/x/1/1.jpg",
+            "https://imgx.mghcdn.com/x/1/2.webp?v=2&t=1",
+        ]
+
+
+class TestDownloadImage:
+    @pytest.mark.parametrize("size,ok", [(4096, True), (200, False)])
+    def test_streams_to_disk_and_drops_tiny_bodies(self, tmp_path, monkeypatch,
+                                                   fake_response, size, ok):
+        s = OneMangaScraper()
+        monkeypatch.setattr(s.session, "get",
+                            lambda *a, **k: fake_response(content=b"x" * size))
+        path = tmp_path / "ch" / "001.jpg"
+        assert s.download_image("https://imgx.mghcdn.com/x/1/1.jpg", path) is ok
+        assert path.exists() is ok
@@ -15,6 +15,7 @@ import pytest
 
 from memanga.scrapers.mangabuddy import MangaBuddyScraper
 from memanga.scrapers.comix import ComixScraper
+from memanga.scrapers.mangayy import MangaYYScraper
 from memanga.scrapers import get_scraper
 
 
@@ -120,6 +121,269 @@ class TestComixChapters:
         )
 
 
+# ──────────────────────────────────────────────────────────────────────
+# MangaYY — static HTML first, Playwright only as a fallback
+# ──────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def mangayy():
+    return MangaYYScraper()
+
+
+def _chapter_list_html(n):
+    return "".join(
+        f'<a href="https://mangayy.org/manga/x/chapter-{i}/">Chapter {i}</a>'
+        for i in range(1, n + 1)
+    )
+
+
+class TestMangaYYStaticFetch:
+    def test_static_html_skips_browser(self, mangayy, monkeypatch, fake_response):
+        monkeypatch.setattr(mangayy.session, "get",
+                             lambda *a, **k: fake_response(_chapter_list_html(6)))
+
+        def no_browser(*a, **k):
+            raise AssertionError("Playwright should not be used")
+        monkeypatch.setattr(mangayy, "_get_page_content", no_browser)
+
+        chapters = mangayy.get_chapters("https://mangayy.org/manga/x/")
+        assert len(chapters) == 6
+        assert chapters[0]["chapter"] == "6"
+
+    def test_cloudflare_page_falls_back_to_browser(self, mangayy, monkeypatch,
+                                                   fake_response):
+        monkeypatch.setattr(
+            mangayy.session, "get",
+            lambda *a, **k: fake_response("<title>Just a moment...</title>"
+                                          + _chapter_list_html(6)))
+        calls = []
+
+        def browser(url, wait_time=2000, cookies=None):
+            calls.append(url)
+            return _chapter_list_html(2)
+        monkeypatch.setattr(mangayy, "_get_page_content", browser)
+
+        assert len(mangayy.get_chapters("https://mangayy.org/manga/x/")) == 2
+        assert calls == ["https://mangayy.org/manga/x/"]
+
+
+class TestMangaYYPages:
+    def test_reader_images_preferred_over_fallback(self, mangayy, monkeypatch):
+        html = """
+            <div class="reading-content">
+              <div class="page-break"><img data-src=" https://cdn.mangayy.org/manga/x/1.jpg "></div>
+              <img src="https://cdn.mangayy.org/manga/logo.png">
+            </div>
+            <img class="wp-manga-chapter-img" data-lazy-src="https://cdn.mangayy.org/manga/x/2.jpg">
+            <img src="https://other.example/chapter/thumb.jpg">
+        """
+        monkeypatch.setattr(mangayy, "_get_content", lambda *a, **k: html)
+        assert mangayy.get_pages("https://mangayy.org/manga/x/chapter-1/") == [
+            "https://cdn.mangayy.org/manga/x/1.jpg",
+            "https://cdn.mangayy.org/manga/x/2.jpg",
+        ]
+
+    def test_wp_uploads_images_not_mistaken_for_ads(self, mangayy, monkeypatch):
+        html = """
+            <div class="reading-content">
+              <img src="https://mangayy.org/wp-content/uploads/WP-manga/data/x/01.jpg">
+              <img src="https://mangayy.org/ads/side.jpg">
+            </div>
+        """
+        monkeypatch.setattr(mangayy, "_get_content", lambda *a, **k: html)
+        assert mangayy.get_pages("https://mangayy.org/manga/x/chapter-1/") == [
+            "https://mangayy.org/wp-content/uploads/WP-manga/data/x/01.jpg",
+        ]
+
+    def test_falls_back_to_any_page_like_image(self, mangayy, monkeypatch):
+        html = '<img src="https://x.example/chapter/1.jpg"><img src="https://x.example/a.jpg">'
+        monkeypatch.setattr(mangayy, "_get_content", lambda *a, **k: html)
+        assert mangayy.get_pages("https://mangayy.org/manga/x/chapter-1/") == [
+            "https://x.example/chapter/1.jpg",
+        ]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# OmegaScans — each fetch waits on the links/images it parses instead
+# of a fixed sleep.
+# ──────────────────────────────────────────────────────────────────────
+
+
+class TestOmegaScansWaitSelectors:
+    def _browser(self, monkeypatch, scraper, html):
+        calls = []
+        def fake(url, wait_time=2000, cookies=None, wait_selector=None):
+            calls.append(wait_selector)
+            return html
+        monkeypatch.setattr(scraper, "_get_page_content", fake)
+        return calls
+
+    def test_chapters_wait_for_this_series_links(self, monkeypatch):
+        scraper = get_scraper("omegascans.org")
+        calls = self._browser(monkeypatch, scraper, """
+            <a href="/series/solo/chapter-2">Chapter 2</a>
+            <a href="/series/solo/chapter-1">Chapter 1</a>
+            <a href="/series/other/chapter-9">Chapter 9</a>
+        """)
+        chapters = scraper.get_chapters("https://omegascans.org/series/solo")
+        assert [c.number for c in chapters] == ["2", "1"]
+        assert calls == ['a[href*="/series/solo/chapter"]']
+
+    def test_pages_read_srcs_from_the_dom(self, monkeypatch):
+        scraper = get_scraper("omegascans.org")
+        scraped = []
+        def fake_scrape(url, selector, script, wait_time=2000, wait_selector=None):
+            scraped.append((selector, wait_selector))
+            return ["https://media.omegascans.org/file/uploads/1.jpg",
+                    "https://omegascans.org/logo.png", ""]
+        monkeypatch.setattr(scraper, "_scrape_selector", fake_scrape)
+        monkeypatch.setattr(scraper, "_get_page_content",
+                            lambda *a, **k: pytest.fail("HTML fetched"))
+        assert scraper.get_pages("https://omegascans.org/series/solo/chapter-1") == [
+            "https://media.omegascans.org/file/uploads/1.jpg",
+        ]
+        assert scraped == [("img", 'img[src*="media.omegascans.org"]')]
+
+    def test_pages_fall_back_to_html(self, monkeypatch):
+        scraper = get_scraper("omegascans.org")
+        def broken(*a, **k):
+            raise RuntimeError("evaluate failed")
+        monkeypatch.setattr(scraper, "_scrape_selector", broken)
+        calls = self._browser(monkeypatch, scraper, """
+            <img data-src="https://media.omegascans.org/file/uploads/1.jpg">
+            <img src="https://omegascans.org/logo.png">
+        """)
+        assert scraper.get_pages("https://omegascans.org/series/solo/chapter-1") == [
+            "https://media.omegascans.org/file/uploads/1.jpg",
+        ]
+        assert calls == ['img[src*="media.omegascans.org"]']
+
+
+class TestOmegaScansChapters:
+    def test_sorted_newest_first_with_unparseable_last(self, monkeypatch):
+        scraper = get_scraper("omegascans.org")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: """
+            <a href="/series/solo/chapter-9.5">9.5</a>
+            <a href="/series/solo/chapter-1.2.3">odd</a>
+            <a href="/series/solo/chapter-10">10</a>
+        """)
+        chapters = scraper.get_chapters("https://omegascans.org/series/solo")
+        assert [c.number for c in chapters] == ["10", "9.5", "1.2.3"]
+
+
+class TestOmegaScansSearch:
+    def test_matches_slug_or_title_once_per_series(self, monkeypatch):
+        scraper = get_scraper("omegascans.org")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: """
+            <a href="/series/solo-leveling"><img></a>
+            <a href="/series/solo-leveling">Solo Leveling</a>
+            <a href="/series/abc">The Solo Knight</a>
+            <a href="/series/abc/chapter-1">Solo chapter</a>
+            <a href="/series/other">Other</a>
+        """)
+        assert [(m.title, m.url) for m in scraper.search("SOLO")] == [
+            ("Solo Leveling", "https://omegascans.org/series/solo-leveling"),
+            ("The Solo Knight", "https://omegascans.org/series/abc"),
+        ]
+
+
+class TestPururinSearch:
+    def test_capped_at_20(self, monkeypatch):
+        scraper = get_scraper("pururin.to")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: "".join(
+            f'<div class="card"><a href="/gallery/{i}/x"><h3>Gallery {i}</h3></a></div>'
+            for i in range(30)
+        ))
+        results = scraper.search("gallery")
+        assert [m.title for m in results] == [f"Gallery {i}" for i in range(20)]
+
+
+class TestManga4LifePages:
+    def test_builds_urls_from_embedded_chapter_json(self, monkeypatch):
+        scraper = get_scraper("manga4life.com")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: """
+            <script>function MainFunction($http) {
+              vm.CurPathName = "cdn.example";
+              vm.CurChapter = {"Chapter":"100125","Page":"2","Directory":""};
+            }</script>
+        """)
+        assert scraper.get_pages("https://manga4life.com/read-online/x-chapter-12.5.html") == [
+            "https://cdn.example/manga/12.5/001.png",
+            "https://cdn.example/manga/12.5/002.png",
+        ]
+
+
+class TestToonily:
+    def test_pages_skip_ui_images_in_any_case(self, monkeypatch):
+        scraper = get_scraper("toonily.me")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: """
+            <div class="reading-content">
+              <img src="https://cdn.example/Site-LOGO.png">
+              <img src="//cdn.example/x/1.jpg">
+              <img data-src="https://cdn.example/x/Loading.gif">
+              <img data-src="https://cdn.example/x/2.jpg">
+            </div>
+        """)
+        assert scraper.get_pages("https://toonily.me/x/chapter-1") == [
+            "https://cdn.example/x/1.jpg", "https://cdn.example/x/2.jpg",
+        ]
+
+    def test_search_fallback_skips_non_manga_slugs(self, monkeypatch):
+        scraper = get_scraper("toonily.me")
+        monkeypatch.setattr(scraper, "_get_page_content", lambda *a, **k: """
+            <a href="/genre-list/">Genres</a>
+            <a href="/search/">Search</a>
+            <a href="/solo-leveling/">Solo Leveling</a>
+        """)
+        assert [m.url for m in scraper.search("solo")] == [
+            "https://toonily.me/solo-leveling",
+        ]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Resource blocking — the route handler is plain Python, so it can be
+# exercised with stand-in route objects.
+# ──────────────────────────────────────────────────────────────────────
+
+
+class _Route:
+    def __init__(self, resource_type):
+        self.request = type("Req", (), {"resource_type": resource_type})()
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def continue_(self):
+        self.outcome = "continue"
+
+
+@pytest.mark.parametrize("resource_type,outcome", [
+    ("image", "abort"),
+    ("stylesheet", "abort"),
+    ("document", "continue"),
+    ("script", "continue"),
+])
+def test_manytoon_blocks_page_assets(resource_type, outcome):
+    route = _Route(resource_type)
+    get_scraper("manytoon.com")._abort_blocked(route)
+    assert route.outcome == outcome
+
+
+@pytest.mark.parametrize("resource_type,outcome", [
+    ("image", "abort"),
+    ("font", "abort"),
+    ("media", "abort"),
+    ("stylesheet", "continue"),
+    ("document", "continue"),
+])
+def test_default_blocks_images_fonts_and_media(resource_type, outcome):
+    route = _Route(resource_type)
+    get_scraper("omegascans.org")._abort_blocked(route)
+    assert route.outcome == outcome
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Smoke tests: every Playwright-based scraper imports + instantiates +
 # exposes the required methods. This catches typos and missing-import
@@ -109,17 +109,28 @@ class TestIsMangaImage:
 class TestDownloadImage:
     def test_writes_file_on_success(self, monkeypatch, tmp_path, fake_response):
         s = _make_scraper()
-        monkeypatch.setattr(s.session, "get",
+        monkeypatch.setattr(s.image_session, "get",
                              lambda *a, **k: fake_response(content=b"x" * 4096))
         ok = s.download_image("https://x", tmp_path / "p.jpg")
         assert ok is True
         assert (tmp_path / "p.jpg").exists()
 
+    def test_body_is_streamed_to_disk(self, monkeypatch, tmp_path, fake_response):
+        s = _make_scraper()
+        sent = []
+        def fake_get(url, **kw):
+            sent.append(kw)
+            return fake_response(content=b"page" * 1024)
+        monkeypatch.setattr(s.image_session, "get", fake_get)
+        assert s.download_image("https://x", tmp_path / "ch" / "p.jpg") is True
+        assert sent[0]["stream"] is True
+        assert (tmp_path / "ch" / "p.jpg").read_bytes() == b"page" * 1024
+
     def test_failure_returns_false(self, monkeypatch, tmp_path):
         s = _make_scraper()
         def boom(*a, **k):
             raise IOError()
-        monkeypatch.setattr(s.session, "get", boom)
+        monkeypatch.setattr(s.image_session, "get", boom)
         assert s.download_image("https://x", tmp_path / "p.jpg") is False
 
 
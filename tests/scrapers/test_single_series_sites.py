@@ -0,0 +1,130 @@
+"""Inline-HTML tests for the chapter lists of single-series and comic sites."""
+
+from __future__ import annotations
+
+import pytest
+
+from memanga.scrapers.readbluelockorg import ReadBlueLockOrgScraper
+from memanga.scrapers.readcomiconline import ReadComicOnlineScraper
+from memanga.scrapers.readichithewitch import ReadIchiTheWitchScraper
+from memanga.scrapers.sakamotomanga import SakamotoMangaScraper
+
+
+class TestReadBlueLockOrgChapters:
+    def test_matches_chapter_links_in_any_case(self, patch_html):
+        s = ReadBlueLockOrgScraper()
+        patch_html(s, """
+            <a href="/manga/blue-lock-Chapter-2/">Two</a>
+            <a href="https://readbluelock.org/manga/blue-lock-chapter-1/">One</a>
+            <a href="/manga/blue-lock-chapter-2/">Two again</a>
+            <a href="/about/">About</a>
+        """)
+        assert [(c.number, c.url) for c in s.get_chapters(s.base_url)] == [
+            ("1", "https://readbluelock.org/manga/blue-lock-chapter-1/"),
+            ("2", "https://readbluelock.org/manga/blue-lock-Chapter-2/"),
+        ]
+
+
+@pytest.mark.parametrize("cls", [ReadBlueLockOrgScraper, ReadIchiTheWitchScraper])
+def test_chapter_list_is_fetched_once_per_run(cls, monkeypatch, fake_response):
+    s = cls()
+    s._rate_limit = 0
+    sent = []
+    def fake_get(url, **kw):
+        sent.append(url)
+        return fake_response(text='<a href="/manga/ichi-the-witch-chapter-1/">1</a>')
+    monkeypatch.setattr(s.session, "get", fake_get)
+    first = s.get_chapters(s.base_url)
+    assert [c.number for c in first] == ["1"]
+    assert cls().get_chapters(s.base_url) == first
+    assert len(sent) == 1
+
+
+class TestSakamotoMangaChapters:
+    def test_lists_every_chapter_up_to_the_newest(self, patch_html):
+        s = SakamotoMangaScraper()
+        patch_html(s, """
+            <a href="/sakamoto-days/manga/chapters/2">2</a>
+            <a href="/sakamoto-days/manga/chapters/3">3</a>
+        """)
+        chapters = s.get_chapters(s.base_url)
+        assert [c.number for c in chapters] == ["1", "2", "3"]
+
+    def test_empty_homepage_still_lists_chapter_one(self, patch_html):
+        s = SakamotoMangaScraper()
+        patch_html(s, "")
+        assert [c.number for c in s.get_chapters(s.base_url)] == ["1"]
+
+
+class TestReadComicOnlineChapters:
+    def test_reads_issue_numbers_from_text_then_url(self, patch_html):
+        s = ReadComicOnlineScraper()
+        patch_html(s, """
+            <a href="/Comic/Saga/Issue-2?id=20"><span>Issue</span> #2</a>
+            <a href="/Comic/Saga/Special?id=30">Special</a>
+            <a href="/Comic/Saga/Issue-1?id=10">Saga Issue 1</a>
+            <a href="/Comic/Other/Issue-1?id=99">Other Issue 1</a>
+            <a href="/Comic/Saga/">Saga</a>
+        """)
+        chapters = s.get_chapters("https://readcomiconline.li/Comic/Saga")
+        assert sorted((c.number, c.url) for c in chapters) == [
+            ("1", "https://readcomiconline.li/Comic/Saga/Issue-1?id=10"),
+            ("2", "https://readcomiconline.li/Comic/Saga/Issue-2?id=20"),
+            ("30", "https://readcomiconline.li/Comic/Saga/Special?id=30"),
+        ]
+
+
+class TestReadComicOnlinePages:
+    def test_lst_images_array_skips_parsing(self, patch_html, monkeypatch):
+        monkeypatch.setattr("bs4.BeautifulSoup",
+                            lambda *a, **k: pytest.fail("document was parsed"))
+        s = ReadComicOnlineScraper()
+        patch_html(s, """
+            <img data-src="https://cdn/cover.jpg">
+            <script>
+              lstImages.push("https://cdn/1.jpg");
+              lstImages.push('https://cdn/2.jpg');
+              lstImages.push("https://cdn/1.jpg");
+            </script>
+        """)
+        assert s.get_pages("https://readcomiconline.li/Comic/Saga/Issue-1") == [
+            "https://cdn/1.jpg", "https://cdn/2.jpg",
+        ]
+
+    def test_falls_back_to_reader_images(self, patch_html):
+        s = ReadComicOnlineScraper()
+        patch_html(s, """
+            <img src="/Content/logo.png" data-src="/Content/logo.png">
+            <img id="imgCurrent" src="/pages/1.jpg">
+        """)
+        assert s.get_pages("https://readcomiconline.li/Comic/Saga/Issue-1") == [
+            "https://readcomiconline.li/pages/1.jpg",
+        ]
+
+    def test_relative_and_absolute_copies_of_a_page_are_deduped(self, patch_html):
+        s = ReadComicOnlineScraper()
+        patch_html(s, """
+            <img class="js-page" data-src="/pages/1.jpg">
+            <img id="imgCurrent" src="https://readcomiconline.li/pages/1.jpg">
+            <script>var images = ["https://readcomiconline.li/pages/1.jpg"];</script>
+        """)
+        assert s.get_pages("https://readcomiconline.li/Comic/Saga/Issue-1") == [
+            "https://readcomiconline.li/pages/1.jpg",
+        ]
+
+
+class TestSakamotoMangaPages:
+    def test_keeps_cdn_pages_and_drops_placeholders(self, patch_html):
+        s = SakamotoMangaScraper()
+        patch_html(s, """
+            <img src="https://cdn.mangaclash.com/sd/1.jpg">
+            <img data-src=" https://cdn.readkakegurui.com/sd/2.jpg ">
+            <img src="https://cdn.readkakegurui.com/pomodoro.gif">
+            <img src="https://cdn.mangaclash.com/logo.png">
+            <img src="https://example.com/3.jpg">
+            <img src="https://cdn.mangaclash.com/sd/1.jpg">
+        """)
+        assert s.get_pages(f"{s.base_url}/sakamoto-days/manga/chapters/1") == [
+            "https://cdn.mangaclash.com/sd/1.jpg",
+            "https://cdn.readkakegurui.com/sd/2.jpg",
+        ]
@@ -117,6 +117,19 @@ class TestGetPages:
         # Protocol-relative '//img.spoilerhat.com/...' got https: prefix
         assert all(p.startswith("https://") for p in pages)
 
+    def test_cdn_filter_checks_every_image_attribute(self, patch_html):
+        s = _make_scraper()
+        patch_html(s, """<div class="reading-content">
+            <img src="/lazy.gif" data-lazy-src="https://IMG.SpoilerHat.com/1.jpg">
+            <img src="https://img.spoilerhat.com/2.jpg">
+            <img src="https://img.spoilerhat.com/3.jpg" data-src="https://other.cdn/3.jpg">
+            <img src="https://other.cdn/4.jpg">
+        </div>""")
+        assert s.get_pages("https://hiperdex.com/manga/x/chapter-1/") == [
+            "https://IMG.SpoilerHat.com/1.jpg",
+            "https://img.spoilerhat.com/2.jpg",
+        ]
+
     def test_no_filter_falls_back_to_image_extension(self, patch_html, load_fixture):
         s = _make_scraper(image_cdn_filters=[])
         patch_html(s, load_fixture("wp_madara", "chapter_reader_no_filter.html"))
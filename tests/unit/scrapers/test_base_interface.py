@@ -571,3 +571,218 @@ class TestPlaywrightScraperPerSubclassExecutor:
         assert not hasattr(pb._thread_local, "context")
         # And `pw.stop()` must have been called to release native resources.
         assert _BoomPW.stopped, "partial init didn't call pw.stop()"
+
+    def test_stealth_is_applied_once_to_the_context(self, monkeypatch):
+        import playwright_stealth
+        from memanga.scrapers import playwright_base as pb
+        from memanga.scrapers.weebcentral import WeebCentralScraper
+
+        pb.cleanup_browsers()
+        context = object()
+        browser = type("_B", (), {"new_context": lambda self, **k: context,
+                                  "close": lambda self: None})()
+        pw = type("_PW", (), {
+            "firefox": type("_F", (), {"launch": lambda self, **k: browser})(),
+            "stop": lambda self: None,
+        })()
+        import playwright.sync_api as pwapi
+        monkeypatch.setattr(pwapi, "sync_playwright", lambda: type("_S", (), {
+            "start": staticmethod(lambda: pw),
+        })())
+        stealthed = []
+        monkeypatch.setattr(playwright_stealth, "Stealth", lambda: type("_S", (), {
+            "apply_stealth_sync": staticmethod(stealthed.append),
+        })())
+
+        scraper = WeebCentralScraper()
+        try:
+            assert scraper._get_browser_in_thread() == (browser, context)
+            scraper._get_browser_in_thread()
+            assert stealthed == [context]
+        finally:
+            pb.cleanup_browsers()
+
+
+class TestPlaywrightWaitSelector:
+    """`_fetch_page_content(wait_selector=...)` must wait on the selector
+    (capped at wait_time) instead of sleeping the full wait_time, and
+    still return the page when the selector never shows up.
+    """
+
+    def _fetch(self, monkeypatch, page, **kwargs):
+        from memanga.scrapers.manytoon import ManyToonScraper
+
+        class _FakeContext:
+            def new_page(self): return page
+
+        monkeypatch.setattr(
+            ManyToonScraper, "_get_browser_in_thread",
+            lambda self: (None, _FakeContext()),
+        )
+        return ManyToonScraper()._fetch_page_content("https://x/", **kwargs)
+
+    def _page(self, selector_error=None):
+        calls = []
+
+        class _FakePage:
+            def route(self, *a): pass
+            def goto(self, url, **kw): pass
+            def wait_for_selector(self, sel, state, timeout):
+                calls.append(("selector", sel, state, timeout))
+                if selector_error:
+                    raise selector_error
+            def wait_for_timeout(self, ms): calls.append(("sleep", ms))
+            def content(self): return "<html></html>"
+            def close(self): pass
+
+        return _FakePage(), calls
+
+    def test_waits_on_selector_instead_of_sleeping(self, monkeypatch):
+        page, calls = self._page()
+        html = self._fetch(monkeypatch, page, wait_time=6000, wait_selector=".wp-manga-chapter a")
+        assert html == "<html></html>"
+        assert calls == [("selector", ".wp-manga-chapter a", "attached", 6000)]
+
+    def test_selector_timeout_still_returns_content(self, monkeypatch):
+        page, calls = self._page(selector_error=TimeoutError("not found"))
+        html = self._fetch(monkeypatch, page, wait_time=100, wait_selector=".missing")
+        assert html == "<html></html>"
+        assert len(calls) == 1
+
+    def test_no_selector_keeps_fixed_wait(self, monkeypatch):
+        page, calls = self._page()
+        self._fetch(monkeypatch, page, wait_time=2000)
+        assert calls == [("sleep", 2000)]
+
+    def test_scrape_selector_evaluates_in_the_page(self, monkeypatch):
+        from memanga.scrapers.manytoon import ManyToonScraper
+
+        page, calls = self._page()
+        page.eval_on_selector_all = lambda sel, script: calls.append(("eval", sel)) or ["a.jpg"]
+        page.content = lambda: pytest.fail("page serialized")
+        context = type("_C", (), {"new_page": lambda self: page})()
+        monkeypatch.setattr(ManyToonScraper, "_get_browser_in_thread",
+                            lambda self: (None, context))
+        result = ManyToonScraper()._scrape_selector(
+            "https://x/", "img", "els => els.map(e => e.src)",
+            wait_time=500, wait_selector="img")
+        assert result == ["a.jpg"]
+        assert calls == [("selector", "img", "attached", 500), ("eval", "img")]
+
+
+class TestPlaywrightPageReuse:
+    """Fetches on one thread share a single page instead of opening and
+    closing a renderer per call; a failed fetch throws the page away so
+    the retry starts from a fresh one.
+    """
+
+    def _scraper(self, monkeypatch, fail_first=False):
+        from memanga.scrapers import playwright_base
+        from memanga.scrapers.manytoon import ManyToonScraper
+
+        monkeypatch.setattr(playwright_base.time, "sleep", lambda s: None)
+
+        pages = []
+        failures = [fail_first]
+
+        class _FakePage:
+            closed = False
+            def route(self, *a): pass
+            def goto(self, url, **kw):
+                if failures[0]:
+                    failures[0] = False
+                    raise RuntimeError("renderer crashed")
+            def wait_for_timeout(self, ms): pass
+            def content(self): return "<html></html>"
+            def close(self): self.closed = True
+
+        class _FakeContext:
+            def new_page(self):
+                pages.append(_FakePage())
+                return pages[-1]
+
+        context = _FakeContext()
+        monkeypatch.setattr(
+            ManyToonScraper, "_get_browser_in_thread",
+            lambda self: (None, context),
+        )
+        playwright_base._drop_page()
+        return ManyToonScraper(), pages
+
+    def test_page_is_reused_across_fetches(self, monkeypatch):
+        scraper, pages = self._scraper(monkeypatch)
+        scraper._fetch_page_content("https://x/1", wait_time=0)
+        scraper._fetch_page_content("https://x/2", wait_time=0)
+        assert len(pages) == 1
+        assert not pages[0].closed
+
+    def test_failed_fetch_retries_on_a_new_page(self, monkeypatch):
+        scraper, pages = self._scraper(monkeypatch, fail_first=True)
+        assert scraper._fetch_page_content("https://x/", wait_time=0) == "<html></html>"
+        assert len(pages) == 2
+        assert pages[0].closed and not pages[1].closed
+
+
+class TestPlaywrightWorkerThreads:
+    """Each subclass runs up to `browser_workers` browser threads, so
+    concurrent calls to one site overlap, and cleanup reaches every one
+    of those threads.
+    """
+
+    def _subclass(self, workers):
+        from memanga.scrapers.playwright_base import PlaywrightScraper
+
+        return type("_Scraper", (PlaywrightScraper,), {
+            "name": "x", "browser_workers": workers,
+            "search": lambda self, q: [],
+            "get_chapters": lambda self, u: [],
+            "get_pages": lambda self, u: [],
+        })
+
+    def test_calls_to_one_site_run_in_parallel(self):
+        import threading
+
+        cls = self._subclass(2)
+        barrier = threading.Barrier(2)
+        # Deadlocks (barrier timeout) if the two calls were serialised
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                cls._run_serialized(barrier.wait, 5, timeout=10)))
+            for _ in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(results) == [0, 1]
+
+    def test_cleanup_runs_on_every_browser_thread(self, monkeypatch):
+        import threading
+        from memanga.scrapers import playwright_base as pb
+
+        cls = self._subclass(3)
+        barrier = threading.Barrier(3)
+
+        def launch():
+            # What _get_browser_in_thread records once Firefox is up
+            cls._browser_threads.add(threading.get_ident())
+            barrier.wait(5)
+        for f in [cls._executor.submit(launch) for _ in range(3)]:
+            f.result()
+        launched = set(cls._browser_threads)
+
+        cleaned = set()
+        monkeypatch.setattr(pb, "cleanup_browsers",
+                            lambda: cleaned.add(threading.get_ident()))
+        cls._cleanup_worker_threads(timeout=5)
+        assert launched <= cleaned
+        assert not cls._browser_threads
+
+    def test_cleanup_skips_classes_that_never_launched(self, monkeypatch):
+        from memanga.scrapers import playwright_base as pb
+
+        cls = self._subclass(3)
+        monkeypatch.setattr(pb, "cleanup_browsers",
+                            lambda: pytest.fail("nothing to clean up"))
+        cls._cleanup_worker_threads(timeout=5)
@@ -109,6 +109,31 @@ class TestCheckForUpdates:
         new = check_for_updates(manga, state, from_chapter=3)
         assert all(float(c.number) >= 3 for c in new)
 
+    def test_sources_are_fetched_concurrently(self, state, monkeypatch):
+        """Primary and backup chapter lists are fetched at the same time."""
+        import threading
+        import memanga.downloader as dl
+        from memanga.scrapers.base import Chapter
+        both_started = threading.Barrier(2, timeout=5)
+
+        class _Scraper:
+            def __init__(self, source):
+                self.source = source
+
+            def get_chapters(self, url):
+                both_started.wait()
+                if self.source == "broken.test":
+                    raise RuntimeError("down")
+                return [Chapter(number="1", title="", url=f"{url}/1")]
+
+        monkeypatch.setattr(dl, "get_scraper", _Scraper)
+        manga = {"title": "Multi", "sources": [
+            {"source": "primary.test", "url": "https://primary.test/m"},
+            {"source": "broken.test", "url": "https://broken.test/m"},
+        ]}
+        new = dl.check_for_updates(manga, state)
+        assert [(c.number, c.source) for c in new] == [("1", "primary.test")]
+
 
 # ─────────────────────────────────────────────────────────────────────────
 # download_chapter — issue #23: every format under <dir>/<title>/
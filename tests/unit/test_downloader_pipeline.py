@@ -597,6 +597,180 @@ class TestPartialChapterTolerance:
                 max_retries=0, allow_partial=True, partial_threshold=100)
 
 
+class _FlakyScraper(_PartialScraper):
+    """Fails every page of the chosen set on its first attempt only."""
+
+    def __init__(self, num_pages, fail_indexes):
+        super().__init__(num_pages, fail_indexes)
+        self.attempts: dict[int, int] = {}
+
+    def download_image(self, url, path):
+        idx = int(Path(url).stem[1:])
+        self.attempts[idx] = self.attempts.get(idx, 0) + 1
+        if idx in self._fail and self.attempts[idx] == 1:
+            return False
+        Image.new("RGB", (200, 300), (10, 20, 30)).save(path, "JPEG")
+        return True
+
+
+class TestRetryPass:
+    def test_failed_pages_recovered_on_retry(
+            self, tmp_path, fake_state, monkeypatch):
+        """Pages that fail the first pass are all re-fetched (in
+        parallel) and the chapter completes."""
+        import memanga.downloader as dl
+        scraper = _FlakyScraper(12, fail_indexes={1, 4, 7, 10})
+        monkeypatch.setattr(dl, "get_scraper", lambda d: scraper)
+        monkeypatch.setattr(dl.time, "sleep", lambda s: None)
+        manga = {"title": "Vinland Saga", "url": "https://cdn.test/x",
+                 "source": "cdn.test"}
+        out = dl.download_chapter(manga, _partial_chapter(), tmp_path,
+                                  "pdf", fake_state, max_retries=1)
+        assert out is not None and out.exists()
+        assert {i: scraper.attempts[i] for i in (1, 4, 7, 10)} == {
+            1: 2, 4: 2, 7: 2, 10: 2}
+
+    def test_cancel_before_retry_pass_aborts(
+            self, tmp_path, fake_state, monkeypatch):
+        import threading
+        import memanga.downloader as dl
+        scraper = _FlakyScraper(6, fail_indexes={2})
+        cancel = threading.Event()
+        monkeypatch.setattr(dl, "get_scraper", lambda d: scraper)
+        monkeypatch.setattr(dl.time, "sleep", lambda s: cancel.set())
+        manga = {"title": "X", "url": "https://cdn.test/x", "source": "cdn.test"}
+        with pytest.raises(InterruptedError):
+            dl.download_chapter(manga, _partial_chapter(), tmp_path, "pdf",
+                                fake_state, max_retries=1, cancel_event=cancel)
+        assert scraper.attempts[2] == 1
+
+
+    def test_scraper_page_workers_sizes_the_pool(
+            self, tmp_path, fake_state, monkeypatch):
+        """A scraper's page_workers overrides the default pool width."""
+        import memanga.downloader as dl
+        scraper = _FlakyScraper(4, fail_indexes={0})
+        scraper.page_workers = 9
+        widths = []
+        real_pool = dl.ThreadPoolExecutor
+
+        def recording_pool(max_workers):
+            widths.append(max_workers)
+            return real_pool(max_workers=max_workers)
+        monkeypatch.setattr(dl, "ThreadPoolExecutor", recording_pool)
+        monkeypatch.setattr(dl, "get_scraper", lambda d: scraper)
+        monkeypatch.setattr(dl.time, "sleep", lambda s: None)
+        manga = {"title": "X", "url": "https://cdn.test/x", "source": "cdn.test"}
+        dl.download_chapter(manga, _partial_chapter(), tmp_path, "pdf",
+                            fake_state, max_retries=1)
+        assert widths[:2] == [9, 9]
+
+    def test_chapters_share_one_cap_per_image_host(self, monkeypatch):
+        """Fetches from several chapters at once never exceed the host's cap."""
+        import threading
+        import memanga.downloader as dl
+        monkeypatch.setattr(dl, "_host_slots", {})
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        class _SlowScraper:
+            def download_image(self, url, path):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                threading.Event().wait(0.02)
+                with lock:
+                    active[0] -= 1
+                return True
+
+        # Two chapters' worth of fetches against one CDN
+        threads = [
+            threading.Thread(target=dl._fetch_page,
+                             args=(_SlowScraper(), f"https://cdn.test/p{i}.jpg", None, 3))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak[0] <= 3
+        assert dl._host_slot("https://other.test/p.jpg", 3) is not dl._host_slot(
+            "https://cdn.test/p.jpg", 3)
+
+    def test_host_cap_is_the_widest_page_workers_on_that_host(self, monkeypatch):
+        """A narrow scraper reaching a CDN first doesn't cap a wider one,
+        and scrapers of different widths share one cap per host."""
+        import threading
+        import memanga.downloader as dl
+        monkeypatch.setattr(dl, "_host_slots", {})
+        url = "https://mangaclash.com/p.jpg"
+
+        def peak_for(limits, gate_size):
+            active, peak = [0], [0]
+            lock = threading.Lock()
+            # Every fetch waits here until `gate_size` are in flight, so
+            # the peak reaches the cap unless it is narrower than that
+            gate = threading.Barrier(gate_size, timeout=0.5)
+
+            class _Scraper:
+                def download_image(self, url, path):
+                    with lock:
+                        active[0] += 1
+                        peak[0] = max(peak[0], active[0])
+                    try:
+                        gate.wait()
+                    except threading.BrokenBarrierError:
+                        pass
+                    with lock:
+                        active[0] -= 1
+                    return True
+
+            threads = [threading.Thread(target=dl._fetch_page,
+                                        args=(_Scraper(), url, None, limit))
+                       for limit in limits]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            return peak[0]
+
+        assert peak_for([4] * 8, 4) == 4  # e.g. Sakamoto, default width
+        assert peak_for([8] * 16, 8) == 8  # e.g. SpyXFamily, page_workers = 8
+        # Both at once still stop at the widest cap, not 4 + 8
+        assert peak_for([4] * 8 + [8] * 16, 12) == 8
+        assert dl._host_slot(url, 4) is dl._host_slot(url, 8)
+
+    def test_iter_pages_downloads_start_before_discovery_ends(
+            self, tmp_path, fake_state, monkeypatch):
+        """Pages yielded by iter_pages are fetched while later ones are
+        still being discovered."""
+        import threading
+        import memanga.downloader as dl
+        scraper = _PartialScraper(3, fail_indexes=set())
+        first_page_done = threading.Event()
+        real_download = scraper.download_image
+
+        def download_image(url, path):
+            ok = real_download(url, path)
+            if url.endswith("p0.jpg"):
+                first_page_done.set()
+            return ok
+
+        def iter_pages(url):
+            yield "https://cdn.test/p0.jpg"
+            assert first_page_done.wait(timeout=5), "page 0 waited for discovery"
+            yield "https://cdn.test/p1.jpg"
+            yield "https://cdn.test/p2.jpg"
+
+        scraper.download_image = download_image
+        scraper.iter_pages = iter_pages
+        monkeypatch.setattr(dl, "get_scraper", lambda d: scraper)
+        manga = {"title": "X", "url": "https://cdn.test/x", "source": "cdn.test"}
+        out = dl.download_chapter(manga, _partial_chapter(), tmp_path, "pdf",
+                                  fake_state, max_retries=0)
+        assert out.exists()
+
+
 # ─────────────────────────────────────────────────────────────────────────
 # Restart browsers — Playwright pool reset, used by GUI memory-pressure
 # ─────────────────────────────────────────────────────────────────────────